@@ -0,0 +1,70 @@
+"""
+Benchmark: Alpaca UDP discovery of many local simulator instances.
+
+Starts --instances discovery responders, each in its own process as every simulator
+started by ``alpaca-simulators`` runs one, all on the same discovery port. Then times
+broadcasting a discovery request until every instance has answered.
+
+Usage:
+    python benchmarks/discovery.py --instances 200 --rounds 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+from alpaca_simulators.discovery import discover
+
+RESPONDER = """
+import asyncio, sys
+from alpaca_simulators.discovery import serve_discovery
+
+async def main():
+    responder = asyncio.create_task(serve_discovery(int(sys.argv[1]), int(sys.argv[2])))
+    await asyncio.sleep(0.1)
+    print("ready", flush=True)
+    await responder
+
+asyncio.run(main())
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--instances", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--port", type=int, default=32227, help="Discovery port.")
+    parser.add_argument("--address", default="255.255.255.255", help="Broadcast address.")
+    args = parser.parse_args()
+
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-c", RESPONDER, str(11111 + i), str(args.port)],
+            stdout=subprocess.PIPE,
+        )
+        for i in range(args.instances)
+    ]
+    try:
+        for process in processes:
+            process.stdout.readline()
+        times = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            found = asyncio.run(discover(5.0, args.port, args.address, expected=args.instances))
+            times.append(time.perf_counter() - start)
+            if len(found) < args.instances:
+                raise RuntimeError(f"Only {len(found)} of {args.instances} instances answered")
+    finally:
+        for process in processes:
+            process.terminate()
+    print(
+        f"discovered {args.instances} instances: "
+        f"median {statistics.median(times) * 1e3:.1f} ms, max {max(times) * 1e3:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
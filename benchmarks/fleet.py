@@ -0,0 +1,89 @@
+"""
+Benchmark: serving a fleet of simulated observatories.
+
+The configured devices are expanded into --sites observatories (see fleet.py) and every
+device is then polled in batches, so the number of devices with live state grows batch by
+batch. Per-request latency should stay flat as devices are touched, and RSS should grow
+by a small, bounded amount per device. Telescope motion runs in the background for every
+telescope that has been used, as it does in the server.
+
+Usage:
+    python benchmarks/fleet.py --sites 250 --batch 500
+"""
+
+import argparse
+import resource
+import statistics
+import time
+
+from fastapi.testclient import TestClient
+
+from alpaca_simulators import state
+from alpaca_simulators.api import telescope
+from alpaca_simulators.fleet import expand_fleet
+from alpaca_simulators.main import app
+
+# A cheap property every device type implements, plus one device-specific read.
+PROPERTIES = {"telescope": "rightascension", "camera": "camerastate", "focuser": "position"}
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def configure_fleet(sites: int) -> list[tuple[str, int]]:
+    """Expand the loaded config into a fleet and return every (device_type, number)."""
+    config = dict(state.DEVICE_CONFIG, fleet={"sites": sites})
+    state.DEVICE_CONFIG = expand_fleet(config)
+    state.reset_state()
+    return [
+        (device_type, number)
+        for device_type, numbers in state.get_all_configured_devices().items()
+        for number in numbers
+    ]
+
+
+def poll(client: TestClient, devices: list[tuple[str, int]]) -> list[float]:
+    latencies = []
+    for device_type, number in devices:
+        member = PROPERTIES.get(device_type, "connected")
+        start = time.perf_counter()
+        response = client.get(f"/api/v1/{device_type}/{number}/{member}")
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.text
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sites", type=int, default=250, help="Observatories to simulate.")
+    parser.add_argument("--batch", type=int, default=500, help="New devices per batch.")
+    args = parser.parse_args()
+
+    baseline_rss = rss_mb()
+    devices = configure_fleet(args.sites)
+    telescope.start_background_updater(state.get_all_configured_devices()["telescope"])
+    client = TestClient(app)
+    config_rss = rss_mb() - baseline_rss
+    print(f"{len(devices)} devices in {args.sites} sites, config RSS +{config_rss:.1f} MB")
+
+    print(f"{'touched':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} {'RSS (MB)':>9}")
+    for end in range(args.batch, len(devices) + args.batch, args.batch):
+        touched = devices[: min(end, len(devices))]
+        # Touch the new devices, then time a poll across everything touched so far.
+        poll(client, touched[-args.batch :])
+        latencies = sorted(poll(client, touched))
+        p50 = statistics.median(latencies) * 1e3
+        p99 = latencies[int(0.99 * (len(latencies) - 1))] * 1e3
+        print(f"{len(touched):>8} {p50:>9.3f} {p99:>9.3f} {rss_mb():>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
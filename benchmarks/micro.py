@@ -0,0 +1,228 @@
+"""
+Microbenchmarks of the hot paths, checked against stored baselines.
+
+Each benchmark times one function in isolation: device state reads and updates (alone and
+with threads contending for the state lock), the alt/az and RA/Dec transforms (scalar and
+batched), coordinate rates, the telescope motion step, the image cache key, the imagebytes
+encoding at several frame sizes and endpoint discovery. The time per call is the best of
+--repeat runs, each long enough to last about 0.1 s; a benchmark over the threshold is
+measured once more.
+
+Times are compared with benchmarks/baselines.json and the script exits with status 1 if
+any is more than --threshold (default 25%) slower. Baselines depend on the machine, so the
+file records the machine they were measured on and the comparison only fails on that
+machine; elsewhere it is printed for information. Record baselines with --update before
+the change under test.
+
+Usage:
+    python benchmarks/micro.py                  # compare with the baselines
+    python benchmarks/micro.py --update         # record new baselines
+    python benchmarks/micro.py --filter state   # only benchmarks whose name contains "state"
+"""
+
+import argparse
+import asyncio
+import json
+import pathlib
+import platform
+import sys
+import threading
+import time
+
+import numpy as np
+
+from alpaca_simulators import state
+from alpaca_simulators.api import camera, telescope
+from alpaca_simulators.endpoint_discovery import _discover, discover_device_endpoints
+from alpaca_simulators.main import app
+
+BASELINES = pathlib.Path(__file__).with_name("baselines.json")
+CONTENDING_THREADS = 4
+CONTENDED_CALLS = 1000
+BATCH_TELESCOPES = 500
+
+
+def bench_state_get():
+    return lambda: state.get_device_state("telescope", 0)
+
+
+def bench_state_update():
+    return lambda: state.update_device_state("telescope", 0, {"tracking": True})
+
+
+def bench_state_contended():
+    """A state read and an update per call, made by CONTENDING_THREADS threads at once."""
+
+    def work():
+        for _ in range(CONTENDED_CALLS):
+            state.get_device_state("telescope", 0)
+            state.update_device_state("telescope", 0, {"tracking": True})
+
+    def run():
+        threads = [threading.Thread(target=work) for _ in range(CONTENDING_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    return run, CONTENDING_THREADS * CONTENDED_CALLS
+
+
+def bench_radec_to_altaz():
+    now = time.time()
+    return lambda: telescope._radec_to_altaz(5.5, 20.0, 46.2, 6.1, now)
+
+
+def bench_altaz_to_radec():
+    now = time.time()
+    return lambda: telescope._altaz_to_radec(45.0, 120.0, 46.2, 6.1, now)
+
+
+def bench_radec_to_altaz_batch():
+    """One call converting BATCH_TELESCOPES telescopes, timed per telescope."""
+    rng = np.random.default_rng(0)
+    ra, dec = rng.uniform(0, 24, BATCH_TELESCOPES), rng.uniform(-90, 90, BATCH_TELESCOPES)
+    lat, lon = np.full(BATCH_TELESCOPES, 46.2), np.full(BATCH_TELESCOPES, 6.1)
+    now = time.time()
+    return lambda: telescope._radec_to_altaz_batch(ra, dec, lat, lon, now), BATCH_TELESCOPES
+
+
+def bench_coordinate_rates():
+    tel_state = state.get_device_state("telescope", 0)
+    return lambda: telescope.compute_coordinate_rates(tel_state)
+
+
+def bench_advance_motion():
+    state.update_device_state("telescope", 0, {"tracking": False, "atpark": False})
+    return lambda: telescope._advance_telescope_motion(0)
+
+
+def bench_cache_key():
+    args = (5.123456, 20.654321, 1.5, True, 12000, False, 0.0, 0.0, 1024, 1024, 1, 1, 0.0)
+    return lambda: camera.make_cache_key(*args)
+
+
+def _bench_bytes(size: int):
+    image = np.random.default_rng(0).integers(0, 65535, (size, size), dtype=np.uint16)
+
+    async def consume():
+        async for _ in camera.bytes_generator(image, size, size):
+            pass
+
+    loop = asyncio.new_event_loop()
+    return lambda: loop.run_until_complete(consume())
+
+
+def bench_discover_endpoints():
+    return lambda: discover_device_endpoints(app)
+
+
+def bench_discover_endpoints_uncached():
+    return lambda: _discover(app)
+
+
+BENCHMARKS = {
+    "state_get": bench_state_get,
+    "state_update": bench_state_update,
+    "state_get_update_contended": bench_state_contended,
+    "radec_to_altaz": bench_radec_to_altaz,
+    "altaz_to_radec": bench_altaz_to_radec,
+    "radec_to_altaz_batch": bench_radec_to_altaz_batch,
+    "compute_coordinate_rates": bench_coordinate_rates,
+    "advance_telescope_motion": bench_advance_motion,
+    "make_cache_key": bench_cache_key,
+    "bytes_generator_512": lambda: _bench_bytes(512),
+    "bytes_generator_2048": lambda: _bench_bytes(2048),
+    "bytes_generator_4096": lambda: _bench_bytes(4096),
+    "discover_device_endpoints": bench_discover_endpoints,
+    "discover_device_endpoints_uncached": bench_discover_endpoints_uncached,
+}
+
+
+def measure(setup, repeat: int) -> float:
+    """Return the best time (s) per operation of the benchmark built by ``setup``."""
+    built = setup()
+    func, ops = built if isinstance(built, tuple) else (built, 1)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= 0.1:
+            break
+        number *= 2 if elapsed > 0.01 else 10
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / (number * ops)
+
+
+def machine_id() -> str:
+    """Identify the machine and interpreter that timings were measured with."""
+    return f"{platform.node()} {platform.machine()} Python {platform.python_version()}"
+
+
+def _format(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filter", default="", help="Run benchmarks whose name contains this.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown.")
+    parser.add_argument("--update", action="store_true", help="Record new baselines.")
+    args = parser.parse_args()
+
+    recorded = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    baselines = recorded.get("benchmarks", {})
+    same_machine = recorded.get("machine") == machine_id()
+    if baselines and not same_machine and not args.update:
+        print(
+            f"Baselines were recorded on {recorded.get('machine', 'another machine')}; "
+            "comparing for information only (record them here with --update)."
+        )
+    state.reset_state()
+
+    print(f"{'benchmark':<36} {'time':>10} {'baseline':>10} {'change':>8}")
+    regressions = []
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        seconds = measure(setup, args.repeat)
+        baseline = baselines.get(name)
+        if baseline and seconds > baseline * (1 + args.threshold):
+            # Measure again before calling it a regression; a noisy moment is not one.
+            seconds = min(seconds, measure(setup, args.repeat))
+        if args.update:
+            baselines[name] = seconds
+        if baseline:
+            change = seconds / baseline - 1
+            flag = " !" if change > args.threshold else ""
+            if flag and not args.update:
+                regressions.append(name)
+            print(
+                f"{name:<36} {_format(seconds):>10} {_format(baseline):>10} "
+                f"{change * 100:>+7.1f}%{flag}"
+            )
+        else:
+            print(f"{name:<36} {_format(seconds):>10} {'-':>10} {'':>8}")
+
+    if args.update:
+        recorded = {"machine": machine_id(), "benchmarks": baselines}
+        BASELINES.write_text(json.dumps(recorded, indent=2, sort_keys=True) + "\n")
+        print(f"Baselines written to {BASELINES}")
+    elif regressions and same_machine:
+        print(f"Slower than baseline by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
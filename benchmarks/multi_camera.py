@@ -0,0 +1,87 @@
+"""
+Benchmark: N cameras exposing in parallel, each on its own optical train.
+
+Each camera gets its own telescope pointing, so every exposure is a cache miss that goes
+through cabaret. The Gaia query is replaced by a synthetic catalogue so the benchmark runs
+offline and measures rendering only. With per-camera render queues the wall time should
+stay roughly flat as cameras are added, until the CPU cores are saturated.
+
+Usage:
+    python benchmarks/multi_camera.py --cameras 8 --size 1024 --stars 2000
+"""
+
+import argparse
+import asyncio
+import copy
+import os
+import time
+
+import cabaret.image
+import numpy as np
+from cabaret import Sources
+
+from alpaca_simulators import state
+from alpaca_simulators.api import camera
+
+
+def synthetic_catalogue(n_stars: int):
+    """Return a stand-in for GaiaQuery.get_sources producing random stars in the field."""
+    rng = np.random.default_rng(0)
+
+    def get_sources(center, radius, limit, **kwargs):
+        r = radius.deg if hasattr(radius, "deg") else float(radius)
+        # cabaret passes a SkyCoord, the shared catalogue (ra, dec) in degrees.
+        ra0, dec0 = (center.ra.deg, center.dec.deg) if hasattr(center, "ra") else center
+        n = min(n_stars, limit)
+        ra = ra0 + rng.uniform(-r, r, n) / max(np.cos(np.radians(dec0)), 0.1)
+        dec = np.clip(dec0 + rng.uniform(-r, r, n), -89.9, 89.9)
+        return Sources.from_arrays(ra=ra % 360, dec=dec, fluxes=10 ** rng.uniform(2, 6, n))
+
+    return get_sources
+
+
+def configure_cameras(n_cameras: int, size: int) -> None:
+    """Rewrite the loaded config so camera i images through telescope i."""
+    devices = state.DEVICE_CONFIG["devices"]
+    camera_template = dict(devices["camera"][0], cameraxsize=size, cameraysize=size)
+    camera_template.update(numx=size, numy=size)
+    telescope_template = devices["telescope"][0]
+
+    devices["camera"] = {i: copy.deepcopy(camera_template) for i in range(n_cameras)}
+    devices["telescope"] = {
+        i: dict(copy.deepcopy(telescope_template), declination=10.0 + i, rightascension=1.0)
+        for i in range(n_cameras)
+    }
+    state.DEVICE_CONFIG["topology"] = {i: {"telescope": i} for i in range(n_cameras)}
+    state.reset_state()
+
+
+async def expose_all(n_cameras: int, duration: float) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(camera.exposure_task(i, duration, True) for i in range(n_cameras)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cameras", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--size", type=int, default=1024, help="Sensor size in pixels.")
+    parser.add_argument("--stars", type=int, default=2000, help="Stars per catalogue query.")
+    parser.add_argument("--duration", type=float, default=0.01, help="Exposure time (s).")
+    args = parser.parse_args()
+
+    cabaret.image.GaiaQuery.get_sources = staticmethod(synthetic_catalogue(args.stars))
+
+    print(f"{'cameras':>8} {'wall (s)':>10} {'per camera (s)':>15} {'speedup':>8}")
+    counts = sorted({2**i for i in range(args.cameras.bit_length())} | {args.cameras})
+    baseline = None
+    for n in counts:
+        configure_cameras(n, args.size)
+        camera.image_cache.clear()
+        wall = asyncio.run(expose_all(n, args.duration))
+        baseline = baseline or wall
+        print(f"{n:>8} {wall:>10.2f} {wall / n:>15.2f} {n * baseline / wall:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
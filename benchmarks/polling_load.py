@@ -0,0 +1,120 @@
+"""
+Load test: p99 latency with many clients polling device properties.
+
+Starts the simulator under uvicorn twice, once as shipped (state reads and updates run on
+the event loop) and once with every handler sent to the threadpool as plain ``def``
+handlers are, then has --clients concurrent clients poll a mix of properties for
+--duration seconds against each. Reported latencies are as seen by the clients.
+
+Usage:
+    python benchmarks/polling_load.py --clients 500 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+PATHS = [
+    "/api/v1/telescope/0/rightascension",
+    "/api/v1/telescope/0/slewing",
+    "/api/v1/dome/0/azimuth",
+    "/api/v1/camera/0/camerastate",
+    "/api/v1/focuser/0/position",
+    "/api/v1/camera/0/connected",
+]
+
+SERVER = """
+import sys
+import uvicorn
+if sys.argv[2] == "threadpool":
+    import alpaca_simulators.api.common as common
+    common.nonblocking = lambda handler: handler
+uvicorn.run("alpaca_simulators.main:app", port=int(sys.argv[1]), log_level="warning")
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(mode: str, threads: int | None) -> tuple[subprocess.Popen, int]:
+    port = free_port()
+    env = dict(os.environ)
+    if threads:
+        env["ALPACA_SIMULATORS_THREADS"] = str(threads)
+    process = subprocess.Popen([sys.executable, "-c", SERVER, str(port), mode], env=env)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/").status_code == 200:
+                return process, port
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Server did not start")
+
+
+async def poll(host: str, port: int, offset: int, stop: float, latencies: list) -> None:
+    # A bare keep-alive HTTP/1.1 client; httpx's pool is too slow to drive 500 connections
+    # from one process without becoming the bottleneck itself.
+    reader, writer = await asyncio.open_connection(host, port)
+    i = offset
+    try:
+        while time.perf_counter() < stop:
+            path = PATHS[i % len(PATHS)]
+            i += 1
+            start = time.perf_counter()
+            writer.write(
+                f"GET {path}?ClientTransactionID={i} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+            )
+            head = await reader.readuntil(b"\r\n\r\n")
+            status = head.split(b" ", 2)[1]
+            length = int(head.lower().split(b"content-length:", 1)[1].split(b"\r\n", 1)[0])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if status != b"200":
+                raise RuntimeError(f"{path} returned {status.decode()}")
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, clients: int, duration: float) -> list[float]:
+    latencies = []
+    stop = time.perf_counter() + duration
+    await asyncio.gather(*(poll(host, port, i, stop, latencies) for i in range(clients)))
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--threads", type=int, default=None, help="Server threadpool size.")
+    args = parser.parse_args()
+
+    print(f"{'mode':<11} {'requests/s':>10} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}")
+    for mode in ("threadpool", "loop"):
+        process, port = start_server(mode, args.threads)
+        try:
+            latencies = asyncio.run(run_load("127.0.0.1", port, args.clients, args.duration))
+            latencies.sort()
+        finally:
+            process.terminate()
+            process.wait()
+        p50 = statistics.median(latencies) * 1e3
+        p99 = latencies[int(0.99 * (len(latencies) - 1))] * 1e3
+        rate = len(latencies) / args.duration
+        print(f"{mode:<11} {rate:>10.0f} {p50:>9.1f} {p99:>9.1f} {latencies[-1] * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark: CPU per property GET with model responses versus pre-serialised ones.
+
+Each property is served twice by a bare FastAPI app, once the way hand-written handlers
+do it (build the pydantic model, FastAPI validates it against response_model and
+serialises it) and once through ``value_response``. Requests are driven straight
+through ASGI, and the two bodies are checked to be identical before timing.
+
+Usage:
+    python benchmarks/responses.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Query
+
+from alpaca_simulators.api.responses import value_response
+from alpaca_simulators.state import (
+    BoolResponse,
+    CameraStates,
+    DoubleResponse,
+    IntResponse,
+    StringArrayResponse,
+)
+
+PROPERTIES = {
+    "tracking": (BoolResponse, True),
+    "rightascension": (DoubleResponse, 5.123456789),
+    "camerastate": (IntResponse, CameraStates.EXPOSING),
+    "gains": (StringArrayResponse, ["Low", "Medium", "High"]),
+}
+
+app = FastAPI()
+
+
+def add_routes(name: str, model, value) -> None:
+    @app.get(f"/model/{name}", response_model=model)
+    def model_handler(ClientTransactionID: int = Query(0)):
+        return model(Value=value, ClientTransactionID=ClientTransactionID, ServerTransactionID=1)
+
+    @app.get(f"/fast/{name}")
+    def fast_handler(ClientTransactionID: int = Query(0)):
+        return value_response(model, value, ClientTransactionID, 1)
+
+
+for name, (model, value) in PROPERTIES.items():
+    add_routes(name, model, value)
+
+
+async def request(path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"ClientTransactionID=1",
+        "headers": [],
+        "client": ("127.0.0.1", 1),
+        "server": ("127.0.0.1", 11111),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    body = []
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def cpu_per_request(path: str, n: int) -> float:
+    for _ in range(100):  # warm up
+        await request(path)
+    start = time.process_time()
+    for _ in range(n):
+        await request(path)
+    return (time.process_time() - start) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'property':<16} {'model (us)':>11} {'fast (us)':>10} {'saved':>7}")
+    for name in PROPERTIES:
+        model_body = asyncio.run(request(f"/model/{name}"))
+        fast_body = asyncio.run(request(f"/fast/{name}"))
+        assert model_body == fast_body, (model_body, fast_body)
+        before = asyncio.run(cpu_per_request(f"/model/{name}", args.requests)) * 1e6
+        after = asyncio.run(cpu_per_request(f"/fast/{name}", args.requests)) * 1e6
+        print(f"{name:<16} {before:>11.1f} {after:>10.1f} {1 - after / before:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
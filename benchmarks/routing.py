@@ -0,0 +1,83 @@
+"""
+Benchmark: request routing overhead with and without the compiled Alpaca dispatcher.
+
+Requests are driven straight through the ASGI app (no HTTP server or client), once with
+the dispatcher in place and once with the plain Starlette router, for an endpoint matched
+early (a common route) and ones registered late in the route list.
+
+Usage:
+    python benchmarks/routing.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import time
+
+from alpaca_simulators.main import app
+
+PATHS = [
+    ("GET", "/api/v1/camera/0/connected"),  # generic route, first router
+    ("GET", "/api/v1/telescope/0/tracking"),  # tenth router
+    ("GET", "/api/v1/dome/0/shutterstatus"),  # last router
+]
+
+
+async def request(method: str, path: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"ClientTransactionID=1",
+        "headers": [],
+        "client": ("127.0.0.1", 1),
+        "server": ("127.0.0.1", 11111),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    status = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await app(scope, receive, send)
+    assert status == [200], status
+
+
+async def time_requests(method: str, path: str, n: int) -> float:
+    for _ in range(100):  # warm up
+        await request(method, path)
+    start = time.perf_counter()
+    for _ in range(n):
+        await request(method, path)
+    return (time.perf_counter() - start) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    dispatcher = app.router.middleware_stack
+    results = {}
+    for label, stack in (("router", dispatcher.app), ("dispatcher", dispatcher)):
+        app.router.middleware_stack = stack
+        for method, path in PATHS:
+            results[label, path] = asyncio.run(time_requests(method, path, args.requests))
+    app.router.middleware_stack = dispatcher
+
+    print(f"{'path':<36} {'router (us)':>12} {'dispatcher (us)':>16} {'saved (us)':>11}")
+    for _, path in PATHS:
+        before, after = results["router", path] * 1e6, results["dispatcher", path] * 1e6
+        print(f"{path:<36} {before:>12.1f} {after:>16.1f} {before - after:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
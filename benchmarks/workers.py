@@ -0,0 +1,80 @@
+"""
+Load test: property polling throughput with 1 worker versus N workers.
+
+Starts ``alpaca-simulators`` with ``--workers 1`` and then with each count given in
+--workers (which share device state through the state server), and has --clients
+clients poll a mix of properties for --duration seconds against each. The clients run
+in --client-processes processes so the load generator is not the bottleneck. Every
+state read and write of a worker is a round trip to the single state server process,
+so throughput stops scaling once that process is saturated; on a machine with fewer
+cores than workers plus client processes there is nothing to scale onto.
+
+Usage:
+    python benchmarks/workers.py --workers 2 4 --clients 200 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+from polling_load import free_port, run_load
+
+
+def start_server(workers: int) -> tuple[subprocess.Popen, int]:
+    port = free_port()
+    command = [sys.executable, "-m", "alpaca_simulators.run_simulator", "--host", "127.0.0.1"]
+    command += ["--port", str(port), "--workers", str(workers), "--discovery-port", "0"]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/").status_code == 200:
+                return process, port
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Server did not start")
+
+
+def client_process(port: int, clients: int, duration: float) -> list[float]:
+    return asyncio.run(run_load("127.0.0.1", port, clients, duration))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 2])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--client-processes", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    args = parser.parse_args()
+
+    per_process = max(1, args.clients // args.client_processes)
+    print(f"{'workers':>7} {'requests/s':>10} {'p50 (ms)':>9} {'p99 (ms)':>9} {'speedup':>8}")
+    baseline = None
+    for workers in [1] + [n for n in args.workers if n != 1]:
+        process, port = start_server(workers)
+        try:
+            with ProcessPoolExecutor(args.client_processes) as pool:
+                runs = [
+                    pool.submit(client_process, port, per_process, args.duration)
+                    for _ in range(args.client_processes)
+                ]
+                latencies = sorted(latency for run in runs for latency in run.result())
+        finally:
+            process.terminate()
+            process.wait()
+        rate = len(latencies) / args.duration
+        baseline = baseline or rate
+        p50 = statistics.median(latencies) * 1e3
+        p99 = latencies[int(0.99 * (len(latencies) - 1))] * 1e3
+        print(f"{workers:>7} {rate:>10.0f} {p50:>9.1f} {p99:>9.1f} {rate / baseline:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
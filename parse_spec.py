@@ -78,5 +78,74 @@ def analyze_api_spec(file_path="AlpacaDeviceAPI_v1.yaml", output_dir="api_docs")
     )
 
 
+# Spec schema types of a plain ``Value`` and the names used in the property table.
+VALUE_TYPES = {"boolean": "bool", "integer": "int", "number": "float", "string": "str"}
+
+PROPERTY_TABLE_PATH = "src/alpaca_simulators/api/spec_properties.py"
+
+
+def resolve_ref(spec, node):
+    """Follow ``$ref`` links (``#/components/...``) until reaching an inline node."""
+    while isinstance(node, dict) and "$ref" in node:
+        target = spec
+        for part in node["$ref"].lstrip("#/").split("/"):
+            target = target[part]
+        node = target
+    return node
+
+
+def get_value_type(spec, response):
+    """
+    Return the table type name of a response's ``Value`` (``bool``, ``int``, ``float``,
+    ``str``, ``list[str]`` or ``list[int]``), or None if it is not a plain value.
+    """
+    schema = resolve_ref(
+        spec, resolve_ref(spec, response)["content"]["application/json"]["schema"]
+    )
+    properties = {}
+    for part in schema.get("allOf", [schema]):
+        properties.update(resolve_ref(spec, part).get("properties", {}))
+
+    value = resolve_ref(spec, properties.get("Value"))
+    if not value:
+        return None
+    if value.get("type") == "array":
+        item_type = VALUE_TYPES.get(resolve_ref(spec, value.get("items", {})).get("type"))
+        return f"list[{item_type}]" if item_type in ("str", "int") else None
+    return VALUE_TYPES.get(value.get("type"))
+
+
+def write_property_table(file_path="AlpacaDeviceAPI_v1.yaml", output=PROPERTY_TABLE_PATH):
+    """
+    Write the GET members of each device type that return a plain ``Value``, with the
+    value type the spec gives them, as the table behind the generated property endpoints.
+    """
+    with open(file_path) as f:
+        spec = yaml.safe_load(f)
+
+    properties = defaultdict(dict)
+    for path, path_item in spec["paths"].items():
+        device_type = get_device_type_from_path(path)
+        if device_type in ("common", "management", "unknown") or "get" not in path_item:
+            continue
+        value_type = get_value_type(spec, path_item["get"]["responses"]["200"])
+        if value_type:
+            properties[device_type][path.rstrip("/").split("/")[-1]] = value_type
+
+    with open(output, "w") as out_f:
+        out_f.write(f'"""\nGenerated by parse_spec.py from {file_path}; do not edit.\n\n')
+        out_f.write("GET members of each device type returning a plain Value, and its type.\n")
+        out_f.write('"""\n\nSPEC_PROPERTIES = {\n')
+        for device_type in sorted(properties):
+            out_f.write(f'    "{device_type}": {{\n')
+            for member, value_type in sorted(properties[device_type].items()):
+                out_f.write(f'        "{member}": "{value_type}",\n')
+            out_f.write("    },\n")
+        out_f.write("}\n")
+
+    print(f"✅ Property table written to: {output}")
+
+
 if __name__ == "__main__":
     analyze_api_spec()
+    write_property_table()
@@ -0,0 +1,232 @@
+"""
+Admin endpoints for diagnosing a running server: a sampling profiler and tracemalloc.
+
+The profiler samples the stack of every thread from a background thread every
+``interval`` seconds until stopped or for at most ``seconds``, so it can be attached to a
+server that has slowed down mid soak test without restarting it. Profiles come back as
+collapsed stacks (flamegraph.pl, speedscope, etc. read them) or speedscope JSON.
+
+Memory snapshots use tracemalloc. Each snapshot is kept under an id (the last
+MAX_SNAPSHOTS of them) and reported as the top allocation sites that grew since the
+previous one, along with the sizes of the usual suspects: the rendered frame cache and
+the device state dict.
+
+The endpoints are off unless the config sets ``admin_endpoints: true``; otherwise they
+answer as an unknown route would.
+"""
+
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse, Response
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from alpaca_simulators import state
+from alpaca_simulators.api import camera
+from alpaca_simulators.config import Config
+
+MAX_SNAPSHOTS = 8
+MAX_PROFILE_SECONDS = 600
+
+
+def require_admin() -> None:
+    if not Config().load().get("admin_endpoints", False):
+        # Starlette's exception, so this is answered like a missing route.
+        raise StarletteHTTPException(status_code=404)
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+class SamplingProfiler:
+    """Samples the Python stacks of all threads from a background thread."""
+
+    def __init__(self, interval: float, seconds: float):
+        self.interval = interval
+        self.seconds = seconds
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self.started = 0.0
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        deadline = self.started + self.seconds
+        while not self._stop.wait(self.interval) and time.perf_counter() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.samples[tuple(reversed(stack))] += 1
+        self.elapsed = time.perf_counter() - self.started
+
+    def collapsed(self) -> str:
+        """The samples as collapsed stacks: ``root;...;leaf count`` per line."""
+        return "".join(
+            f"{';'.join(stack)} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+    def speedscope(self) -> dict:
+        """The samples as a speedscope sampled profile."""
+        frames: dict[str, int] = {}
+        samples, weights = [], []
+        for stack, count in self.samples.items():
+            samples.append([frames.setdefault(name, len(frames)) for name in stack])
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "alpaca-simulators",
+            "name": "alpaca-simulators",
+            "shared": {"frames": [{"name": name} for name in frames]},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": "all threads",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+
+_profiler: SamplingProfiler | None = None
+_snapshots: dict[int, tracemalloc.Snapshot] = {}
+
+
+def _suspects() -> dict[str, int]:
+    """Sizes of the caches and state that grow with use."""
+    sizes = {
+        "image_cache_frames": sum(len(images) for images in list(camera.image_cache.values())),
+        "image_cache_bytes": sum(
+            image.nbytes
+            for images in list(camera.image_cache.values())
+            for image in list(images.values())
+        ),
+    }
+    if isinstance(state._store, state.StateStore):
+        sizes["state_devices"] = len(state._store._state)
+    return sizes
+
+
+@router.post("/profile/start")
+async def start_profile(
+    seconds: float = Query(30.0, gt=0, le=MAX_PROFILE_SECONDS),
+    interval: float = Query(0.005, ge=0.001, le=1.0),
+):
+    """Start sampling all threads every ``interval`` s for at most ``seconds``."""
+    global _profiler
+    if _profiler is not None and _profiler.running:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    _profiler = SamplingProfiler(interval, seconds)
+    _profiler.start()
+    return {"message": f"Profiling for up to {seconds} s", "interval": interval}
+
+
+@router.post("/profile/stop")
+def stop_profile(format: str = Query("collapsed", pattern="^(collapsed|speedscope)$")):
+    """Stop the profiler (if still running) and return its profile."""
+    if _profiler is None:
+        raise HTTPException(status_code=409, detail="No profile was started")
+    _profiler.stop()
+    if format == "speedscope":
+        return Response(
+            json.dumps(_profiler.speedscope()),
+            media_type="application/json",
+            headers={"Content-Disposition": 'attachment; filename="profile.speedscope.json"'},
+        )
+    return PlainTextResponse(_profiler.collapsed())
+
+
+@router.post("/tracemalloc/start")
+def start_tracemalloc(frames: int = Query(10, ge=1, le=100)):
+    """Start tracing allocations, keeping ``frames`` frames of traceback per block."""
+    tracemalloc.start(frames)
+    return {"message": "Tracing allocations", "frames": frames}
+
+
+@router.post("/tracemalloc/stop")
+def stop_tracemalloc():
+    """Stop tracing allocations and drop the snapshots taken."""
+    tracemalloc.stop()
+    _snapshots.clear()
+    return {"message": "Stopped tracing allocations"}
+
+
+def _top_stats(snapshot, base, limit: int) -> list[dict]:
+    if base is None:
+        stats = snapshot.statistics("lineno")
+    else:
+        stats = snapshot.compare_to(base, "lineno")
+    return [
+        {
+            "location": str(stat.traceback),
+            "size": stat.size,
+            "size_diff": getattr(stat, "size_diff", stat.size),
+            "count": stat.count,
+            "count_diff": getattr(stat, "count_diff", stat.count),
+        }
+        for stat in stats[:limit]
+    ]
+
+
+@router.post("/tracemalloc/snapshot")
+def take_snapshot(limit: int = Query(20, ge=1, le=1000)):
+    """Take a snapshot and report what grew most since the previous one."""
+    if not tracemalloc.is_tracing():
+        raise HTTPException(status_code=409, detail="tracemalloc is not started")
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+    snapshot_id = max(_snapshots, default=0) + 1
+    base = _snapshots.get(snapshot_id - 1)
+    _snapshots[snapshot_id] = snapshot
+    while len(_snapshots) > MAX_SNAPSHOTS:
+        del _snapshots[min(_snapshots)]
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "snapshot": snapshot_id,
+        "compared_to": snapshot_id - 1 if base is not None else None,
+        "traced_bytes": current,
+        "peak_traced_bytes": peak,
+        "suspects": _suspects(),
+        "top": _top_stats(snapshot, base, limit),
+    }
+
+
+@router.get("/tracemalloc/diff")
+def diff_snapshots(base: int, other: int, limit: int = Query(20, ge=1, le=1000)):
+    """Report the allocation sites that changed most between two kept snapshots."""
+    if base not in _snapshots or other not in _snapshots:
+        raise HTTPException(status_code=404, detail=f"Snapshots kept: {sorted(_snapshots)}")
+    return {
+        "base": base,
+        "other": other,
+        "top": _top_stats(_snapshots[other], _snapshots[base], limit),
+    }
@@ -1,33 +1,77 @@
 import asyncio
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 
 import cabaret
 import numpy as np
 from fastapi import APIRouter, BackgroundTasks, Form, Path, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
-from alpaca_simulators.api.common import AlpacaError, validate_device
+from alpaca_simulators.api.common import AlpacaError, nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
+from alpaca_simulators.api.properties import add_property_routes
 from alpaca_simulators.api.telescope import compute_coordinate_rates
+from alpaca_simulators.calibration import (
+    dark_current_rate,
+    generate_calibration_frame,
+    stack_frames,
+    subexposure_count,
+)
+from alpaca_simulators.catalogue import field_radius, get_shared_sources
 from alpaca_simulators.config import Config
+from alpaca_simulators.preview import PREVIEW_FORMATS, render_preview
 from alpaca_simulators.state import (
     AlpacaResponse,
     BoolResponse,
+    CalibratorStatus,
     CameraStates,
+    CoverStatus,
     DoubleResponse,
     GuideDirections,
     ImageArrayResponse,
     IntResponse,
     SensorTypes,
-    StringArrayResponse,
     StringResponse,
+    get_all_configured_devices,
     get_device_state,
+    get_optical_train,
     get_server_transaction_id,
+    get_setting,
     update_device_state,
 )
+from alpaca_simulators.tracing import new_trace, record_span, span
+
+router = APIRouter(route_class=AlpacaRoute)
+
+# Rendered frames, partitioned per camera (optical train): device_number -> {key: image}.
+image_cache: defaultdict[int, dict[str, np.ndarray]] = defaultdict(dict)
+
+# One single-threaded render queue per camera, so cameras on different optical trains
+# render in parallel while exposures on the same camera are rendered in order.
+_render_executors: dict[int, ThreadPoolExecutor] = {}
+_render_executors_lock = threading.Lock()
 
-router = APIRouter()
+# Renders waiting in or running on each camera's render queue, and exposures in progress
+# (both for /metrics; only changed on the event loop).
+render_queue_depth: defaultdict[int, int] = defaultdict(int)
+active_exposures = 0
 
-image_cache = {}
+# Trace id of each camera's latest exposure, so its download is traced with it.
+_exposure_traces: dict[int, str] = {}
+
+# Rendered previews per camera: device_number -> (frame, {(size, format): encoded bytes}).
+# The frame reference ties the cached previews to one exposure; a new frame replaces them.
+_preview_cache: dict[int, tuple[object, dict[tuple[int, str], bytes]]] = {}
+_preview_locks: defaultdict[int, threading.Lock] = defaultdict(threading.Lock)
+
+# Stacked exposures render the expected sky over this many sub-exposures and scale it back
+# down (see _render_expected_sky).
+SKY_OVERSAMPLING = 1000
 
 
 def make_cache_key(
@@ -43,14 +87,39 @@ def make_cache_key(
     numy,
     binx,
     biny,
+    rotation=0.0,
 ):
     return (
         f"{ra}_{dec}_{duration}_{light}_{focus}_{sunlight}_"
-        f"{tracking_ra_rate}_{tracking_dec_rate}_{numx}x{numy}_b{binx}x{biny}"
+        f"{tracking_ra_rate}_{tracking_dec_rate}_{numx}x{numy}_b{binx}x{biny}_r{rotation}"
     )
 
 
-async def bytes_generator(image_array, numx, numy):
+def _render_executor(device_number: int) -> ThreadPoolExecutor:
+    """Return the render queue of a camera, creating it on first use."""
+    with _render_executors_lock:
+        executor = _render_executors.get(device_number)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"render-camera-{device_number}"
+            )
+            _render_executors[device_number] = executor
+        return executor
+
+
+async def bytes_generator(image_array, numx, numy, device_number=None):
+    with span(
+        "download",
+        trace_id=_exposure_traces.get(device_number),
+        camera=device_number,
+        shape=list(image_array.shape),
+        bytes=image_array.nbytes,
+    ):
+        for chunk in _image_bytes(image_array, numx, numy):
+            yield chunk
+
+
+def _image_bytes(image_array, numx, numy):
     b = (1).to_bytes(4, "little")  # metaversion
     b += (0).to_bytes(4, "little")  # error
     b += (0).to_bytes(4, "little")  # clientid
@@ -68,79 +137,125 @@ async def bytes_generator(image_array, numx, numy):
     yield b
 
 
-async def exposure_task(device_number: int, duration: float, light: bool):
-    """Background task to simulate camera exposure"""
-    global image_cache
-    try:
-        # Snapshot the telescope state at shutter-open time.  This must happen
-        # before the sleep loop so that the coordinates and motion rates captured
-        # reflect the moment the exposure started, not the moment the image is
-        # generated (by which time MoveAxis may have been stopped or changed).
-        tel_state_at_open = get_device_state("telescope", 0)
-
-        # Update camera state to exposing
-        update_device_state(
-            "camera",
-            device_number,
-            {
-                "camera_state": CameraStates.EXPOSING,
-                "image_ready": False,
-                "exposure_start_time": datetime.now(timezone.utc).isoformat(),
-                "exposure_duration": duration,
-                "light": light,
-                "percentcompleted": 0,
-            },
-        )
-
-        # Simulate exposure progress
-        steps = 10
-        for i in range(steps):
-            await asyncio.sleep(duration / steps)
-            progress = int((i + 1) * 100 / steps)
-            update_device_state("camera", device_number, {"percentcompleted": progress})
-
-        # Update to reading state
-        update_device_state("camera", device_number, {"camera_state": CameraStates.READING})
-        await asyncio.sleep(0.01)  # Simulate readout time
-
-        # Generate image using cabaret
-        cam_state = get_device_state("camera", device_number)
-        tel_state = get_device_state("telescope", 0)  # for hardware properties
-        focuser_state = get_device_state("focuser", 0)  # Assume focuser 0
-
-        # Calculate seeing multiplier based on focuser position
-        seeing_multiplier = 1 + np.abs(focuser_state.get("position", 0) - 10_000) / 100
-
-        if seeing_multiplier > 5:
-            seeing_multiplier = 5
-
-        # Use shutter-open coordinates so the image is centred on where the
-        # telescope was pointing when the exposure started, not when it ended.
-        pointing_error_ra = Config().load().get("pointing_error_ra", 0.0)  # arcmin
-        pointing_error_dec = Config().load().get("pointing_error_dec", 0.0)  # arcmin
-        ra = tel_state_at_open.get("rightascension", 0.0) + (pointing_error_ra / 60) / 15
-        dec = tel_state_at_open.get("declination", 0.0) + (pointing_error_dec / 60)
-        # gaia breaks
-        if dec >= 90.0 or dec <= -90.0:
-            dec = 89.99 if dec >= 0 else -89.99
-
-        if ra <= 0.0 or ra >= 24.0:
-            ra = 0.01 if ra <= 0.0 else 23.99
-
-        # Initialise cabaret
+def _flat_panel_brightness(train: dict[str, int | None]) -> float:
+    """Fractional brightness of a lit flat panel in front of the camera, or 0.0."""
+    if train["covercalibrator"] is None:
+        return 0.0
+    cal_state = get_device_state("covercalibrator", train["covercalibrator"])
+    if cal_state.get("calibratorstate") != CalibratorStatus.READY:
+        return 0.0
+    if cal_state.get("coverstate") == CoverStatus.OPEN:
+        return 0.0
+    max_brightness = cal_state.get("maxbrightness", 255) or 1
+    return min(1.0, max(0.0, cal_state.get("brightness", 0) / max_brightness))
+
+
+def _train_device_state(train: dict[str, int | None], device_type: str) -> dict:
+    """State of a device in an optical train, or an empty dict when the train has none."""
+    if train[device_type] is None:
+        return {}
+    return get_device_state(device_type, train[device_type])
+
+
+def _telescope_field_radii(telescope_number: int, tel_state: dict) -> list[float]:
+    """Field radii (degrees) of every camera imaging through a telescope."""
+    return [
+        field_radius(get_device_state("camera", camera_number), tel_state)
+        for camera_number in get_all_configured_devices().get("camera", [])
+        if get_optical_train(camera_number)["telescope"] == telescope_number
+    ]
+
+
+def _render_expected_sky(
+    observatory: cabaret.Observatory,
+    exp_time: float,
+    tracking_ra_rate: float,
+    tracking_dec_rate: float,
+    **kwargs,
+) -> np.ndarray:
+    """The sky of one exposure in electrons per binned pixel, with next to no shot noise.
+
+    cabaret has no noise-free render: it draws the shot noise of the stars and the sky
+    background as it renders them. So the sky is rendered over SKY_OVERSAMPLING exposures,
+    with the tracking rates scaled down to keep the trails of one, and divided back down,
+    which leaves 1/sqrt(SKY_OVERSAMPLING) of an exposure's shot noise. The astronomical
+    image of generate_image_stack comes before cabaret's read-out, so it is neither
+    clipped to the well nor quantised.
+    """
+    stack = observatory.generate_image_stack(
+        exp_time=exp_time * SKY_OVERSAMPLING,
+        tracking_ra_rate=tracking_ra_rate / SKY_OVERSAMPLING,
+        tracking_dec_rate=tracking_dec_rate / SKY_OVERSAMPLING,
+        convert_all_to_adu=False,
+        **kwargs,
+    )
+    sky = observatory.camera.bin_image(stack[1])
+    return (sky / SKY_OVERSAMPLING).astype(np.float32)
+
+
+def _generate_light_frame(
+    device_number: int,
+    cam_state: dict,
+    tel_state_at_open: dict,
+    train: dict[str, int | None],
+    duration: float,
+    sub_duration: float = 0.0,
+):
+    """Render a light frame of the sky with cabaret, reusing cached frames where possible.
+
+    With a sub_duration shorter than duration, the expected sky of one sub-exposure is
+    rendered once and every sub-exposure draws its own shot and read noise before they are
+    summed.
+    """
+    tel_state = _train_device_state(train, "telescope")  # for hardware properties
+    focuser_state = _train_device_state(train, "focuser")
+    rotator_state = _train_device_state(train, "rotator")
+    rotation = rotator_state.get("position", 0.0)
+
+    # Calculate seeing multiplier based on focuser position
+    seeing_multiplier = 1 + np.abs(focuser_state.get("position", 0) - 10_000) / 100
+
+    if seeing_multiplier > 5:
+        seeing_multiplier = 5
+
+    # Use shutter-open coordinates so the image is centred on where the
+    # telescope was pointing when the exposure started, not when it ended.
+    pointing_error_ra = Config().load().get("pointing_error_ra", 0.0)  # arcmin
+    pointing_error_dec = Config().load().get("pointing_error_dec", 0.0)  # arcmin
+    ra = tel_state_at_open.get("rightascension", 0.0) + (pointing_error_ra / 60) / 15
+    dec = tel_state_at_open.get("declination", 0.0) + (pointing_error_dec / 60)
+    # gaia breaks
+    if dec >= 90.0 or dec <= -90.0:
+        dec = 89.99 if dec >= 0 else -89.99
+
+    if ra <= 0.0 or ra >= 24.0:
+        ra = 0.01 if ra <= 0.0 else 23.99
+
+    n_subs = subexposure_count(duration, sub_duration)
+    exp_time = duration / n_subs
+
+    with span("render.setup", camera=device_number):
+        # Initialise cabaret. When stacking, only the expected sky is rendered with it and
+        # the detector is simulated per sub-exposure by stack_frames().
+        if n_subs > 1:
+            detector = {"gain": 1.0, "read_noise": 0.0, "bias": 0, "dark_current": 0.0}
+        else:
+            detector = {
+                "gain": cam_state.get("gain", 1.0),
+                "dark_current": dark_current_rate(cam_state.get("ccdtemperature", -60)),
+                "pixel_defects": cam_state.get("pixel_defects", {}),
+            }
         cabaret_camera = cabaret.Camera(
             width=cam_state.get("numx") * cam_state.get("binx", 1),
             height=cam_state.get("numy") * cam_state.get("biny", 1),
             bin_x=cam_state.get("binx", 1),
             bin_y=cam_state.get("biny", 1),
             pitch=cam_state.get("pixelsizex", 10.0),
-            gain=cam_state.get("gain", 1.0),
             well_depth=cam_state.get("fullwellcapacity", 2**16),
-            dark_current=0.2
-            * 2 ** ((cam_state.get("ccdtemperature", -60) - (-10)) / 6),  # doubles every 6C
-            pixel_defects=cam_state.get("pixel_defects", {}),
+            rotation=rotation,
+            **detector,
         )
-        sunlight = Config().load().get("sunlight", False)
+        sunlight = get_setting("sunlight", False)
         if sunlight:
             cabaret_site = cabaret.Site(
                 sky_background=150,
@@ -163,56 +278,181 @@ async def exposure_task(device_number: int, duration: float, light: bool):
             camera=cabaret_camera, site=cabaret_site, telescope=cabaret_telescope
         )
 
-        bad_tracking = Config().load().get("bad_tracking", False)
-        if bad_tracking:
-            bad_tracking_rate = Config().load().get("bad_tracking_rate", 0.01)  # arcsec per second
-            last_slew_time = tel_state_at_open.get("last_slew_time", datetime.now(timezone.utc))
-            # drift RA/Dec based on time since last slew
-            time_elapsed = (datetime.now(timezone.utc) - last_slew_time).total_seconds()
-            ra += time_elapsed * (bad_tracking_rate / 3600) / 15  # convert to hours
-            dec += time_elapsed * bad_tracking_rate / 3600
-
-        # On-sky rates for cabaret's star trails. cabaret's add_stars() wants arcsec/s,
-        # with RA as dα·cos(δ)/dt. compute_coordinate_rates() (telescope.py) gives the
-        # coordinate-space rates from the shutter-open snapshot; convert to on-sky here.
-        ra_rate_h, dec_rate_deg = compute_coordinate_rates(tel_state_at_open)
-
-        # Coordinate-space rates → on-sky arcsec/s (RA: RA-hours/s ×54000 ×cos δ).
-        cos_dec = np.cos(np.radians(dec))
-        tracking_ra_rate = ra_rate_h * 54000.0 * cos_dec
-        tracking_dec_rate = dec_rate_deg * 3600.0
-
-        # Generate star field image
-        key = make_cache_key(
-            ra,
-            dec,
-            duration,
-            light,
-            focuser_state.get("position", 0),
-            sunlight=sunlight,
-            tracking_ra_rate=tracking_ra_rate,
-            tracking_dec_rate=tracking_dec_rate,
-            numx=cam_state.get("numx"),
-            numy=cam_state.get("numy"),
-            binx=cam_state.get("binx", 1),
-            biny=cam_state.get("biny", 1),
+    bad_tracking = get_setting("bad_tracking", False)
+    if bad_tracking:
+        bad_tracking_rate = Config().load().get("bad_tracking_rate", 0.01)  # arcsec per second
+        last_slew_time = tel_state_at_open.get("last_slew_time", datetime.now(timezone.utc))
+        # drift RA/Dec based on time since last slew
+        time_elapsed = (datetime.now(timezone.utc) - last_slew_time).total_seconds()
+        ra += time_elapsed * (bad_tracking_rate / 3600) / 15  # convert to hours
+        dec += time_elapsed * bad_tracking_rate / 3600
+
+    # On-sky rates for cabaret's star trails. cabaret's add_stars() wants arcsec/s,
+    # with RA as dα·cos(δ)/dt. compute_coordinate_rates() (telescope.py) gives the
+    # coordinate-space rates from the shutter-open snapshot; convert to on-sky here.
+    ra_rate_h, dec_rate_deg = compute_coordinate_rates(tel_state_at_open)
+
+    # Coordinate-space rates → on-sky arcsec/s (RA: RA-hours/s ×54000 ×cos δ).
+    cos_dec = np.cos(np.radians(dec))
+    tracking_ra_rate = ra_rate_h * 54000.0 * cos_dec
+    tracking_dec_rate = dec_rate_deg * 3600.0
+
+    # Generate star field image
+    key = make_cache_key(
+        ra,
+        dec,
+        exp_time,
+        True,
+        focuser_state.get("position", 0),
+        sunlight=sunlight,
+        tracking_ra_rate=tracking_ra_rate,
+        tracking_dec_rate=tracking_dec_rate,
+        numx=cam_state.get("numx"),
+        numy=cam_state.get("numy"),
+        binx=cam_state.get("binx", 1),
+        biny=cam_state.get("biny", 1),
+        rotation=rotation,
+    )
+    if n_subs > 1:
+        key += "_sky"
+    camera_cache = image_cache[device_number]
+    if key in camera_cache:
+        print(f"Using cached image for key: {key}")
+        image_data = camera_cache[key]
+        record_span("render.sky", time.time(), 0.0, {"camera": device_number, "cache": "hit"})
+    else:
+        print(f"Generating new image for key: {key}")
+        with span("render.sky", camera=device_number, cache="miss"):
+            # Cameras sharing this telescope share one catalogue fetch for the pointing.
+            sources = None
+            if train["telescope"] is not None:
+                radii = _telescope_field_radii(train["telescope"], tel_state) or [
+                    field_radius(cam_state, tel_state)
+                ]
+                with span("render.catalogue", camera=device_number, telescope=train["telescope"]):
+                    sources = get_shared_sources(
+                        train["telescope"],
+                        (ra / 24) * 360,
+                        dec,
+                        radius=max(radii),
+                        min_radius=min(radii),
+                        timeout=Config().load().get("gaia_query_timeout", 30),
+                        tap_source=Config().load().get("tap_source", None),
+                    )
+            with span("render.image", camera=device_number):
+                render = cabaret_observatory.generate_image
+                if n_subs > 1:
+                    render = partial(_render_expected_sky, cabaret_observatory)
+                image_data = render(
+                    ra=(ra / 24) * 360,
+                    dec=dec,
+                    exp_time=exp_time,
+                    light=1,
+                    timeout=Config().load().get("gaia_query_timeout", 30),
+                    tracking_ra_rate=tracking_ra_rate,
+                    tracking_dec_rate=tracking_dec_rate,
+                    tap_source=Config().load().get("tap_source", None),
+                    sources=sources,
+                )
+            camera_cache[key] = image_data
+
+    if n_subs > 1:
+        with span("render.stack", camera=device_number, subexposures=n_subs):
+            return stack_frames(device_number, cam_state, image_data, exp_time, n_subs)
+    return image_data
+
+
+def _traced_render(render, device_number: int, frame_type: str, queued_at: float):
+    """Run a render on the camera's render queue, tracing the wait for it and the render."""
+    record_span("render.queue", queued_at, time.time() - queued_at, {"camera": device_number})
+    with span("render", camera=device_number, frame=frame_type) as tags:
+        image_data = render()
+        tags["shape"] = list(image_data.shape)
+        tags["bytes"] = image_data.nbytes
+    return image_data
+
+
+async def exposure_task(device_number: int, duration: float, light: bool):
+    """Background task to simulate camera exposure"""
+    global active_exposures
+    active_exposures += 1
+    start, started = time.time(), time.perf_counter()
+    _exposure_traces[device_number] = new_trace(f"camera{device_number}")
+    try:
+        # Snapshot the telescope state at shutter-open time.  This must happen
+        # before the sleep loop so that the coordinates and motion rates captured
+        # reflect the moment the exposure started, not the moment the image is
+        # generated (by which time MoveAxis may have been stopped or changed).
+        train = get_optical_train(device_number)
+        tel_state_at_open = _train_device_state(train, "telescope")
+
+        # Update camera state to exposing
+        update_device_state(
+            "camera",
+            device_number,
+            {
+                "camera_state": CameraStates.EXPOSING,
+                "image_ready": False,
+                "exposure_start_time": datetime.now(timezone.utc).isoformat(),
+                "exposure_duration": duration,
+                "light": light,
+                "percentcompleted": 0,
+            },
         )
-        if key in image_cache:
-            print(f"Using cached image for key: {key}")
-            image_data = image_cache[key]
+
+        # Simulate exposure progress
+        with span("exposure.wait", camera=device_number):
+            steps = 10
+            for i in range(steps):
+                await asyncio.sleep(duration / steps)
+                progress = int((i + 1) * 100 / steps)
+                update_device_state("camera", device_number, {"percentcompleted": progress})
+
+        # Update to reading state
+        update_device_state("camera", device_number, {"camera_state": CameraStates.READING})
+        with span("exposure.readout", camera=device_number):
+            await asyncio.sleep(0.01)  # Simulate readout time
+
+        cam_state = get_device_state("camera", device_number)
+        flat_brightness = _flat_panel_brightness(train) if light else 0.0
+        sub_duration = cam_state.get("subexposureduration", 0.0)
+
+        if not light or flat_brightness > 0:
+            # Bias, dark and flat frames need no sky, so skip cabaret entirely.
+            frame_type = "flat" if light else "dark" if duration > 0 else "bias"
+            render = partial(
+                generate_calibration_frame,
+                device_number,
+                cam_state,
+                duration,
+                flat_brightness,
+                sub_duration,
+            )
         else:
-            print(f"Generating new image for key: {key}")
-            image_data = cabaret_observatory.generate_image(
-                ra=(ra / 24) * 360,
-                dec=dec,
-                exp_time=duration,
-                light=1 if light else 0,
-                timeout=Config().load().get("gaia_query_timeout", 30),
-                tracking_ra_rate=tracking_ra_rate,
-                tracking_dec_rate=tracking_dec_rate,
-                tap_source=Config().load().get("tap_source", None),
+            frame_type = "light"
+            render = partial(
+                _generate_light_frame,
+                device_number,
+                cam_state,
+                tel_state_at_open,
+                train,
+                duration,
+                sub_duration,
+            )
+        loop = asyncio.get_running_loop()
+        render_queue_depth[device_number] += 1
+        try:
+            image_data = await loop.run_in_executor(
+                _render_executor(device_number),
+                contextvars.copy_context().run,
+                _traced_render,
+                render,
+                device_number,
+                frame_type,
+                time.time(),
             )
-            image_cache[key] = image_data
+        finally:
+            render_queue_depth[device_number] -= 1
 
         # Update to download state with image ready
         update_device_state(
@@ -238,31 +478,17 @@ async def exposure_task(device_number: int, duration: float, light: bool):
             },
         )
         raise AlpacaError(0x40D, f"Issue with camera exposure: {e}")
+    finally:
+        active_exposures -= 1
+        record_span(
+            "exposure",
+            start,
+            time.perf_counter() - started,
+            {"camera": device_number, "duration": duration, "light": light},
+        )
 
 
 # Camera-specific endpoints
-@router.get("/camera/{device_number}/camerastate", response_model=IntResponse)
-def get_camerastate(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("camera_state", CameraStates.IDLE),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/imageready", response_model=BoolResponse)
-def get_imageready(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("image_ready", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.get("/camera/{device_number}/imagearray", response_model=ImageArrayResponse)
 def get_imagearray(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
@@ -290,13 +516,59 @@ def get_imagearray(device_number: int = Path(..., ge=0), ClientTransactionID: in
     )
 
     return StreamingResponse(
-        bytes_generator(image_data, cam_state.get("numx"), cam_state.get("numy")),
+        bytes_generator(image_data, cam_state.get("numx"), cam_state.get("numy"), device_number),
         headers={"Content-Type": "application/imagebytes"},
         media_type="application/imagebytes",
     )
 
 
+def get_preview_bytes(device_number: int, image_data, size: int, fmt: str) -> bytes:
+    """Return the encoded preview of a frame, rendering it at most once per frame."""
+    with _preview_locks[device_number]:
+        frame, renders = _preview_cache.get(device_number, (None, {}))
+        if frame is not image_data:
+            renders = {}
+            _preview_cache[device_number] = (image_data, renders)
+        if (size, fmt) not in renders:
+            renders[(size, fmt)] = render_preview(image_data, size, fmt)
+        return renders[(size, fmt)]
+
+
+# Non-standard endpoint: a small stretched preview of the last frame for dashboards.
+# Unlike ImageArray it does not consume the image, so any number of viewers can poll it.
+@router.get("/camera/{device_number}/preview")
+def get_preview(
+    device_number: int = Path(..., ge=0),
+    Size: int = Query(256, ge=16, le=4096),
+    Format: str = Query("png"),
+    ClientTransactionID: int = Query(0),
+):
+    validate_device("camera", device_number)
+    fmt = Format.lower()
+    if fmt == "jpg":
+        fmt = "jpeg"
+    if fmt not in PREVIEW_FORMATS:
+        raise AlpacaError(0x401, f"Invalid preview format {Format}, expected png or jpeg")
+
+    state = get_device_state("camera", device_number)
+    image_data = state.get("image_data")
+    if image_data is None:
+        raise AlpacaError(0x40D, "No image data available")
+
+    try:
+        content = get_preview_bytes(device_number, image_data, Size, fmt)
+    except RuntimeError as e:
+        raise AlpacaError(0x400, str(e))
+
+    return Response(
+        content=content,
+        media_type=f"image/{fmt}",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @router.put("/camera/{device_number}/startexposure", response_model=AlpacaResponse)
+@nonblocking
 def start_exposure(
     background_tasks: BackgroundTasks,
     device_number: int = Path(..., ge=0),
@@ -359,6 +631,7 @@ def start_exposure(
 
 
 @router.put("/camera/{device_number}/abortexposure", response_model=AlpacaResponse)
+@nonblocking
 def abort_exposure(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("camera", device_number)
     # state = get_device_state("camera", device_number)
@@ -389,6 +662,7 @@ def abort_exposure(device_number: int = Path(..., ge=0), ClientTransactionID: in
 
 
 @router.put("/camera/{device_number}/stopexposure", response_model=AlpacaResponse)
+@nonblocking
 def stop_exposure(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("camera", device_number)
     state = get_device_state("camera", device_number)
@@ -411,85 +685,9 @@ def stop_exposure(device_number: int = Path(..., ge=0), ClientTransactionID: int
 
 
 # Camera properties
-@router.get("/camera/{device_number}/cameraxsize", response_model=IntResponse)
-def get_cameraxsize(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("cameraxsize", 1024),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/cameraysize", response_model=IntResponse)
-def get_cameraysize(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("cameraysize", 1024),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/pixelsizex", response_model=DoubleResponse)
-def get_pixelsizex(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("pixelsizex", 5.4),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/pixelsizey", response_model=DoubleResponse)
-def get_pixelsizey(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("pixelsizey", 5.4),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/maxbinx", response_model=IntResponse)
-def get_maxbinx(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("maxbinx", 8),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/maxbiny", response_model=IntResponse)
-def get_maxbiny(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("maxbiny", 8),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 # Binning
-@router.get("/camera/{device_number}/binx", response_model=IntResponse)
-def get_binx(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("binx", 1),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/camera/{device_number}/binx", response_model=AlpacaResponse)
+@nonblocking
 def set_binx(
     device_number: int = Path(..., ge=0),
     BinX: int = Form(...),
@@ -506,18 +704,8 @@ def set_binx(
     )
 
 
-@router.get("/camera/{device_number}/biny", response_model=IntResponse)
-def get_biny(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("biny", 1),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/camera/{device_number}/biny", response_model=AlpacaResponse)
+@nonblocking
 def set_biny(
     device_number: int = Path(..., ge=0),
     BinY: int = Form(...),
@@ -535,29 +723,8 @@ def set_biny(
 
 
 # Readout modes
-@router.get("/camera/{device_number}/readoutmodes", response_model=StringArrayResponse)
-def get_readoutmodes(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return StringArrayResponse(
-        Value=state.get("readoutmodes", ["Fast", "Normal"]),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/readoutmode", response_model=IntResponse)
-def get_readoutmode(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("readoutmode", 0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/camera/{device_number}/readoutmode", response_model=AlpacaResponse)
+@nonblocking
 def set_readoutmode(
     device_number: int = Path(..., ge=0),
     ReadoutMode: int = Form(...),
@@ -576,165 +743,11 @@ def set_readoutmode(
 
 
 # Additional camera endpoints would go here...
-@router.get("/camera/{device_number}/percentcompleted", response_model=IntResponse)
-def get_percentcompleted(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("percentcompleted", 0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 # Bayer pattern support
-@router.get("/camera/{device_number}/bayeroffsetx", response_model=IntResponse)
-def get_bayeroffsetx(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("bayeroffsetx", 0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/bayeroffsety", response_model=IntResponse)
-def get_bayeroffsety(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("bayeroffsety", 0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 # Capability endpoints
-@router.get("/camera/{device_number}/canabortexposure", response_model=BoolResponse)
-def get_canabortexposure(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("canabortexposure", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/canasymmetricbin", response_model=BoolResponse)
-def get_canasymmetricbin(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("canasymmetricbin", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/canfastreadout", response_model=BoolResponse)
-def get_canfastreadout(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("canfastreadout", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/cangetcoolerpower", response_model=BoolResponse)
-def get_cangetcoolerpower(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("cangetcoolerpower", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/canpulseguide", response_model=BoolResponse)
-def get_canpulseguide(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("canpulseguide", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/cansetccdtemperature", response_model=BoolResponse)
-def get_cansetccdtemperature(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("cansetccdtemperature", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/canstopexposure", response_model=BoolResponse)
-def get_canstopexposure(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("canstopexposure", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 # Exposure limits and properties
-@router.get("/camera/{device_number}/exposuremax", response_model=DoubleResponse)
-def get_exposuremax(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("exposuremax", 3600.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/exposuremin", response_model=DoubleResponse)
-def get_exposuremin(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("exposuremin", 0.001),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/exposureresolution", response_model=DoubleResponse)
-def get_exposureresolution(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("exposureresolution", 0.001),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.get("/camera/{device_number}/lastexposureduration", response_model=DoubleResponse)
+@nonblocking
 def get_lastexposureduration(
     device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
 ):
@@ -750,6 +763,7 @@ def get_lastexposureduration(
 
 
 @router.get("/camera/{device_number}/lastexposurestarttime", response_model=StringResponse)
+@nonblocking
 def get_lastexposurestarttime(
     device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
 ):
@@ -766,100 +780,9 @@ def get_lastexposurestarttime(
 
 
 # Camera sensor properties
-@router.get("/camera/{device_number}/electronsperadu", response_model=DoubleResponse)
-def get_electronsperadu(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("electronsperadu", 1.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/fullwellcapacity", response_model=DoubleResponse)
-def get_fullwellcapacity(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("fullwellcapacity", 100000.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/hasshutter", response_model=BoolResponse)
-def get_hasshutter(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("hasshutter", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/maxadu", response_model=IntResponse)
-def get_maxadu(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("maxadu", 65535),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/sensorname", response_model=StringResponse)
-def get_sensorname(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return StringResponse(
-        Value=state.get("sensorname", "Simulated CCD"),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/sensortype", response_model=IntResponse)
-def get_sensortype(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("sensortype", SensorTypes.MONOCHROME),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 # Temperature control
-@router.get("/camera/{device_number}/ccdtemperature", response_model=DoubleResponse)
-def get_ccdtemperature(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("ccdtemperature", 20.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/camera/{device_number}/setccdtemperature", response_model=DoubleResponse)
-def get_setccdtemperature(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("setccdtemperature", 20.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/camera/{device_number}/setccdtemperature", response_model=AlpacaResponse)
+@nonblocking
 def set_ccdtemperature(
     device_number: int = Path(..., ge=0),
     SetCCDTemperature: float = Form(...),
@@ -891,18 +814,8 @@ def set_ccdtemperature(
     )
 
 
-@router.get("/camera/{device_number}/cooleron", response_model=BoolResponse)
-def get_cooleron(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("cooleron", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/camera/{device_number}/cooleron", response_model=AlpacaResponse)
+@nonblocking
 def set_cooleron(
     device_number: int = Path(..., ge=0),
     CoolerOn: bool = Form(...),
@@ -926,22 +839,12 @@ def set_cooleron(
     )
 
 
-@router.get("/camera/{device_number}/coolerpower", response_model=DoubleResponse)
-def get_coolerpower(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return DoubleResponse(
-        Value=state.get("coolerpower", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 # Gain control
 # This camera operates in "Gains" list mode: Gain returns the integer index into
 # the Gains list, and GainMin/GainMax must return PropertyNotImplemented because
 # the two modes (Gains list vs. numeric min/max) are mutually exclusive in ASCOM.
 @router.get("/camera/{device_number}/gain", response_model=IntResponse)
+@nonblocking
 def get_gain(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
     state = get_device_state("camera", device_number)
@@ -953,6 +856,7 @@ def get_gain(device_number: int = Path(..., ge=0), ClientTransactionID: int = Qu
 
 
 @router.put("/camera/{device_number}/gain", response_model=AlpacaResponse)
+@nonblocking
 def set_gain(
     device_number: int = Path(..., ge=0),
     Gain: int = Form(...),
@@ -974,33 +878,25 @@ def set_gain(
 
 
 @router.get("/camera/{device_number}/gainmax", response_model=IntResponse)
+@nonblocking
 def get_gainmax(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
     raise AlpacaError(0x400, "GainMax not implemented when Gains list is provided")
 
 
 @router.get("/camera/{device_number}/gainmin", response_model=IntResponse)
+@nonblocking
 def get_gainmin(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
     raise AlpacaError(0x400, "GainMin not implemented when Gains list is provided")
 
 
-@router.get("/camera/{device_number}/gains", response_model=StringArrayResponse)
-def get_gains(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return StringArrayResponse(
-        Value=state.get("gains", ["Low", "Medium", "High"]),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 # Offset control
 # This camera operates in "Offsets" list mode: Offset returns the integer index
 # into the Offsets list, and OffsetMin/OffsetMax must return PropertyNotImplemented
 # because the two modes are mutually exclusive in ASCOM.
 @router.get("/camera/{device_number}/offset", response_model=IntResponse)
+@nonblocking
 def get_offset(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
     state = get_device_state("camera", device_number)
@@ -1012,6 +908,7 @@ def get_offset(device_number: int = Path(..., ge=0), ClientTransactionID: int =
 
 
 @router.put("/camera/{device_number}/offset", response_model=AlpacaResponse)
+@nonblocking
 def set_offset(
     device_number: int = Path(..., ge=0),
     Offset: int = Form(...),
@@ -1033,30 +930,22 @@ def set_offset(
 
 
 @router.get("/camera/{device_number}/offsetmax", response_model=IntResponse)
+@nonblocking
 def get_offsetmax(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
     raise AlpacaError(0x400, "OffsetMax not implemented when Offsets list is provided")
 
 
 @router.get("/camera/{device_number}/offsetmin", response_model=IntResponse)
+@nonblocking
 def get_offsetmin(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
     raise AlpacaError(0x400, "OffsetMin not implemented when Offsets list is provided")
 
 
-@router.get("/camera/{device_number}/offsets", response_model=StringArrayResponse)
-def get_offsets(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return StringArrayResponse(
-        Value=state.get("offsets", ["Low", "Medium", "High"]),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 # Subframe control
 @router.get("/camera/{device_number}/numx", response_model=IntResponse)
+@nonblocking
 def get_numx(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
     state = get_device_state("camera", device_number)
@@ -1069,6 +958,7 @@ def get_numx(device_number: int = Path(..., ge=0), ClientTransactionID: int = Qu
 
 
 @router.put("/camera/{device_number}/numx", response_model=AlpacaResponse)
+@nonblocking
 def set_numx(
     device_number: int = Path(..., ge=0),
     NumX: int = Form(...),
@@ -1092,6 +982,7 @@ def set_numx(
 
 
 @router.get("/camera/{device_number}/numy", response_model=IntResponse)
+@nonblocking
 def get_numy(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
     state = get_device_state("camera", device_number)
@@ -1104,6 +995,7 @@ def get_numy(device_number: int = Path(..., ge=0), ClientTransactionID: int = Qu
 
 
 @router.put("/camera/{device_number}/numy", response_model=AlpacaResponse)
+@nonblocking
 def set_numy(
     device_number: int = Path(..., ge=0),
     NumY: int = Form(...),
@@ -1122,18 +1014,8 @@ def set_numy(
     )
 
 
-@router.get("/camera/{device_number}/startx", response_model=IntResponse)
-def get_startx(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("startx", 0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/camera/{device_number}/startx", response_model=AlpacaResponse)
+@nonblocking
 def set_startx(
     device_number: int = Path(..., ge=0),
     StartX: int = Form(...),
@@ -1152,18 +1034,8 @@ def set_startx(
     )
 
 
-@router.get("/camera/{device_number}/starty", response_model=IntResponse)
-def get_starty(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return IntResponse(
-        Value=state.get("starty", 0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/camera/{device_number}/starty", response_model=AlpacaResponse)
+@nonblocking
 def set_starty(
     device_number: int = Path(..., ge=0),
     StartY: int = Form(...),
@@ -1184,6 +1056,7 @@ def set_starty(
 
 # Fast readout mode
 @router.get("/camera/{device_number}/fastreadout", response_model=BoolResponse)
+@nonblocking
 def get_fastreadout(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("camera", device_number)
     state = get_device_state("camera", device_number)
@@ -1197,6 +1070,7 @@ def get_fastreadout(device_number: int = Path(..., ge=0), ClientTransactionID: i
 
 
 @router.put("/camera/{device_number}/fastreadout", response_model=AlpacaResponse)
+@nonblocking
 def set_fastreadout(
     device_number: int = Path(..., ge=0),
     FastReadout: bool = Form(...),
@@ -1218,6 +1092,7 @@ def set_fastreadout(
 
 # Heat sink temperature
 @router.get("/camera/{device_number}/heatsinktemperature", response_model=DoubleResponse)
+@nonblocking
 def get_heatsinktemperature(
     device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
 ):
@@ -1233,17 +1108,6 @@ def get_heatsinktemperature(
 
 
 # Pulse guiding
-@router.get("/camera/{device_number}/ispulseguiding", response_model=BoolResponse)
-def get_ispulseguiding(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("camera", device_number)
-    state = get_device_state("camera", device_number)
-    return BoolResponse(
-        Value=state.get("ispulseguiding", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 async def _pulseguide_task(device_number: int, duration_ms: int):
     """Hold IsPulseGuiding=True for the requested duration, then clear it."""
     try:
@@ -1253,6 +1117,7 @@ async def _pulseguide_task(device_number: int, duration_ms: int):
 
 
 @router.put("/camera/{device_number}/pulseguide", response_model=AlpacaResponse)
+@nonblocking
 def pulseguide(
     background_tasks: BackgroundTasks,
     device_number: int = Path(..., ge=0),
@@ -1287,24 +1152,30 @@ def pulseguide(
 
 
 # Sub-exposure duration
-# This simulator does not support sub-exposure stacking, so both get and set
-# return PropertyNotImplemented per ASCOM convention.
-@router.get("/camera/{device_number}/subexposureduration", response_model=DoubleResponse)
-def get_subexposureduration(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("camera", device_number)
-    raise AlpacaError(0x400, "SubExposureDuration is not implemented")
-
-
+# Exposures longer than SubExposureDuration are split into equal sub-exposures whose
+# reads are summed; 0 takes each exposure as a single frame.
 @router.put("/camera/{device_number}/subexposureduration", response_model=AlpacaResponse)
+@nonblocking
 def set_subexposureduration(
     device_number: int = Path(..., ge=0),
     SubExposureDuration: float = Form(...),
     ClientTransactionID: int = Form(0),
 ):
     validate_device("camera", device_number)
-    raise AlpacaError(0x400, "SubExposureDuration is not implemented")
+
+    state = get_device_state("camera", device_number)
+    exposure_max = state.get("exposuremax", 3600.0)
+    if SubExposureDuration < 0 or SubExposureDuration > exposure_max:
+        raise AlpacaError(
+            0x401, f"SubExposureDuration must be between 0 and {exposure_max} seconds"
+        )
+
+    update_device_state("camera", device_number, {"subexposureduration": SubExposureDuration})
+
+    return AlpacaResponse(
+        ClientTransactionID=ClientTransactionID,
+        ServerTransactionID=get_server_transaction_id(),
+    )
 
 
 # Deprecated endpoint for compatibility
@@ -1314,3 +1185,53 @@ def get_imagearrayvariant(
 ):
     """Deprecated - use imagearray instead"""
     return get_imagearray(device_number, ClientTransactionID)
+
+
+# Properties whose state key differs from the member name.
+PROPERTY_KEYS = {"camerastate": "camera_state", "imageready": "image_ready"}
+
+
+PROPERTIES = {
+    "camerastate": CameraStates.IDLE,
+    "imageready": False,
+    "cameraxsize": 1024,
+    "cameraysize": 1024,
+    "pixelsizex": 5.4,
+    "pixelsizey": 5.4,
+    "maxbinx": 8,
+    "maxbiny": 8,
+    "binx": 1,
+    "biny": 1,
+    "readoutmodes": ["Fast", "Normal"],
+    "readoutmode": 0,
+    "percentcompleted": 0,
+    "bayeroffsetx": 0,
+    "bayeroffsety": 0,
+    "canabortexposure": True,
+    "canasymmetricbin": True,
+    "canfastreadout": True,
+    "cangetcoolerpower": True,
+    "canpulseguide": True,
+    "cansetccdtemperature": True,
+    "canstopexposure": True,
+    "exposuremax": 3600.0,
+    "exposuremin": 0.001,
+    "exposureresolution": 0.001,
+    "electronsperadu": 1.0,
+    "fullwellcapacity": 100000.0,
+    "hasshutter": True,
+    "maxadu": 65535,
+    "sensorname": "Simulated CCD",
+    "sensortype": SensorTypes.MONOCHROME,
+    "ccdtemperature": 20.0,
+    "setccdtemperature": 20.0,
+    "cooleron": False,
+    "coolerpower": 0.0,
+    "gains": ["Low", "Medium", "High"],
+    "offsets": ["Low", "Medium", "High"],
+    "startx": 0,
+    "starty": 0,
+    "ispulseguiding": False,
+    "subexposureduration": 0.0,
+}
+add_property_routes(router, "camera", PROPERTIES, PROPERTY_KEYS)
@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 from importlib.metadata import version as _pkg_version
@@ -5,6 +6,8 @@ from typing import Any
 
 from fastapi import APIRouter, Form, Path, Query, Request
 
+from alpaca_simulators.api.forms import FORM_SCOPE_KEY, AlpacaRoute, cached_form, parse_form
+from alpaca_simulators.api.responses import static_value_response, value_response
 from alpaca_simulators.state import (
     AlpacaResponse,
     BoolResponse,
@@ -16,10 +19,13 @@ from alpaca_simulators.state import (
     get_device_state,
     get_server_transaction_id,
     update_device_state,
+    uses_state_server,
     validate_device_exists,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=AlpacaRoute)
+
+DRIVER_VERSION = _pkg_version("alpaca-simulators")
 
 
 # ASCOM Error Codes
@@ -36,45 +42,66 @@ def validate_device(device_type: str, device_number: int):
         raise AlpacaError(0x400, f"Device {device_type}:{device_number} not found")
 
 
+def nonblocking(handler):
+    """Run a handler that only reads or updates device state directly on the event loop.
+
+    FastAPI hands plain ``def`` handlers to the threadpool, which costs more than the
+    handler itself for a state read. With a state server every state access is a blocking
+    round trip to another process, so handlers are left on the threadpool there.
+    """
+    if uses_state_server():
+        return handler
+
+    @functools.wraps(handler)
+    async def run_on_loop(*args, **kwargs):
+        return handler(*args, **kwargs)
+
+    return run_on_loop
+
+
+def config_value_response(
+    device_type: str,
+    device_number: int,
+    member: str,
+    model: type[AlpacaResponse],
+    default: Any,
+    client_transaction_id: int,
+):
+    """Respond with a member's configured value, encoded once per config load."""
+
+    def compute():
+        validate_device(device_type, device_number)
+        return get_device_config(device_type, device_number).get(member, default)
+
+    return static_value_response(
+        (device_type, device_number, member), model, compute, client_transaction_id
+    )
+
+
 async def get_form_data(request: Request) -> dict[str, Any]:
     """Extract form data or JSON data from request"""
-    content_type = request.headers.get("content-type", "")
-
-    try:
-        if "application/x-www-form-urlencoded" in content_type:
-            # Handle form data
-            form_data = await request.form()
-            return dict(form_data)
-        elif "application/json" in content_type:
-            # Handle JSON data
-            body = await request.body()
-            if body:
-                return json.loads(body)
-        else:
-            # For other content types or no content type, try form first
+    form = cached_form(request.scope)
+    if form is None:
+        content_type = request.headers.get("content-type", "").partition(";")[0].strip().lower()
+        if content_type == "multipart/form-data":
+            return dict(await request.form())
+
+        body = await request.body()
+        if content_type == "application/json" or body[:1] in (b"{", b"["):
             try:
-                form_data = await request.form()
-                return dict(form_data)
-            except Exception as e:
-                # If form parsing fails, try JSON
-                logging.debug(f"Failed to parse form data: {e}. Trying JSON...")
-                try:
-                    body = await request.body()
-                    if body:
-                        return json.loads(body)
-                except Exception as e:
-                    logging.debug(f"Failed to parse JSON data: {e}")
-                    pass
-    except Exception as e:
-        # If all parsing fails, return empty dict
-        logging.debug(f"Failed to parse request data: {e}")
-        pass
-
-    return {}
+                return json.loads(body)
+            except ValueError as e:
+                logging.debug(f"Failed to parse JSON data: {e}")
+                return {}
+
+        form = parse_form(body)
+        request.scope[FORM_SCOPE_KEY] = form
+    return dict(form)
 
 
 # Common endpoints that exist for all device types
 @router.get("/{device_type}/{device_number}/connected", response_model=BoolResponse)
+@nonblocking
 def get_connected(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
@@ -82,10 +109,11 @@ def get_connected(
 ):
     validate_device(device_type, device_number)
     state = get_device_state(device_type, device_number)
-    return BoolResponse(
-        Value=state.get("connected", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
+    return value_response(
+        BoolResponse,
+        state.get("connected", False),
+        ClientTransactionID,
+        get_server_transaction_id(),
     )
 
 
@@ -124,77 +152,82 @@ async def set_connected(
 
 
 @router.get("/{device_type}/{device_number}/description", response_model=StringResponse)
+@nonblocking
 def get_description(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
     ClientTransactionID: int = Query(0),
 ):
-    validate_device(device_type, device_number)
-    cfg = get_device_config(device_type, device_number)
-    return StringResponse(
-        Value=cfg.get("description", f"Simulated {device_type.title()} Device"),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
+    return config_value_response(
+        device_type,
+        device_number,
+        "description",
+        StringResponse,
+        f"Simulated {device_type.title()} Device",
+        ClientTransactionID,
     )
 
 
 @router.get("/{device_type}/{device_number}/driverinfo", response_model=StringResponse)
+@nonblocking
 def get_driverinfo(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
     ClientTransactionID: int = Query(0),
 ):
-    validate_device(device_type, device_number)
-    cfg = get_device_config(device_type, device_number)
-    return StringResponse(
-        Value=cfg.get("driverinfo", "ASCOM Alpaca Observatory Simulator Driver v1.0"),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
+    return config_value_response(
+        device_type,
+        device_number,
+        "driverinfo",
+        StringResponse,
+        "ASCOM Alpaca Observatory Simulator Driver v1.0",
+        ClientTransactionID,
     )
 
 
 @router.get("/{device_type}/{device_number}/driverversion", response_model=StringResponse)
+@nonblocking
 def get_driverversion(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
     ClientTransactionID: int = Query(0),
 ):
-    validate_device(device_type, device_number)
-    cfg = get_device_config(device_type, device_number)
-    return StringResponse(
-        Value=cfg.get("driverversion", _pkg_version("alpaca-simulators")),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
+    return config_value_response(
+        device_type,
+        device_number,
+        "driverversion",
+        StringResponse,
+        DRIVER_VERSION,
+        ClientTransactionID,
     )
 
 
 @router.get("/{device_type}/{device_number}/interfaceversion", response_model=IntResponse)
+@nonblocking
 def get_interfaceversion(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
     ClientTransactionID: int = Query(0),
 ):
-    validate_device(device_type, device_number)
-    cfg = get_device_config(device_type, device_number)
-    return IntResponse(
-        Value=cfg.get("interfaceversion", 3),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
+    return config_value_response(
+        device_type, device_number, "interfaceversion", IntResponse, 3, ClientTransactionID
     )
 
 
 @router.get("/{device_type}/{device_number}/name", response_model=StringResponse)
+@nonblocking
 def get_name(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
     ClientTransactionID: int = Query(0),
 ):
-    validate_device(device_type, device_number)
-    cfg = get_device_config(device_type, device_number)
-    return StringResponse(
-        Value=cfg.get("name", f"Simulator {device_type.title()} #{device_number}"),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
+    return config_value_response(
+        device_type,
+        device_number,
+        "name",
+        StringResponse,
+        f"Simulator {device_type.title()} #{device_number}",
+        ClientTransactionID,
     )
 
 
@@ -202,21 +235,25 @@ def get_name(
     "/{device_type}/{device_number}/supportedactions",
     response_model=StringArrayResponse,
 )
+@nonblocking
 def get_supportedactions(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
     ClientTransactionID: int = Query(0),
 ):
-    validate_device(device_type, device_number)
     # Return empty list for simulator - no custom actions supported
-    return StringArrayResponse(
-        Value=[],
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
+    return config_value_response(
+        device_type,
+        device_number,
+        "supportedactions",
+        StringArrayResponse,
+        [],
+        ClientTransactionID,
     )
 
 
 @router.put("/{device_type}/{device_number}/action", response_model=StringResponse)
+@nonblocking
 def action(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
@@ -236,6 +273,7 @@ def action(
 
 
 @router.put("/{device_type}/{device_number}/commandblind", response_model=AlpacaResponse)
+@nonblocking
 def commandblind(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
@@ -254,6 +292,7 @@ def commandblind(
 
 
 @router.put("/{device_type}/{device_number}/commandbool", response_model=BoolResponse)
+@nonblocking
 def commandbool(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
@@ -273,6 +312,7 @@ def commandbool(
 
 
 @router.put("/{device_type}/{device_number}/commandstring", response_model=StringResponse)
+@nonblocking
 def commandstring(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
@@ -293,6 +333,7 @@ def commandstring(
 
 # Platform 7 methods
 @router.put("/{device_type}/{device_number}/connect", response_model=AlpacaResponse)
+@nonblocking
 def connect(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
@@ -309,6 +350,7 @@ def connect(
 
 
 @router.get("/{device_type}/{device_number}/connecting", response_model=BoolResponse)
+@nonblocking
 def get_connecting(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
@@ -324,6 +366,7 @@ def get_connecting(
 
 
 @router.put("/{device_type}/{device_number}/disconnect", response_model=AlpacaResponse)
+@nonblocking
 def disconnect(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
@@ -340,6 +383,7 @@ def disconnect(
 
 
 @router.get("/{device_type}/{device_number}/devicestate", response_model=DeviceStateResponse)
+@nonblocking
 def get_devicestate(
     device_type: str = Path(...),
     device_number: int = Path(..., ge=0),
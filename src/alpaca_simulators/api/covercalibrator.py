@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Form, Path, Query
 
-from alpaca_simulators.api.common import AlpacaError, validate_device
+from alpaca_simulators.api.common import AlpacaError, nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
+from alpaca_simulators.api.properties import add_property_routes
 from alpaca_simulators.state import (
     AlpacaResponse,
-    BoolResponse,
     CalibratorStatus,
     CoverStatus,
     IntResponse,
@@ -12,7 +13,7 @@ from alpaca_simulators.state import (
     update_device_state,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=AlpacaRoute)
 
 
 def _require_calibrator(state):
@@ -22,6 +23,7 @@ def _require_calibrator(state):
 
 
 @router.get("/covercalibrator/{device_number}/brightness", response_model=IntResponse)
+@nonblocking
 def get_brightness(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("covercalibrator", device_number)
     state = get_device_state("covercalibrator", device_number)
@@ -33,53 +35,8 @@ def get_brightness(device_number: int = Path(..., ge=0), ClientTransactionID: in
     )
 
 
-@router.get("/covercalibrator/{device_number}/calibratorchanging", response_model=BoolResponse)
-def get_calibratorchanging(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("covercalibrator", device_number)
-    state = get_device_state("covercalibrator", device_number)
-    return BoolResponse(
-        Value=state.get("calibratorchanging", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/covercalibrator/{device_number}/calibratorstate", response_model=IntResponse)
-def get_calibratorstate(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("covercalibrator", device_number)
-    state = get_device_state("covercalibrator", device_number)
-    return IntResponse(
-        Value=state.get("calibratorstate", CalibratorStatus.NOT_PRESENT),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/covercalibrator/{device_number}/covermoving", response_model=BoolResponse)
-def get_covermoving(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("covercalibrator", device_number)
-    state = get_device_state("covercalibrator", device_number)
-    return BoolResponse(
-        Value=state.get("covermoving", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/covercalibrator/{device_number}/coverstate", response_model=IntResponse)
-def get_coverstate(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("covercalibrator", device_number)
-    state = get_device_state("covercalibrator", device_number)
-    return IntResponse(
-        Value=state.get("coverstate", CoverStatus.CLOSED),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.get("/covercalibrator/{device_number}/maxbrightness", response_model=IntResponse)
+@nonblocking
 def get_maxbrightness(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("covercalibrator", device_number)
     state = get_device_state("covercalibrator", device_number)
@@ -92,6 +49,7 @@ def get_maxbrightness(device_number: int = Path(..., ge=0), ClientTransactionID:
 
 
 @router.put("/covercalibrator/{device_number}/calibratoroff", response_model=AlpacaResponse)
+@nonblocking
 def calibratoroff(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("covercalibrator", device_number)
     state = get_device_state("covercalibrator", device_number)
@@ -114,6 +72,7 @@ def calibratoroff(device_number: int = Path(..., ge=0), ClientTransactionID: int
 
 
 @router.put("/covercalibrator/{device_number}/calibratoron", response_model=AlpacaResponse)
+@nonblocking
 def calibratoron(
     device_number: int = Path(..., ge=0),
     Brightness: int = Form(...),
@@ -144,6 +103,7 @@ def calibratoron(
 
 
 @router.put("/covercalibrator/{device_number}/closecover", response_model=AlpacaResponse)
+@nonblocking
 def closecover(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("covercalibrator", device_number)
     # state = get_device_state("covercalibrator", device_number)
@@ -164,6 +124,7 @@ def closecover(device_number: int = Path(..., ge=0), ClientTransactionID: int =
 
 
 @router.put("/covercalibrator/{device_number}/haltcover", response_model=AlpacaResponse)
+@nonblocking
 def haltcover(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("covercalibrator", device_number)
     # OpenCover and CloseCover complete synchronously in this simulator, so per
@@ -172,6 +133,7 @@ def haltcover(device_number: int = Path(..., ge=0), ClientTransactionID: int = F
 
 
 @router.put("/covercalibrator/{device_number}/opencover", response_model=AlpacaResponse)
+@nonblocking
 def opencover(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("covercalibrator", device_number)
     # state = get_device_state("covercalibrator", device_number)
@@ -189,3 +151,12 @@ def opencover(device_number: int = Path(..., ge=0), ClientTransactionID: int = F
         ClientTransactionID=ClientTransactionID,
         ServerTransactionID=get_server_transaction_id(),
     )
+
+
+PROPERTIES = {
+    "calibratorchanging": False,
+    "calibratorstate": CalibratorStatus.NOT_PRESENT,
+    "covermoving": False,
+    "coverstate": CoverStatus.CLOSED,
+}
+add_property_routes(router, "covercalibrator", PROPERTIES)
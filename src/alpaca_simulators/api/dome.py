@@ -1,20 +1,19 @@
 import asyncio
 
-from fastapi import APIRouter, BackgroundTasks, Form, Path, Query
+from fastapi import APIRouter, BackgroundTasks, Form, Path
 
-from alpaca_simulators.api.common import AlpacaError, validate_device
+from alpaca_simulators.api.common import AlpacaError, nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
+from alpaca_simulators.api.properties import add_property_routes
 from alpaca_simulators.state import (
     AlpacaResponse,
-    BoolResponse,
-    DoubleResponse,
-    IntResponse,
     ShutterState,
     get_device_state,
     get_server_transaction_id,
     update_device_state,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=AlpacaRoute)
 
 # How long a simulated dome slew/find-home/park takes. Kept above ConformU's
 # 3-second "is it slewing?" check so AbortSlew tests can observe Slewing=True.
@@ -45,165 +44,8 @@ def _begin_slew(device_number: int, axis: str, target: float, background_tasks:
     background_tasks.add_task(_slew_task, device_number, axis, target, new_gen)
 
 
-@router.get("/dome/{device_number}/altitude", response_model=DoubleResponse)
-def get_altitude(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    # if not state.get("connected"):
-    # raise AlpacaError(0x407, "Device is not connected")
-    return DoubleResponse(
-        Value=state.get("altitude", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/athome", response_model=BoolResponse)
-def get_athome(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("athome", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/atpark", response_model=BoolResponse)
-def get_atpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("atpark", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/azimuth", response_model=DoubleResponse)
-def get_azimuth(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    # if not state.get("connected"):
-    # raise AlpacaError(0x407, "Device is not connected")
-    return DoubleResponse(
-        Value=state.get("azimuth", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/canfindhome", response_model=BoolResponse)
-def get_canfindhome(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("canfindhome", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/canpark", response_model=BoolResponse)
-def get_canpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("canpark", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/cansetaltitude", response_model=BoolResponse)
-def get_cansetaltitude(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("cansetaltitude", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/cansetazimuth", response_model=BoolResponse)
-def get_cansetazimuth(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("cansetazimuth", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/cansetpark", response_model=BoolResponse)
-def get_cansetpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("cansetpark", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/cansetshutter", response_model=BoolResponse)
-def get_cansetshutter(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("cansetshutter", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/canslave", response_model=BoolResponse)
-def get_canslave(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("canslave", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/cansyncazimuth", response_model=BoolResponse)
-def get_cansyncazimuth(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("cansyncazimuth", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/shutterstatus", response_model=IntResponse)
-def get_shutterstatus(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return IntResponse(
-        Value=state.get("shutterstatus", ShutterState.CLOSED),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/dome/{device_number}/slaved", response_model=BoolResponse)
-def get_slaved(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("slaved", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/dome/{device_number}/slaved", response_model=AlpacaResponse)
+@nonblocking
 def set_slaved(
     device_number: int = Path(..., ge=0),
     Slaved: bool = Form(...),
@@ -223,21 +65,11 @@ def set_slaved(
     )
 
 
-@router.get("/dome/{device_number}/slewing", response_model=BoolResponse)
-def get_slewing(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("dome", device_number)
-    state = get_device_state("dome", device_number)
-    return BoolResponse(
-        Value=state.get("slewing", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 # Action methods
 
 
 @router.put("/dome/{device_number}/abortslew", response_model=AlpacaResponse)
+@nonblocking
 def abortslew(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("dome", device_number)
 
@@ -256,6 +88,7 @@ def abortslew(device_number: int = Path(..., ge=0), ClientTransactionID: int = F
 
 
 @router.put("/dome/{device_number}/closeshutter", response_model=AlpacaResponse)
+@nonblocking
 def closeshutter(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("dome", device_number)
     # state = get_device_state("dome", device_number)
@@ -272,6 +105,7 @@ def closeshutter(device_number: int = Path(..., ge=0), ClientTransactionID: int
 
 
 @router.put("/dome/{device_number}/findhome", response_model=AlpacaResponse)
+@nonblocking
 def findhome(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("dome", device_number)
     # state = get_device_state("dome", device_number)
@@ -288,6 +122,7 @@ def findhome(device_number: int = Path(..., ge=0), ClientTransactionID: int = Fo
 
 
 @router.put("/dome/{device_number}/openshutter", response_model=AlpacaResponse)
+@nonblocking
 def openshutter(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("dome", device_number)
     # state = get_device_state("dome", device_number)
@@ -304,6 +139,7 @@ def openshutter(device_number: int = Path(..., ge=0), ClientTransactionID: int =
 
 
 @router.put("/dome/{device_number}/park", response_model=AlpacaResponse)
+@nonblocking
 def park(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("dome", device_number)
     # state = get_device_state("dome", device_number)
@@ -327,6 +163,7 @@ def park(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0
 
 
 @router.put("/dome/{device_number}/setpark", response_model=AlpacaResponse)
+@nonblocking
 def setpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("dome", device_number)
     state = get_device_state("dome", device_number)
@@ -345,6 +182,7 @@ def setpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = For
 
 
 @router.put("/dome/{device_number}/slewtoaltitude", response_model=AlpacaResponse)
+@nonblocking
 def slewtoaltitude(
     background_tasks: BackgroundTasks,
     device_number: int = Path(..., ge=0),
@@ -365,6 +203,7 @@ def slewtoaltitude(
 
 
 @router.put("/dome/{device_number}/slewtoazimuth", response_model=AlpacaResponse)
+@nonblocking
 def slewtoazimuth(
     background_tasks: BackgroundTasks,
     device_number: int = Path(..., ge=0),
@@ -385,6 +224,7 @@ def slewtoazimuth(
 
 
 @router.put("/dome/{device_number}/synctoazimuth", response_model=AlpacaResponse)
+@nonblocking
 def synctoazimuth(
     device_number: int = Path(..., ge=0),
     Azimuth: float = Form(...),
@@ -402,3 +242,23 @@ def synctoazimuth(
         ClientTransactionID=ClientTransactionID,
         ServerTransactionID=get_server_transaction_id(),
     )
+
+
+PROPERTIES = {
+    "altitude": 0.0,
+    "athome": False,
+    "atpark": False,
+    "azimuth": 0.0,
+    "canfindhome": True,
+    "canpark": True,
+    "cansetaltitude": True,
+    "cansetazimuth": True,
+    "cansetpark": True,
+    "cansetshutter": True,
+    "canslave": True,
+    "cansyncazimuth": True,
+    "shutterstatus": ShutterState.CLOSED,
+    "slaved": False,
+    "slewing": False,
+}
+add_property_routes(router, "dome", PROPERTIES)
@@ -1,53 +1,20 @@
-from fastapi import APIRouter, Form, Path, Query
+from fastapi import APIRouter, Form, Path
 
-from alpaca_simulators.api.common import AlpacaError, validate_device
+from alpaca_simulators.api.common import AlpacaError, nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
+from alpaca_simulators.api.properties import add_property_routes
 from alpaca_simulators.state import (
     AlpacaResponse,
-    IntArrayResponse,
-    IntResponse,
-    StringArrayResponse,
     get_device_state,
     get_server_transaction_id,
     update_device_state,
 )
 
-router = APIRouter()
-
-
-@router.get("/filterwheel/{device_number}/focusoffsets", response_model=IntArrayResponse)
-def get_focusoffsets(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("filterwheel", device_number)
-    state = get_device_state("filterwheel", device_number)
-    return IntArrayResponse(
-        Value=state.get("focusoffsets", []),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/filterwheel/{device_number}/names", response_model=StringArrayResponse)
-def get_names(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("filterwheel", device_number)
-    state = get_device_state("filterwheel", device_number)
-    return StringArrayResponse(
-        Value=state.get("names", []),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/filterwheel/{device_number}/position", response_model=IntResponse)
-def get_position(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("filterwheel", device_number)
-    state = get_device_state("filterwheel", device_number)
-    return IntResponse(
-        Value=state.get("position", 0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
+router = APIRouter(route_class=AlpacaRoute)
 
 
 @router.put("/filterwheel/{device_number}/position", response_model=AlpacaResponse)
+@nonblocking
 def set_position(
     device_number: int = Path(..., ge=0),
     Position: int = Form(...),
@@ -67,3 +34,11 @@ def set_position(
         ClientTransactionID=ClientTransactionID,
         ServerTransactionID=get_server_transaction_id(),
     )
+
+
+PROPERTIES = {
+    "focusoffsets": [],
+    "names": [],
+    "position": 0,
+}
+add_property_routes(router, "filterwheel", PROPERTIES)
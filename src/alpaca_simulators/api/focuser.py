@@ -1,97 +1,20 @@
-from fastapi import APIRouter, Form, Path, Query
+from fastapi import APIRouter, Form, Path
 
-from alpaca_simulators.api.common import AlpacaError, validate_device
+from alpaca_simulators.api.common import AlpacaError, nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
+from alpaca_simulators.api.properties import add_property_routes
 from alpaca_simulators.state import (
     AlpacaResponse,
-    BoolResponse,
-    DoubleResponse,
-    IntResponse,
     get_device_state,
     get_server_transaction_id,
     update_device_state,
 )
 
-router = APIRouter()
-
-
-@router.get("/focuser/{device_number}/absolute", response_model=BoolResponse)
-def get_absolute(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("focuser", device_number)
-    state = get_device_state("focuser", device_number)
-    return BoolResponse(
-        Value=state.get("absolute", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/focuser/{device_number}/ismoving", response_model=BoolResponse)
-def get_ismoving(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("focuser", device_number)
-    state = get_device_state("focuser", device_number)
-    return BoolResponse(
-        Value=state.get("ismoving", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/focuser/{device_number}/maxincrement", response_model=IntResponse)
-def get_maxincrement(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("focuser", device_number)
-    state = get_device_state("focuser", device_number)
-    return IntResponse(
-        Value=state.get("maxincrement", 1000),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/focuser/{device_number}/maxstep", response_model=IntResponse)
-def get_maxstep(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("focuser", device_number)
-    state = get_device_state("focuser", device_number)
-    return IntResponse(
-        Value=state.get("maxstep", 100000),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/focuser/{device_number}/position", response_model=IntResponse)
-def get_position(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("focuser", device_number)
-    state = get_device_state("focuser", device_number)
-    return IntResponse(
-        Value=state.get("position", 50000),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/focuser/{device_number}/stepsize", response_model=DoubleResponse)
-def get_stepsize(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("focuser", device_number)
-    state = get_device_state("focuser", device_number)
-    return DoubleResponse(
-        Value=state.get("stepsize", 1.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/focuser/{device_number}/tempcomp", response_model=BoolResponse)
-def get_tempcomp(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("focuser", device_number)
-    state = get_device_state("focuser", device_number)
-    return BoolResponse(
-        Value=state.get("tempcomp", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
+router = APIRouter(route_class=AlpacaRoute)
 
 
 @router.put("/focuser/{device_number}/tempcomp", response_model=AlpacaResponse)
+@nonblocking
 def set_tempcomp(
     device_number: int = Path(..., ge=0),
     TempComp: bool = Form(...),
@@ -115,31 +38,8 @@ def set_tempcomp(
     )
 
 
-@router.get("/focuser/{device_number}/tempcompavailable", response_model=BoolResponse)
-def get_tempcompavailable(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("focuser", device_number)
-    state = get_device_state("focuser", device_number)
-    return BoolResponse(
-        Value=state.get("tempcompavailable", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/focuser/{device_number}/temperature", response_model=DoubleResponse)
-def get_temperature(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("focuser", device_number)
-    state = get_device_state("focuser", device_number)
-    return DoubleResponse(
-        Value=state.get("temperature", 20.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/focuser/{device_number}/halt", response_model=AlpacaResponse)
+@nonblocking
 def halt(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("focuser", device_number)
     # state = get_device_state("focuser", device_number)
@@ -156,6 +56,7 @@ def halt(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0
 
 
 @router.put("/focuser/{device_number}/move", response_model=AlpacaResponse)
+@nonblocking
 def move(
     device_number: int = Path(..., ge=0),
     Position: int = Form(...),
@@ -183,3 +84,17 @@ def move(
         ClientTransactionID=ClientTransactionID,
         ServerTransactionID=get_server_transaction_id(),
     )
+
+
+PROPERTIES = {
+    "absolute": True,
+    "ismoving": False,
+    "maxincrement": 1000,
+    "maxstep": 100000,
+    "position": 50000,
+    "stepsize": 1.0,
+    "tempcomp": False,
+    "tempcompavailable": True,
+    "temperature": 20.0,
+}
+add_property_routes(router, "focuser", PROPERTIES)
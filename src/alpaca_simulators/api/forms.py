@@ -0,0 +1,109 @@
+"""
+Alpaca PUT body parsing.
+
+Alpaca clients send PUT parameters as ``application/x-www-form-urlencoded`` bodies, and
+the spec makes parameter names case-insensitive (``clienttransactionid`` and
+``ClientTransactionID`` are the same parameter). Device routers use ``AlpacaRoute``, whose
+requests parse such bodies with a small parser instead of python-multipart, match
+parameter names against the names the handler declares with ``Form(...)`` regardless of
+case, and leave typed coercion to those declarations as before.
+
+The parsed form is cached in the request scope, so the exception handlers can read the
+ClientTransactionID of a failed PUT without parsing the body again.
+"""
+
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import unquote_plus
+
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+from starlette.datastructures import FormData
+from starlette.requests import Request
+
+# Request scope key holding the parsed form body.
+FORM_SCOPE_KEY = "alpaca.form"
+
+MAX_FIELDS = 1000
+
+
+def _unquote(text: str) -> str:
+    return unquote_plus(text) if "%" in text or "+" in text else text
+
+
+def parse_form(body: bytes, max_fields: int | float = MAX_FIELDS) -> FormData:
+    """Parse an ``application/x-www-form-urlencoded`` body as Starlette would."""
+    items = []
+    if body:
+        fields = body.decode("latin-1").split("&")
+        if len(fields) > max_fields:
+            raise HTTPException(
+                status_code=400, detail=f"Too many fields. Maximum is {max_fields}"
+            )
+        for field in fields:
+            if field:
+                name, _, value = field.partition("=")
+                items.append((_unquote(name), _unquote(value)))
+    return FormData(items)
+
+
+def cached_form(scope: dict) -> FormData | None:
+    """The form body already parsed for this request, if any."""
+    return scope.get(FORM_SCOPE_KEY)
+
+
+def get_parameter(request: Request, name: str, default: Any = None) -> Any:
+    """Look a parameter up in the query string, then the parsed form, ignoring case."""
+    name = name.lower()
+    sources = [request.query_params]
+    form = cached_form(request.scope)
+    if form is not None:
+        sources.append(form)
+    for source in sources:
+        for key, value in source.multi_items():
+            if key.lower() == name:
+                return value
+    return default
+
+
+class AlpacaRequest(Request):
+    """Request whose form body is parsed by ``parse_form`` with case-insensitive names."""
+
+    def __init__(self, scope, receive, names: dict[str, str]):
+        super().__init__(scope, receive)
+        self.names = names
+
+    async def _get_form(self, **limits) -> FormData:
+        if self._form is None:
+            form = cached_form(self.scope)
+            if form is None:
+                content_type = self.headers.get("content-type", "")
+                if content_type.partition(";")[0].strip().lower() == (
+                    "application/x-www-form-urlencoded"
+                ):
+                    form = parse_form(await self.body(), limits.get("max_fields", MAX_FIELDS))
+                else:
+                    form = await super()._get_form(**limits)
+                self.scope[FORM_SCOPE_KEY] = form
+            names = self.names
+            self._form = FormData(
+                [(names.get(key.lower(), key), value) for key, value in form.multi_items()]
+            )
+        return self._form
+
+
+class AlpacaRoute(APIRoute):
+    """Route class for device routers, handing form handlers an ``AlpacaRequest``."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        names = {param.alias.lower(): param.alias for param in self.dependant.body_params}
+        if not names:
+            return handler
+
+        async def alpaca_route_handler(request: Request):
+            # Handlers only read the request; the response goes out through the route's
+            # own send, so the new request keeps Starlette's default one.
+            return await handler(AlpacaRequest(request.scope, request.receive, names))
+
+        return alpaca_route_handler
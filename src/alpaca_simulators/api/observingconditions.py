@@ -1,30 +1,21 @@
 from fastapi import APIRouter, Form, Path, Query
 
-from alpaca_simulators.api.common import AlpacaError, validate_device
+from alpaca_simulators.api.common import AlpacaError, nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
+from alpaca_simulators.api.properties import add_property_routes
 from alpaca_simulators.state import (
     AlpacaResponse,
     DoubleResponse,
     StringResponse,
-    get_device_state,
     get_server_transaction_id,
     update_device_state,
 )
 
-router = APIRouter()
-
-
-@router.get("/observingconditions/{device_number}/averageperiod", response_model=DoubleResponse)
-def get_averageperiod(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("averageperiod", 60.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
+router = APIRouter(route_class=AlpacaRoute)
 
 
 @router.put("/observingconditions/{device_number}/averageperiod", response_model=AlpacaResponse)
+@nonblocking
 def set_averageperiod(
     device_number: int = Path(..., ge=0),
     AveragePeriod: float = Form(...),
@@ -45,18 +36,8 @@ def set_averageperiod(
     )
 
 
-@router.get("/observingconditions/{device_number}/cloudcover", response_model=DoubleResponse)
-def get_cloudcover(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("cloudcover", 0.2),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/cloudcover", response_model=AlpacaResponse)
+@nonblocking
 def set_cloudcover(
     device_number: int = Path(..., ge=0),
     CloudCover: float = Form(...),
@@ -79,18 +60,8 @@ def set_cloudcover(
     )
 
 
-@router.get("/observingconditions/{device_number}/dewpoint", response_model=DoubleResponse)
-def get_dewpoint(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("dewpoint", 5.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/dewpoint", response_model=AlpacaResponse)
+@nonblocking
 def set_dewpoint(
     device_number: int = Path(..., ge=0),
     DewPoint: float = Form(...),
@@ -113,18 +84,8 @@ def set_dewpoint(
     )
 
 
-@router.get("/observingconditions/{device_number}/humidity", response_model=DoubleResponse)
-def get_humidity(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("humidity", 60.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/humidity", response_model=AlpacaResponse)
+@nonblocking
 def set_humidity(
     device_number: int = Path(..., ge=0),
     Humidity: float = Form(...),
@@ -147,18 +108,8 @@ def set_humidity(
     )
 
 
-@router.get("/observingconditions/{device_number}/pressure", response_model=DoubleResponse)
-def get_pressure(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("pressure", 1013.25),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/pressure", response_model=AlpacaResponse)
+@nonblocking
 def set_pressure(
     device_number: int = Path(..., ge=0),
     Pressure: float = Form(...),
@@ -181,18 +132,8 @@ def set_pressure(
     )
 
 
-@router.get("/observingconditions/{device_number}/rainrate", response_model=DoubleResponse)
-def get_rainrate(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("rainrate", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/rainrate", response_model=AlpacaResponse)
+@nonblocking
 def set_rainrate(
     device_number: int = Path(..., ge=0),
     RainRate: float = Form(...),
@@ -215,18 +156,8 @@ def set_rainrate(
     )
 
 
-@router.get("/observingconditions/{device_number}/skybrightness", response_model=DoubleResponse)
-def get_skybrightness(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("skybrightness", 18.5),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/skybrightness", response_model=AlpacaResponse)
+@nonblocking
 def set_skybrightness(
     device_number: int = Path(..., ge=0),
     SkyBrightness: float = Form(...),
@@ -251,18 +182,8 @@ def set_skybrightness(
     )
 
 
-@router.get("/observingconditions/{device_number}/skyquality", response_model=DoubleResponse)
-def get_skyquality(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("skyquality", 20.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/skyquality", response_model=AlpacaResponse)
+@nonblocking
 def set_skyquality(
     device_number: int = Path(..., ge=0),
     SkyQuality: float = Form(...),
@@ -285,18 +206,8 @@ def set_skyquality(
     )
 
 
-@router.get("/observingconditions/{device_number}/skytemperature", response_model=DoubleResponse)
-def get_skytemperature(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("skytemperature", -10.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/skytemperature", response_model=AlpacaResponse)
+@nonblocking
 def set_skytemperature(
     device_number: int = Path(..., ge=0),
     SkyTemperature: float = Form(...),
@@ -316,18 +227,8 @@ def set_skytemperature(
     )
 
 
-@router.get("/observingconditions/{device_number}/starfwhm", response_model=DoubleResponse)
-def get_starfwhm(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("starfwhm", 2.5),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/starfwhm", response_model=AlpacaResponse)
+@nonblocking
 def set_starfwhm(
     device_number: int = Path(..., ge=0),
     StarFWHM: float = Form(...),
@@ -350,18 +251,8 @@ def set_starfwhm(
     )
 
 
-@router.get("/observingconditions/{device_number}/temperature", response_model=DoubleResponse)
-def get_temperature(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("temperature", 15.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/temperature", response_model=AlpacaResponse)
+@nonblocking
 def set_temperature(
     device_number: int = Path(..., ge=0),
     Temperature: float = Form(...),
@@ -384,18 +275,8 @@ def set_temperature(
     )
 
 
-@router.get("/observingconditions/{device_number}/winddirection", response_model=DoubleResponse)
-def get_winddirection(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("winddirection", 180.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/winddirection", response_model=AlpacaResponse)
+@nonblocking
 def set_winddirection(
     device_number: int = Path(..., ge=0),
     WindDirection: float = Form(...),
@@ -418,18 +299,8 @@ def set_winddirection(
     )
 
 
-@router.get("/observingconditions/{device_number}/windgust", response_model=DoubleResponse)
-def get_windgust(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("windgust", 5.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/windgust", response_model=AlpacaResponse)
+@nonblocking
 def set_windgust(
     device_number: int = Path(..., ge=0),
     WindGust: float = Form(...),
@@ -452,18 +323,8 @@ def set_windgust(
     )
 
 
-@router.get("/observingconditions/{device_number}/windspeed", response_model=DoubleResponse)
-def get_windspeed(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("observingconditions", device_number)
-    state = get_device_state("observingconditions", device_number)
-    return DoubleResponse(
-        Value=state.get("windspeed", 3.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/observingconditions/{device_number}/windspeed", response_model=AlpacaResponse)
+@nonblocking
 def set_windspeed(
     device_number: int = Path(..., ge=0),
     WindSpeed: float = Form(...),
@@ -487,6 +348,7 @@ def set_windspeed(
 
 
 @router.put("/observingconditions/{device_number}/refresh", response_model=AlpacaResponse)
+@nonblocking
 def refresh(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("observingconditions", device_number)
     # state = get_device_state("observingconditions", device_number)
@@ -507,6 +369,7 @@ def refresh(device_number: int = Path(..., ge=0), ClientTransactionID: int = For
     "/observingconditions/{device_number}/sensordescription",
     response_model=StringResponse,
 )
+@nonblocking
 def get_sensordescription(
     device_number: int = Path(..., ge=0),
     SensorName: str = Query(...),
@@ -544,6 +407,7 @@ def get_sensordescription(
     "/observingconditions/{device_number}/timesincelastupdate",
     response_model=DoubleResponse,
 )
+@nonblocking
 def get_timesincelastupdate(
     device_number: int = Path(..., ge=0),
     SensorName: str = Query(...),
@@ -557,3 +421,22 @@ def get_timesincelastupdate(
         ClientTransactionID=ClientTransactionID,
         ServerTransactionID=get_server_transaction_id(),
     )
+
+
+PROPERTIES = {
+    "averageperiod": 60.0,
+    "cloudcover": 0.2,
+    "dewpoint": 5.0,
+    "humidity": 60.0,
+    "pressure": 1013.25,
+    "rainrate": 0.0,
+    "skybrightness": 18.5,
+    "skyquality": 20.0,
+    "skytemperature": -10.0,
+    "starfwhm": 2.5,
+    "temperature": 15.0,
+    "winddirection": 180.0,
+    "windgust": 5.0,
+    "windspeed": 3.0,
+}
+add_property_routes(router, "observingconditions", PROPERTIES)
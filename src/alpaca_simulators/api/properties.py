@@ -0,0 +1,109 @@
+"""
+Table-generated property getters.
+
+Most Alpaca GET members just return a value from the device state. Rather than one
+hand-written handler and route per member, each device module lists those members in a
+``PROPERTIES`` dict, mapping each to the value returned when the state has none, and
+registers them here as a single ``/<type>/{device_number}/{member}`` route. The response
+model of each member comes from its Value type in the Alpaca spec (spec_properties.py,
+generated by parse_spec.py), and responses are encoded directly (see api/responses.py);
+members whose state key is static are served from the cache of encoded Values there.
+Handlers with behaviour beyond reading state stay hand-written and must be registered
+before the generated route.
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, Path, Query
+from starlette.exceptions import HTTPException
+
+from alpaca_simulators.api.common import nonblocking, validate_device
+from alpaca_simulators.api.responses import static_value_response, value_response
+from alpaca_simulators.api.spec_properties import SPEC_PROPERTIES
+from alpaca_simulators.state import (
+    AlpacaResponse,
+    BoolResponse,
+    DoubleResponse,
+    IntArrayResponse,
+    IntResponse,
+    StringArrayResponse,
+    StringResponse,
+    get_device_config,
+    get_device_state,
+    get_server_transaction_id,
+    static_state_keys,
+)
+
+# Response model for each spec Value type.
+RESPONSE_MODELS: dict[str, type[AlpacaResponse]] = {
+    "bool": BoolResponse,
+    "int": IntResponse,
+    "float": DoubleResponse,
+    "str": StringResponse,
+    "list[str]": StringArrayResponse,
+    "list[int]": IntArrayResponse,
+}
+
+
+def build_property_table(
+    device_type: str, defaults: dict[str, Any], keys: dict[str, str] | None = None
+) -> dict[str, tuple[str, Any, type[AlpacaResponse]]]:
+    """Resolve a device's property defaults into member -> (state key, default, model).
+
+    ``keys`` maps members whose state key differs from the member name. Members the spec
+    does not list as plain-valued GET properties raise ValueError.
+    """
+    keys = keys or {}
+    spec_properties = SPEC_PROPERTIES.get(device_type, {})
+    table = {}
+    for member, default in defaults.items():
+        value_type = spec_properties.get(member)
+        if value_type is None:
+            raise ValueError(f"{device_type}.{member} is not a plain GET property in the spec")
+        table[member] = (keys.get(member, member), default, RESPONSE_MODELS[value_type])
+    return table
+
+
+def add_property_routes(
+    router: APIRouter,
+    device_type: str,
+    defaults: dict[str, Any],
+    keys: dict[str, str] | None = None,
+) -> None:
+    """Register the generated getter for a device type's table of properties."""
+    table = build_property_table(device_type, defaults, keys)
+    static_keys = static_state_keys(device_type)
+
+    @nonblocking
+    def get_property(
+        member: str,
+        device_number: int = Path(..., ge=0),
+        ClientTransactionID: int = Query(0),
+    ):
+        entry = table.get(member)
+        if entry is None:
+            raise HTTPException(status_code=404)
+        key, default, model = entry
+        if key in static_keys:
+
+            def compute():
+                validate_device(device_type, device_number)
+                return get_device_config(device_type, device_number).get(key, default)
+
+            return static_value_response(
+                (device_type, device_number, member), model, compute, ClientTransactionID
+            )
+        validate_device(device_type, device_number)
+        state = get_device_state(device_type, device_number)
+        return value_response(
+            model, state.get(key, default), ClientTransactionID, get_server_transaction_id()
+        )
+
+    get_property.properties = table  # for endpoint discovery
+    router.add_api_route(
+        f"/{device_type}/{{device_number}}/{{member}}",
+        get_property,
+        methods=["GET"],
+        name=f"get_{device_type}_property",
+        summary=f"Get a {device_type} property ({', '.join(sorted(table))})",
+    )
@@ -0,0 +1,160 @@
+"""
+Fast encoding of successful Alpaca value responses.
+
+Building a pydantic response model and letting FastAPI validate and serialise it again
+against ``response_model`` dominates the cost of a plain property read. Handlers here
+return ready-made JSON instead: the fixed parts of the body are pre-serialised and only
+the transaction ids and the Value are spliced in. Values of the expected Python type are
+encoded with pydantic_core directly; anything else (enums, numpy scalars, values needing
+coercion) goes through the response model, so the bytes match what FastAPI produces for
+the model in every case.
+
+Members whose Value is fixed by the configuration (capabilities, sizes, names) are
+encoded once per device and config load by ``static_value_response``; such reads skip
+device validation and the state copy entirely until ``reload_config`` is called.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import Response
+
+from alpaca_simulators.state import (
+    AlpacaResponse,
+    BoolResponse,
+    DoubleResponse,
+    IntArrayResponse,
+    IntResponse,
+    StringArrayResponse,
+    StringResponse,
+    config_version,
+    get_server_transaction_id,
+)
+
+_CLIENT_ID = b'{"ClientTransactionID":'
+_SERVER_ID = b',"ServerTransactionID":'
+_VALUE = b',"ErrorNumber":0,"ErrorMessage":"","Value":'
+
+
+class AlpacaJSONResponse(Response):
+    media_type = "application/json"
+
+
+def _encode_bool(value):
+    if value is True:
+        return b"true"
+    if value is False:
+        return b"false"
+    return None
+
+
+def _encode_int(value):
+    # IntEnum state values (CameraStates, ShutterState, ...) serialise as their number
+    if isinstance(value, int) and type(value) is not bool:
+        return str(int(value)).encode()
+    return None
+
+
+def _encode_float(value):
+    if type(value) is float:
+        return to_json(value, inf_nan_mode="null")
+    if type(value) is int:
+        return to_json(float(value), inf_nan_mode="null")
+    return None
+
+
+def _encode_str(value):
+    return to_json(value) if type(value) is str else None
+
+
+def _list_encoder(item_type):
+    def encode(value):
+        if type(value) is list and all(type(item) is item_type for item in value):
+            return to_json(value)
+        return None
+
+    return encode
+
+
+# Value encoders by response model; they return None for values the model must coerce.
+VALUE_ENCODERS = {
+    BoolResponse: _encode_bool,
+    IntResponse: _encode_int,
+    DoubleResponse: _encode_float,
+    StringResponse: _encode_str,
+    StringArrayResponse: _list_encoder(str),
+    IntArrayResponse: _list_encoder(int),
+}
+
+
+def encode_value(model: type[AlpacaResponse], value) -> bytes:
+    """Serialise a Value as it appears in a ``model`` response."""
+    encoder = VALUE_ENCODERS.get(model)
+    value_json = encoder(value) if encoder is not None else None
+    if value_json is None:
+        body = model(Value=value).model_dump_json(include={"Value"}).encode()
+        value_json = body[len(b'{"Value":') : -1]
+    return value_json
+
+
+def encode_value_response(
+    model: type[AlpacaResponse],
+    value,
+    client_transaction_id: int,
+    server_transaction_id: int,
+) -> bytes:
+    """Serialise a successful ``model`` response with the given Value and ids."""
+    return _splice(encode_value(model, value), client_transaction_id, server_transaction_id)
+
+
+def _splice(value_json: bytes, client_transaction_id: int, server_transaction_id: int) -> bytes:
+    return b"".join(
+        (
+            _CLIENT_ID,
+            str(client_transaction_id).encode(),
+            _SERVER_ID,
+            str(server_transaction_id).encode(),
+            _VALUE,
+            value_json,
+            b"}",
+        )
+    )
+
+
+def value_response(
+    model: type[AlpacaResponse],
+    value,
+    client_transaction_id: int,
+    server_transaction_id: int,
+) -> AlpacaJSONResponse:
+    """Return a successful ``model`` response without building the model when possible."""
+    return AlpacaJSONResponse(
+        encode_value_response(model, value, client_transaction_id, server_transaction_id)
+    )
+
+
+# Encoded Values of static members by (device type, device number, member), each with
+# the config version it was computed under.
+_static_values: dict[tuple[str, int, str], tuple[int, bytes]] = {}
+
+
+def static_value_response(
+    key: tuple[str, int, str],
+    model: type[AlpacaResponse],
+    compute: Callable[[], Any],
+    client_transaction_id: int,
+) -> AlpacaJSONResponse:
+    """Return a response for a member whose Value only changes when the config is reloaded.
+
+    ``compute`` validates the device and returns the Value; it is only called when the
+    cached Value for ``key`` is missing or predates the last config reload. Errors it
+    raises are not cached.
+    """
+    version = config_version()
+    cached = _static_values.get(key)
+    if cached is None or cached[0] != version:
+        cached = _static_values[key] = (version, encode_value(model, compute()))
+    return AlpacaJSONResponse(
+        _splice(cached[1], client_transaction_id, get_server_transaction_id())
+    )
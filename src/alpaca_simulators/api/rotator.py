@@ -1,76 +1,20 @@
-from fastapi import APIRouter, Form, Path, Query
+from fastapi import APIRouter, Form, Path
 
-from alpaca_simulators.api.common import AlpacaError, validate_device
+from alpaca_simulators.api.common import AlpacaError, nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
+from alpaca_simulators.api.properties import add_property_routes
 from alpaca_simulators.state import (
     AlpacaResponse,
-    BoolResponse,
-    DoubleResponse,
     get_device_state,
     get_server_transaction_id,
     update_device_state,
 )
 
-router = APIRouter()
-
-
-@router.get("/rotator/{device_number}/canreverse", response_model=BoolResponse)
-def get_canreverse(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("rotator", device_number)
-    state = get_device_state("rotator", device_number)
-    return BoolResponse(
-        Value=state.get("canreverse", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/rotator/{device_number}/ismoving", response_model=BoolResponse)
-def get_ismoving(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("rotator", device_number)
-    state = get_device_state("rotator", device_number)
-    return BoolResponse(
-        Value=state.get("ismoving", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/rotator/{device_number}/mechanicalposition", response_model=DoubleResponse)
-def get_mechanicalposition(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("rotator", device_number)
-    state = get_device_state("rotator", device_number)
-    return DoubleResponse(
-        Value=state.get("mechanicalposition", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/rotator/{device_number}/position", response_model=DoubleResponse)
-def get_position(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("rotator", device_number)
-    state = get_device_state("rotator", device_number)
-    return DoubleResponse(
-        Value=state.get("position", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/rotator/{device_number}/reverse", response_model=BoolResponse)
-def get_reverse(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("rotator", device_number)
-    state = get_device_state("rotator", device_number)
-    return BoolResponse(
-        Value=state.get("reverse", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
+router = APIRouter(route_class=AlpacaRoute)
 
 
 @router.put("/rotator/{device_number}/reverse", response_model=AlpacaResponse)
+@nonblocking
 def set_reverse(
     device_number: int = Path(..., ge=0),
     Reverse: bool = Form(...),
@@ -94,29 +38,8 @@ def set_reverse(
     )
 
 
-@router.get("/rotator/{device_number}/stepsize", response_model=DoubleResponse)
-def get_stepsize(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("rotator", device_number)
-    state = get_device_state("rotator", device_number)
-    return DoubleResponse(
-        Value=state.get("stepsize", 0.1),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/rotator/{device_number}/targetposition", response_model=DoubleResponse)
-def get_targetposition(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("rotator", device_number)
-    state = get_device_state("rotator", device_number)
-    return DoubleResponse(
-        Value=state.get("targetposition", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/rotator/{device_number}/halt", response_model=AlpacaResponse)
+@nonblocking
 def halt(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("rotator", device_number)
     # state = get_device_state("rotator", device_number)
@@ -133,6 +56,7 @@ def halt(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0
 
 
 @router.put("/rotator/{device_number}/move", response_model=AlpacaResponse)
+@nonblocking
 def move(
     device_number: int = Path(..., ge=0),
     Position: float = Form(...),
@@ -168,6 +92,7 @@ def move(
 
 
 @router.put("/rotator/{device_number}/moveabsolute", response_model=AlpacaResponse)
+@nonblocking
 def moveabsolute(
     device_number: int = Path(..., ge=0),
     Position: float = Form(...),
@@ -200,6 +125,7 @@ def moveabsolute(
 
 
 @router.put("/rotator/{device_number}/movemechanical", response_model=AlpacaResponse)
+@nonblocking
 def movemechanical(
     device_number: int = Path(..., ge=0),
     Position: float = Form(...),
@@ -232,6 +158,7 @@ def movemechanical(
 
 
 @router.put("/rotator/{device_number}/sync", response_model=AlpacaResponse)
+@nonblocking
 def sync(
     device_number: int = Path(..., ge=0),
     Position: float = Form(...),
@@ -255,3 +182,15 @@ def sync(
         ClientTransactionID=ClientTransactionID,
         ServerTransactionID=get_server_transaction_id(),
     )
+
+
+PROPERTIES = {
+    "canreverse": True,
+    "ismoving": False,
+    "mechanicalposition": 0.0,
+    "position": 0.0,
+    "reverse": False,
+    "stepsize": 0.1,
+    "targetposition": 0.0,
+}
+add_property_routes(router, "rotator", PROPERTIES)
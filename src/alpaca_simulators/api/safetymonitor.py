@@ -2,7 +2,8 @@ import logging
 
 from fastapi import APIRouter, Form, Path, Query
 
-from alpaca_simulators.api.common import validate_device
+from alpaca_simulators.api.common import nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
 from alpaca_simulators.state import (
     AlpacaResponse,
     BoolResponse,
@@ -11,10 +12,11 @@ from alpaca_simulators.state import (
     update_device_state,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=AlpacaRoute)
 
 
 @router.get("/safetymonitor/{device_number}/issafe", response_model=BoolResponse)
+@nonblocking
 def get_issafe(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("safetymonitor", device_number)
     state = get_device_state("safetymonitor", device_number)
@@ -33,6 +35,7 @@ def get_issafe(device_number: int = Path(..., ge=0), ClientTransactionID: int =
 
 
 @router.put("/safetymonitor/{device_number}/issafe", response_model=AlpacaResponse)
+@nonblocking
 def set_issafe(
     device_number: int = Path(..., ge=0),
     IsSafe: bool = Form(...),
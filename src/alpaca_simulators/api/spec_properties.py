@@ -0,0 +1,197 @@
+"""
+Generated by parse_spec.py from AlpacaDeviceAPI_v1.yaml; do not edit.
+
+GET members of each device type returning a plain Value, and its type.
+"""
+
+SPEC_PROPERTIES = {
+    "camera": {
+        "bayeroffsetx": "int",
+        "bayeroffsety": "int",
+        "binx": "int",
+        "biny": "int",
+        "camerastate": "int",
+        "cameraxsize": "int",
+        "cameraysize": "int",
+        "canabortexposure": "bool",
+        "canasymmetricbin": "bool",
+        "canfastreadout": "bool",
+        "cangetcoolerpower": "bool",
+        "canpulseguide": "bool",
+        "cansetccdtemperature": "bool",
+        "canstopexposure": "bool",
+        "ccdtemperature": "float",
+        "cooleron": "bool",
+        "coolerpower": "float",
+        "electronsperadu": "float",
+        "exposuremax": "float",
+        "exposuremin": "float",
+        "exposureresolution": "float",
+        "fastreadout": "bool",
+        "fullwellcapacity": "float",
+        "gain": "int",
+        "gainmax": "int",
+        "gainmin": "int",
+        "gains": "list[str]",
+        "hasshutter": "bool",
+        "heatsinktemperature": "float",
+        "imageready": "bool",
+        "ispulseguiding": "bool",
+        "lastexposureduration": "float",
+        "lastexposurestarttime": "str",
+        "maxadu": "int",
+        "maxbinx": "int",
+        "maxbiny": "int",
+        "numx": "int",
+        "numy": "int",
+        "offset": "int",
+        "offsetmax": "int",
+        "offsetmin": "int",
+        "offsets": "list[str]",
+        "percentcompleted": "int",
+        "pixelsizex": "float",
+        "pixelsizey": "float",
+        "readoutmode": "int",
+        "readoutmodes": "list[str]",
+        "sensorname": "str",
+        "sensortype": "int",
+        "setccdtemperature": "float",
+        "startx": "int",
+        "starty": "int",
+        "subexposureduration": "float",
+    },
+    "covercalibrator": {
+        "brightness": "int",
+        "calibratorchanging": "bool",
+        "calibratorstate": "int",
+        "covermoving": "bool",
+        "coverstate": "int",
+        "maxbrightness": "int",
+    },
+    "dome": {
+        "altitude": "float",
+        "athome": "bool",
+        "atpark": "bool",
+        "azimuth": "float",
+        "canfindhome": "bool",
+        "canpark": "bool",
+        "cansetaltitude": "bool",
+        "cansetazimuth": "bool",
+        "cansetpark": "bool",
+        "cansetshutter": "bool",
+        "canslave": "bool",
+        "cansyncazimuth": "bool",
+        "shutterstatus": "int",
+        "slaved": "bool",
+        "slewing": "bool",
+    },
+    "filterwheel": {
+        "focusoffsets": "list[int]",
+        "names": "list[str]",
+        "position": "int",
+    },
+    "focuser": {
+        "absolute": "bool",
+        "ismoving": "bool",
+        "maxincrement": "int",
+        "maxstep": "int",
+        "position": "int",
+        "stepsize": "float",
+        "tempcomp": "bool",
+        "tempcompavailable": "bool",
+        "temperature": "float",
+    },
+    "observingconditions": {
+        "averageperiod": "float",
+        "cloudcover": "float",
+        "dewpoint": "float",
+        "humidity": "float",
+        "pressure": "float",
+        "rainrate": "float",
+        "sensordescription": "str",
+        "skybrightness": "float",
+        "skyquality": "float",
+        "skytemperature": "float",
+        "starfwhm": "float",
+        "temperature": "float",
+        "timesincelastupdate": "float",
+        "winddirection": "float",
+        "windgust": "float",
+        "windspeed": "float",
+    },
+    "rotator": {
+        "canreverse": "bool",
+        "ismoving": "bool",
+        "mechanicalposition": "float",
+        "position": "float",
+        "reverse": "bool",
+        "stepsize": "float",
+        "targetposition": "float",
+    },
+    "safetymonitor": {
+        "issafe": "bool",
+    },
+    "switch": {
+        "canasync": "bool",
+        "canwrite": "bool",
+        "getswitch": "bool",
+        "getswitchdescription": "str",
+        "getswitchname": "str",
+        "getswitchvalue": "float",
+        "maxswitch": "int",
+        "maxswitchvalue": "float",
+        "minswitchvalue": "float",
+        "statechangecomplete": "bool",
+        "switchstep": "float",
+    },
+    "telescope": {
+        "alignmentmode": "int",
+        "altitude": "float",
+        "aperturearea": "float",
+        "aperturediameter": "float",
+        "athome": "bool",
+        "atpark": "bool",
+        "azimuth": "float",
+        "canfindhome": "bool",
+        "canmoveaxis": "bool",
+        "canpark": "bool",
+        "canpulseguide": "bool",
+        "cansetdeclinationrate": "bool",
+        "cansetguiderates": "bool",
+        "cansetpark": "bool",
+        "cansetpierside": "bool",
+        "cansetrightascensionrate": "bool",
+        "cansettracking": "bool",
+        "canslew": "bool",
+        "canslewaltaz": "bool",
+        "canslewaltazasync": "bool",
+        "canslewasync": "bool",
+        "cansync": "bool",
+        "cansyncaltaz": "bool",
+        "canunpark": "bool",
+        "declination": "float",
+        "declinationrate": "float",
+        "destinationsideofpier": "int",
+        "doesrefraction": "bool",
+        "equatorialsystem": "int",
+        "focallength": "float",
+        "guideratedeclination": "float",
+        "guideraterightascension": "float",
+        "ispulseguiding": "bool",
+        "rightascension": "float",
+        "rightascensionrate": "float",
+        "sideofpier": "int",
+        "siderealtime": "float",
+        "siteelevation": "float",
+        "sitelatitude": "float",
+        "sitelongitude": "float",
+        "slewing": "bool",
+        "slewsettletime": "int",
+        "targetdeclination": "float",
+        "targetrightascension": "float",
+        "tracking": "bool",
+        "trackingrate": "int",
+        "trackingrates": "list[int]",
+        "utcdate": "str",
+    },
+}
@@ -2,7 +2,8 @@ from typing import Any
 
 from fastapi import APIRouter, Form, Path, Query
 
-from alpaca_simulators.api.common import AlpacaError, validate_device
+from alpaca_simulators.api.common import AlpacaError, nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
 from alpaca_simulators.state import (
     AlpacaResponse,
     BoolResponse,
@@ -14,7 +15,7 @@ from alpaca_simulators.state import (
     update_device_state,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=AlpacaRoute)
 
 
 def _switches(state: dict) -> dict:
@@ -45,6 +46,7 @@ def _store_switch_value(device_number: int, state: dict, switch_id: int, value):
 
 
 @router.get("/switch/{device_number}/maxswitch", response_model=IntResponse)
+@nonblocking
 def get_maxswitch(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("switch", device_number)
     state = get_device_state("switch", device_number)
@@ -58,6 +60,7 @@ def get_maxswitch(device_number: int = Path(..., ge=0), ClientTransactionID: int
 
 
 @router.get("/switch/{device_number}/canasync", response_model=BoolResponse)
+@nonblocking
 def get_canasync(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -74,6 +77,7 @@ def get_canasync(
 
 
 @router.get("/switch/{device_number}/canwrite", response_model=BoolResponse)
+@nonblocking
 def get_canwrite(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -90,6 +94,7 @@ def get_canwrite(
 
 
 @router.get("/switch/{device_number}/getswitch", response_model=BoolResponse)
+@nonblocking
 def get_getswitch(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -108,6 +113,7 @@ def get_getswitch(
 
 
 @router.get("/switch/{device_number}/getswitchdescription", response_model=StringResponse)
+@nonblocking
 def get_getswitchdescription(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -124,6 +130,7 @@ def get_getswitchdescription(
 
 
 @router.get("/switch/{device_number}/getswitchname", response_model=StringResponse)
+@nonblocking
 def get_getswitchname(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -140,6 +147,7 @@ def get_getswitchname(
 
 
 @router.get("/switch/{device_number}/getswitchvalue", response_model=DoubleResponse)
+@nonblocking
 def get_getswitchvalue(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -156,6 +164,7 @@ def get_getswitchvalue(
 
 
 @router.get("/switch/{device_number}/minswitchvalue", response_model=DoubleResponse)
+@nonblocking
 def get_minswitchvalue(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -172,6 +181,7 @@ def get_minswitchvalue(
 
 
 @router.get("/switch/{device_number}/maxswitchvalue", response_model=DoubleResponse)
+@nonblocking
 def get_maxswitchvalue(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -188,6 +198,7 @@ def get_maxswitchvalue(
 
 
 @router.get("/switch/{device_number}/switchstep", response_model=DoubleResponse)
+@nonblocking
 def get_switchstep(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -204,6 +215,7 @@ def get_switchstep(
 
 
 @router.get("/switch/{device_number}/statechangecomplete", response_model=BoolResponse)
+@nonblocking
 def get_statechangecomplete(
     device_number: int = Path(..., ge=0),
     Id: int = Query(...),
@@ -222,6 +234,7 @@ def get_statechangecomplete(
 
 
 @router.put("/switch/{device_number}/setswitch", response_model=AlpacaResponse)
+@nonblocking
 def set_setswitch(
     device_number: int = Path(..., ge=0),
     Id: int = Form(...),
@@ -244,6 +257,7 @@ def set_setswitch(
 
 
 @router.put("/switch/{device_number}/setswitchvalue", response_model=AlpacaResponse)
+@nonblocking
 def set_setswitchvalue(
     device_number: int = Path(..., ge=0),
     Id: int = Form(...),
@@ -271,6 +285,7 @@ def set_setswitchvalue(
 
 
 @router.put("/switch/{device_number}/setswitchname", response_model=AlpacaResponse)
+@nonblocking
 def set_setswitchname(
     device_number: int = Path(..., ge=0),
     Id: int = Form(...),
@@ -288,6 +303,7 @@ def set_setswitchname(
 
 
 @router.put("/switch/{device_number}/setasync", response_model=AlpacaResponse)
+@nonblocking
 def set_setasync(
     device_number: int = Path(..., ge=0),
     Id: int = Form(...),
@@ -310,6 +326,7 @@ def set_setasync(
 
 
 @router.put("/switch/{device_number}/setasyncvalue", response_model=AlpacaResponse)
+@nonblocking
 def set_setasyncvalue(
     device_number: int = Path(..., ge=0),
     Id: int = Form(...),
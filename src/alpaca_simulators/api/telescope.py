@@ -3,9 +3,13 @@ import threading
 from datetime import datetime, timezone
 from time import sleep
 
+import numpy as np
 from fastapi import APIRouter, Form, Path, Query
 
-from alpaca_simulators.api.common import AlpacaError, validate_device
+from alpaca_simulators.api.common import AlpacaError, nonblocking, validate_device
+from alpaca_simulators.api.forms import AlpacaRoute
+from alpaca_simulators.api.properties import add_property_routes
+from alpaca_simulators.api.responses import static_value_response
 from alpaca_simulators.state import (
     AlignmentModes,
     AlpacaResponse,
@@ -21,12 +25,16 @@ from alpaca_simulators.state import (
     RateArrayResponse,
     StringResponse,
     TelescopeAxes,
+    device_state_exists,
     get_device_state,
+    get_device_states,
+    get_live_device_state,
     get_server_transaction_id,
     update_device_state,
+    update_live_device_state,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=AlpacaRoute)
 
 
 def _complete_pulseguide(device_number: int, delay_seconds: float) -> None:
@@ -55,6 +63,12 @@ def degrees_to_hours(degrees):
     return degrees / 15.0
 
 
+def _gmst_hours(utc_timestamp: float) -> float:
+    """Greenwich mean sidereal time in hours, not reduced to 0-24."""
+    jd = utc_timestamp / 86400.0 + 2440587.5
+    return 18.697374558 + 24.06570982441908 * (jd - 2451545.0)
+
+
 def _radec_to_altaz(
     ra_hours: float,
     dec_deg: float,
@@ -67,9 +81,7 @@ def _radec_to_altaz(
     Returns (altitude, azimuth) in degrees.
     Azimuth is measured from North through East (0–360°).
     """
-    jd = utc_timestamp / 86400.0 + 2440587.5
-    gmst = 18.697374558 + 24.06570982441908 * (jd - 2451545.0)
-    lst = (gmst + lon_deg / 15.0) % 24.0
+    lst = (_gmst_hours(utc_timestamp) + lon_deg / 15.0) % 24.0
 
     ha = math.radians((lst - ra_hours) * 15.0)  # hour angle in radians
     lat = math.radians(lat_deg)
@@ -99,9 +111,7 @@ def _altaz_to_radec(
     Inverse of _radec_to_altaz. Azimuth measured from North through East.
     Returns (right_ascension_hours, declination_degrees).
     """
-    jd = utc_timestamp / 86400.0 + 2440587.5
-    gmst = 18.697374558 + 24.06570982441908 * (jd - 2451545.0)
-    lst = (gmst + lon_deg / 15.0) % 24.0
+    lst = (_gmst_hours(utc_timestamp) + lon_deg / 15.0) % 24.0
 
     alt = math.radians(alt_deg)
     az = math.radians(az_deg)
@@ -118,6 +128,61 @@ def _altaz_to_radec(
     return ra, dec_deg
 
 
+def _radec_to_altaz_batch(
+    ra_hours: np.ndarray,
+    dec_deg: np.ndarray,
+    lat_deg: np.ndarray,
+    lon_deg: np.ndarray,
+    utc_timestamp: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """_radec_to_altaz for arrays of telescopes at one instant.
+
+    GMST is computed once for all of them. Results match the scalar function to well
+    within 1e-9 degrees.
+    """
+    lst = (_gmst_hours(utc_timestamp) + lon_deg / 15.0) % 24.0
+
+    ha = np.radians((lst - ra_hours) * 15.0)
+    lat = np.radians(lat_deg)
+    dec = np.radians(dec_deg)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_dec, cos_dec = np.sin(dec), np.cos(dec)
+    cos_ha = np.cos(ha)
+
+    sin_alt = sin_lat * sin_dec + cos_lat * cos_dec * cos_ha
+    alt = np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+
+    az_rad = np.arctan2(-cos_dec * np.sin(ha), sin_dec * cos_lat - cos_dec * sin_lat * cos_ha)
+    az = np.degrees(az_rad) % 360.0
+
+    return alt, az
+
+
+def _altaz_to_radec_batch(
+    alt_deg: np.ndarray,
+    az_deg: np.ndarray,
+    lat_deg: np.ndarray,
+    lon_deg: np.ndarray,
+    utc_timestamp: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """_altaz_to_radec for arrays of telescopes at one instant."""
+    lst = (_gmst_hours(utc_timestamp) + lon_deg / 15.0) % 24.0
+
+    alt = np.radians(alt_deg)
+    az = np.radians(az_deg)
+    lat = np.radians(lat_deg)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_alt, cos_alt = np.sin(alt), np.cos(alt)
+    cos_az = np.cos(az)
+
+    sin_dec = sin_lat * sin_alt + cos_lat * cos_alt * cos_az
+    dec_deg = np.degrees(np.arcsin(np.clip(sin_dec, -1.0, 1.0)))
+
+    ha_rad = np.arctan2(-np.sin(az) * cos_alt, sin_alt * cos_lat - cos_alt * sin_lat * cos_az)
+    ra = (lst - np.degrees(ha_rad) / 15.0) % 24.0
+    return ra, dec_deg
+
+
 # Sidereal rate: 24 RA-hours per sidereal day (86164.0905 s).
 _SIDEREAL_RATE_RA_H_PER_S = 24.0 / 86164.0905
 
@@ -151,19 +216,69 @@ def compute_coordinate_rates(state: dict) -> tuple[float, float]:
     return ra_rate, dec_rate
 
 
+def _is_slewing(state: dict) -> bool:
+    """Whether the motion model is driving the telescope toward a slew target."""
+    return (
+        state.get("slew_target_alt") is not None and state.get("slew_target_az") is not None
+    ) or (state.get("slew_target_ra") is not None and state.get("slew_target_dec") is not None)
+
+
+def _tracked_coordinates(state: dict, elapsed_seconds: float) -> tuple[float, float]:
+    """RA/Dec after ``elapsed_seconds`` of tracking or drifting without a slew."""
+    # Coordinate-space rates (RA-hours/s, deg/s); see compute_coordinate_rates().
+    ra_rate, dec_rate = compute_coordinate_rates(state)
+
+    rightascension = normalize_hours(state.get("rightascension", 0.0) + elapsed_seconds * ra_rate)
+    declination = normalize_degrees(state.get("declination", 0.0) + elapsed_seconds * dec_rate)
+    return rightascension, declination
+
+
+# The state a motion step is computed from. The step is only written back if these are
+# unchanged, so a slew, sync or rate change accepted meanwhile is not overwritten.
+_MOTION_INPUTS = (
+    "last_motion_update",
+    "rightascension",
+    "declination",
+    "altitude",
+    "azimuth",
+    "slew_target_alt",
+    "slew_target_az",
+    "slew_target_ra",
+    "slew_target_dec",
+    "tracking",
+    "rightascensionrate",
+    "declinationrate",
+    "moveaxis_primary_rate",
+    "moveaxis_secondary_rate",
+)
+
+
+def _motion_inputs(state: dict) -> dict:
+    return {key: state.get(key) for key in _MOTION_INPUTS}
+
+
 def _advance_telescope_motion(device_number: int) -> None:
     """Advance stored telescope coordinates based on elapsed wall-clock time."""
-    state = get_device_state("telescope", device_number)
+    # A step that lost a race with another update is recomputed from the new state.
+    while not _step_telescope_motion(device_number):
+        pass
+
+
+def _step_telescope_motion(device_number: int) -> bool:
+    """One motion step of _advance_telescope_motion; False if the state changed under it."""
+    state = get_live_device_state("telescope", device_number)
+    expected = _motion_inputs(state)
     now = datetime.now(timezone.utc).timestamp()
     last_update = state.get("last_motion_update")
 
     if last_update is None:
-        update_device_state("telescope", device_number, {"last_motion_update": now})
-        return
+        return update_live_device_state(
+            "telescope", device_number, {"last_motion_update": now}, expected
+        )
 
     elapsed_seconds = now - last_update
     if elapsed_seconds <= 0:
-        return
+        return True
 
     lat = state.get("sitelatitude", 0.0)
     lon = state.get("sitelongitude", 0.0)
@@ -215,8 +330,7 @@ def _advance_telescope_motion(device_number: int) -> None:
             updates["slewing"] = False
             updates["slew_target_alt"] = None
             updates["slew_target_az"] = None
-        update_device_state("telescope", device_number, updates)
-        return
+        return update_live_device_state("telescope", device_number, updates, expected)
 
     if slew_target_ra is not None and slew_target_dec is not None:
         # RA/Dec slew: drive in equatorial space, convert result to alt/az.
@@ -257,20 +371,14 @@ def _advance_telescope_motion(device_number: int) -> None:
             updates["slewing"] = False
             updates["slew_target_ra"] = None
             updates["slew_target_dec"] = None
-        update_device_state("telescope", device_number, updates)
-        return
+        return update_live_device_state("telescope", device_number, updates, expected)
 
     # --- No active slew: apply normal tracking / MoveAxis rates ---
 
-    # Coordinate-space rates (RA-hours/s, deg/s); see compute_coordinate_rates().
-    ra_rate, dec_rate = compute_coordinate_rates(state)
-
-    rightascension = normalize_hours(state.get("rightascension", 0.0) + elapsed_seconds * ra_rate)
-    declination = normalize_degrees(state.get("declination", 0.0) + elapsed_seconds * dec_rate)
-
+    rightascension, declination = _tracked_coordinates(state, elapsed_seconds)
     altitude, azimuth = _radec_to_altaz(rightascension, declination, lat, lon, now)
 
-    update_device_state(
+    return update_live_device_state(
         "telescope",
         device_number,
         {
@@ -280,54 +388,82 @@ def _advance_telescope_motion(device_number: int) -> None:
             "azimuth": azimuth,
             "last_motion_update": now,
         },
+        expected,
     )
 
 
 _UPDATE_INTERVAL = 0.1  # seconds between background coordinate updates
 
 
-def _telescope_background_loop(device_number: int) -> None:
+def _advance_telescopes(device_numbers: list[int]) -> None:
+    """Advance the motion of several telescopes, as _advance_telescope_motion does for one.
+
+    Telescopes that are tracking or drifting have their alt/az computed in one batched
+    transform; slewing telescopes and those not yet timed are advanced one at a time, as
+    are any whose state changed between the batch's read and its write.
+    """
+    now = datetime.now(timezone.utc).timestamp()
+    states = get_device_states([("telescope", device_number) for device_number in device_numbers])
+
+    batch, coordinates, sites, expected = [], [], [], []
+    for device_number, state in zip(device_numbers, states):
+        last_update = state.get("last_motion_update")
+        if last_update is None or _is_slewing(state):
+            _advance_telescope_motion(device_number)
+            continue
+        elapsed_seconds = now - last_update
+        if elapsed_seconds <= 0:
+            continue
+        batch.append(device_number)
+        coordinates.append(_tracked_coordinates(state, elapsed_seconds))
+        sites.append((state.get("sitelatitude", 0.0), state.get("sitelongitude", 0.0)))
+        expected.append(_motion_inputs(state))
+    if not batch:
+        return
+
+    ra, dec = np.array(coordinates).T
+    lat, lon = np.array(sites).T
+    altitude, azimuth = _radec_to_altaz_batch(ra, dec, lat, lon, now)
+    for i, device_number in enumerate(batch):
+        applied = update_live_device_state(
+            "telescope",
+            device_number,
+            {
+                "rightascension": coordinates[i][0],
+                "declination": coordinates[i][1],
+                "altitude": float(altitude[i]),
+                "azimuth": float(azimuth[i]),
+                "last_motion_update": now,
+            },
+            expected[i],
+        )
+        if not applied:
+            _advance_telescope_motion(device_number)
+
+
+def _telescope_background_loop(device_numbers: list[int]) -> None:
     """Daemon thread: update telescope coordinates every _UPDATE_INTERVAL seconds."""
     while True:
         sleep(_UPDATE_INTERVAL)
-        _advance_telescope_motion(device_number)
+        # Telescopes nobody has used yet have no state and cannot be moving.
+        in_use = [n for n in device_numbers if device_state_exists("telescope", n)]
+        try:
+            _advance_telescopes(in_use)
+        except Exception as e:
+            print(f"Error updating telescopes: {e}")
 
 
 def start_background_updater(device_numbers: list[int]) -> None:
-    """Start a background updater thread for each of the given telescope device numbers."""
-    for device_number in device_numbers:
-        threading.Thread(
-            target=_telescope_background_loop,
-            args=(device_number,),
-            daemon=True,
-        ).start()
-
-
-@router.get("/telescope/{device_number}/alignmentmode", response_model=IntResponse)
-def get_alignmentmode(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return IntResponse(
-        Value=state.get("alignmentmode", AlignmentModes.GERMAN_POLAR),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/altitude", response_model=DoubleResponse)
-def get_altitude(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    # if not state.get("connected"):
-    # raise AlpacaError(0x407, "Device is not connected")
-    return DoubleResponse(
-        Value=state.get("altitude", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
+    """Start one background thread updating all of the given telescope device numbers."""
+    threading.Thread(
+        target=_telescope_background_loop,
+        args=(list(device_numbers),),
+        daemon=True,
+    ).start()
 
 
 @router.get("/telescope/{device_number}/aperturearea", response_model=DoubleResponse)
+@nonblocking
 def get_aperturearea(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("telescope", device_number)
     state = get_device_state("telescope", device_number)
@@ -340,239 +476,8 @@ def get_aperturearea(device_number: int = Path(..., ge=0), ClientTransactionID:
     )
 
 
-@router.get("/telescope/{device_number}/aperturediameter", response_model=DoubleResponse)
-def get_aperturediameter(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return DoubleResponse(
-        Value=state.get("aperturediameter", 8.0),  # m
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/athome", response_model=BoolResponse)
-def get_athome(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("athome", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/atpark", response_model=BoolResponse)
-def get_atpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("atpark", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/azimuth", response_model=DoubleResponse)
-def get_azimuth(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    # if not state.get("connected"):
-    # raise AlpacaError(0x407, "Device is not connected")
-    return DoubleResponse(
-        Value=state.get("azimuth", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/canfindhome", response_model=BoolResponse)
-def get_canfindhome(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("canfindhome", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/canpark", response_model=BoolResponse)
-def get_canpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("canpark", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/canpulseguide", response_model=BoolResponse)
-def get_canpulseguide(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("canpulseguide", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/cansetdeclinationrate", response_model=BoolResponse)
-def get_cansetdeclinationrate(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("cansetdeclinationrate", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/cansetguiderates", response_model=BoolResponse)
-def get_cansetguiderates(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("cansetguiderates", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/cansetpark", response_model=BoolResponse)
-def get_cansetpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("cansetpark", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/cansetpierside", response_model=BoolResponse)
-def get_cansetpierside(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("cansetpierside", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/cansetrightascensionrate", response_model=BoolResponse)
-def get_cansetrightascensionrate(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("cansetrightascensionrate", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/cansettracking", response_model=BoolResponse)
-def get_cansettracking(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("cansettracking", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/canslew", response_model=BoolResponse)
-def get_canslew(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("canslew", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/canslewaltaz", response_model=BoolResponse)
-def get_canslewaltaz(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("canslewaltaz", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/canslewaltazasync", response_model=BoolResponse)
-def get_canslewaltazasync(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("canslewaltazasync", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/canslewasync", response_model=BoolResponse)
-def get_canslewasync(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("canslewasync", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/cansync", response_model=BoolResponse)
-def get_cansync(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("cansync", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/cansyncaltaz", response_model=BoolResponse)
-def get_cansyncaltaz(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("cansyncaltaz", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/canunpark", response_model=BoolResponse)
-def get_canunpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("canunpark", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.get("/telescope/{device_number}/declination", response_model=DoubleResponse)
+@nonblocking
 def get_declination(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("telescope", device_number)
     _advance_telescope_motion(device_number)
@@ -586,18 +491,8 @@ def get_declination(device_number: int = Path(..., ge=0), ClientTransactionID: i
     )
 
 
-@router.get("/telescope/{device_number}/declinationrate", response_model=DoubleResponse)
-def get_declinationrate(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return DoubleResponse(
-        Value=state.get("declinationrate", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/declinationrate", response_model=AlpacaResponse)
+@nonblocking
 def set_declinationrate(
     device_number: int = Path(..., ge=0),
     DeclinationRate: float = Form(...),
@@ -620,18 +515,8 @@ def set_declinationrate(
     )
 
 
-@router.get("/telescope/{device_number}/doesrefraction", response_model=BoolResponse)
-def get_doesrefraction(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("doesrefraction", True),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/doesrefraction", response_model=AlpacaResponse)
+@nonblocking
 def set_doesrefraction(
     device_number: int = Path(..., ge=0),
     DoesRefraction: bool = Form(...),
@@ -651,44 +536,8 @@ def set_doesrefraction(
     )
 
 
-@router.get("/telescope/{device_number}/equatorialsystem", response_model=IntResponse)
-def get_equatorialsystem(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return IntResponse(
-        Value=state.get("equatorialsystem", EquatorialCoordinateType.TOPOCENTRIC),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/focallength", response_model=DoubleResponse)
-def get_focallength(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return DoubleResponse(
-        Value=state.get("focallength", 1000.0),  # mm
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
-@router.get("/telescope/{device_number}/guideratedeclination", response_model=DoubleResponse)
-def get_guideratedeclination(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return DoubleResponse(
-        Value=state.get("guideratedeclination", 15.0),  # arcsec/sec
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/guideratedeclination", response_model=AlpacaResponse)
+@nonblocking
 def set_guideratedeclination(
     device_number: int = Path(..., ge=0),
     GuideRateDeclination: float = Form(...),
@@ -711,20 +560,8 @@ def set_guideratedeclination(
     )
 
 
-@router.get("/telescope/{device_number}/guideraterightascension", response_model=DoubleResponse)
-def get_guideraterightascension(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return DoubleResponse(
-        Value=state.get("guideraterightascension", 15.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/guideraterightascension", response_model=AlpacaResponse)
+@nonblocking
 def set_guideraterightascension(
     device_number: int = Path(..., ge=0),
     GuideRateRightAscension: float = Form(...),
@@ -749,18 +586,8 @@ def set_guideraterightascension(
     )
 
 
-@router.get("/telescope/{device_number}/ispulseguiding", response_model=BoolResponse)
-def get_ispulseguiding(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("ispulseguiding", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.get("/telescope/{device_number}/rightascension", response_model=DoubleResponse)
+@nonblocking
 def get_rightascension(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("telescope", device_number)
     _advance_telescope_motion(device_number)
@@ -774,20 +601,8 @@ def get_rightascension(device_number: int = Path(..., ge=0), ClientTransactionID
     )
 
 
-@router.get("/telescope/{device_number}/rightascensionrate", response_model=DoubleResponse)
-def get_rightascensionrate(
-    device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
-):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return DoubleResponse(
-        Value=state.get("rightascensionrate", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/rightascensionrate", response_model=AlpacaResponse)
+@nonblocking
 def set_rightascensionrate(
     device_number: int = Path(..., ge=0),
     RightAscensionRate: float = Form(...),
@@ -810,18 +625,8 @@ def set_rightascensionrate(
     )
 
 
-@router.get("/telescope/{device_number}/sideofpier", response_model=IntResponse)
-def get_sideofpier(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return IntResponse(
-        Value=state.get("sideofpier", PierSide.UNKNOWN),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/sideofpier", response_model=AlpacaResponse)
+@nonblocking
 def set_sideofpier(
     device_number: int = Path(..., ge=0),
     SideOfPier: int = Form(...),
@@ -845,6 +650,7 @@ def set_sideofpier(
 
 
 @router.get("/telescope/{device_number}/siderealtime", response_model=DoubleResponse)
+@nonblocking
 def get_siderealtime(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("telescope", device_number)
     state = get_device_state("telescope", device_number)
@@ -865,18 +671,8 @@ def get_siderealtime(device_number: int = Path(..., ge=0), ClientTransactionID:
     )
 
 
-@router.get("/telescope/{device_number}/siteelevation", response_model=DoubleResponse)
-def get_siteelevation(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return DoubleResponse(
-        Value=state.get("siteelevation", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/siteelevation", response_model=AlpacaResponse)
+@nonblocking
 def set_siteelevation(
     device_number: int = Path(..., ge=0),
     SiteElevation: float = Form(...),
@@ -895,18 +691,8 @@ def set_siteelevation(
     )
 
 
-@router.get("/telescope/{device_number}/sitelatitude", response_model=DoubleResponse)
-def get_sitelatitude(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return DoubleResponse(
-        Value=state.get("sitelatitude", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/sitelatitude", response_model=AlpacaResponse)
+@nonblocking
 def set_sitelatitude(
     device_number: int = Path(..., ge=0),
     SiteLatitude: float = Form(...),
@@ -925,18 +711,8 @@ def set_sitelatitude(
     )
 
 
-@router.get("/telescope/{device_number}/sitelongitude", response_model=DoubleResponse)
-def get_sitelongitude(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return DoubleResponse(
-        Value=state.get("sitelongitude", 0.0),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/sitelongitude", response_model=AlpacaResponse)
+@nonblocking
 def set_sitelongitude(
     device_number: int = Path(..., ge=0),
     SiteLongitude: float = Form(...),
@@ -955,18 +731,8 @@ def set_sitelongitude(
     )
 
 
-@router.get("/telescope/{device_number}/slewing", response_model=BoolResponse)
-def get_slewing(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("slewing", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.get("/telescope/{device_number}/slewsettletime", response_model=IntResponse)
+@nonblocking
 def get_slewsettletime(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("telescope", device_number)
     state = get_device_state("telescope", device_number)
@@ -978,6 +744,7 @@ def get_slewsettletime(device_number: int = Path(..., ge=0), ClientTransactionID
 
 
 @router.put("/telescope/{device_number}/slewsettletime", response_model=AlpacaResponse)
+@nonblocking
 def set_slewsettletime(
     device_number: int = Path(..., ge=0),
     SlewSettleTime: int = Form(...),
@@ -1001,6 +768,7 @@ def set_slewsettletime(
 
 
 @router.get("/telescope/{device_number}/targetdeclination", response_model=DoubleResponse)
+@nonblocking
 def get_targetdeclination(
     device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
 ):
@@ -1017,6 +785,7 @@ def get_targetdeclination(
 
 
 @router.put("/telescope/{device_number}/targetdeclination", response_model=AlpacaResponse)
+@nonblocking
 def set_targetdeclination(
     device_number: int = Path(..., ge=0),
     TargetDeclination: float = Form(...),
@@ -1040,6 +809,7 @@ def set_targetdeclination(
 
 
 @router.get("/telescope/{device_number}/targetrightascension", response_model=DoubleResponse)
+@nonblocking
 def get_targetrightascension(
     device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)
 ):
@@ -1056,6 +826,7 @@ def get_targetrightascension(
 
 
 @router.put("/telescope/{device_number}/targetrightascension", response_model=AlpacaResponse)
+@nonblocking
 def set_targetrightascension(
     device_number: int = Path(..., ge=0),
     TargetRightAscension: float = Form(...),
@@ -1078,18 +849,8 @@ def set_targetrightascension(
     )
 
 
-@router.get("/telescope/{device_number}/tracking", response_model=BoolResponse)
-def get_tracking(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return BoolResponse(
-        Value=state.get("tracking", False),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/tracking", response_model=AlpacaResponse)
+@nonblocking
 def set_tracking(
     device_number: int = Path(..., ge=0),
     Tracking: bool = Form(...),
@@ -1109,18 +870,8 @@ def set_tracking(
     )
 
 
-@router.get("/telescope/{device_number}/trackingrate", response_model=IntResponse)
-def get_trackingrate(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    state = get_device_state("telescope", device_number)
-    return IntResponse(
-        Value=state.get("trackingrate", DriveRates.SIDEREAL),
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
-    )
-
-
 @router.put("/telescope/{device_number}/trackingrate", response_model=AlpacaResponse)
+@nonblocking
 def set_trackingrate(
     device_number: int = Path(..., ge=0),
     TrackingRate: int = Form(...),
@@ -1150,16 +901,22 @@ def set_trackingrate(
 
 
 @router.get("/telescope/{device_number}/trackingrates", response_model=IntArrayResponse)
+@nonblocking
 def get_trackingrates(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
-    validate_device("telescope", device_number)
-    return IntArrayResponse(
-        Value=[DriveRates.SIDEREAL, DriveRates.LUNAR, DriveRates.SOLAR, DriveRates.KING],
-        ClientTransactionID=ClientTransactionID,
-        ServerTransactionID=get_server_transaction_id(),
+    def compute():
+        validate_device("telescope", device_number)
+        return [DriveRates.SIDEREAL, DriveRates.LUNAR, DriveRates.SOLAR, DriveRates.KING]
+
+    return static_value_response(
+        ("telescope", device_number, "trackingrates"),
+        IntArrayResponse,
+        compute,
+        ClientTransactionID,
     )
 
 
 @router.get("/telescope/{device_number}/utcdate", response_model=StringResponse)
+@nonblocking
 def get_utcdate(device_number: int = Path(..., ge=0), ClientTransactionID: int = Query(0)):
     validate_device("telescope", device_number)
     utc_now = datetime.now(timezone.utc)
@@ -1171,6 +928,7 @@ def get_utcdate(device_number: int = Path(..., ge=0), ClientTransactionID: int =
 
 
 @router.put("/telescope/{device_number}/utcdate", response_model=AlpacaResponse)
+@nonblocking
 def set_utcdate(
     device_number: int = Path(..., ge=0),
     UTCDate: str = Form(...),
@@ -1191,6 +949,7 @@ def set_utcdate(
 
 
 @router.put("/telescope/{device_number}/abortslew", response_model=AlpacaResponse)
+@nonblocking
 def abortslew(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("telescope", device_number)
     state = get_device_state("telescope", device_number)
@@ -1216,6 +975,7 @@ def abortslew(device_number: int = Path(..., ge=0), ClientTransactionID: int = F
 
 
 @router.get("/telescope/{device_number}/axisrates", response_model=RateArrayResponse)
+@nonblocking
 def get_axisrates(
     device_number: int = Path(..., ge=0),
     Axis: int = Query(...),
@@ -1242,6 +1002,7 @@ def get_axisrates(
 
 
 @router.get("/telescope/{device_number}/canmoveaxis", response_model=BoolResponse)
+@nonblocking
 def get_canmoveaxis(
     device_number: int = Path(..., ge=0),
     Axis: int = Query(...),
@@ -1266,6 +1027,7 @@ def get_canmoveaxis(
 
 
 @router.get("/telescope/{device_number}/destinationsideofpier", response_model=IntResponse)
+@nonblocking
 def get_destinationsideofpier(
     device_number: int = Path(..., ge=0),
     RightAscension: float = Query(...),
@@ -1289,6 +1051,7 @@ def get_destinationsideofpier(
 
 
 @router.put("/telescope/{device_number}/findhome", response_model=AlpacaResponse)
+@nonblocking
 def findhome(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("telescope", device_number)
     state = get_device_state("telescope", device_number)
@@ -1308,6 +1071,7 @@ def findhome(device_number: int = Path(..., ge=0), ClientTransactionID: int = Fo
 
 
 @router.put("/telescope/{device_number}/moveaxis", response_model=AlpacaResponse)
+@nonblocking
 def moveaxis(
     device_number: int = Path(..., ge=0),
     Axis: int = Form(...),
@@ -1376,6 +1140,7 @@ def moveaxis(
 
 
 @router.put("/telescope/{device_number}/park", response_model=AlpacaResponse)
+@nonblocking
 def park(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("telescope", device_number)
     # state = get_device_state("telescope", device_number)
@@ -1406,6 +1171,7 @@ def park(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0
 
 
 @router.put("/telescope/{device_number}/pulseguide", response_model=AlpacaResponse)
+@nonblocking
 def pulseguide(
     device_number: int = Path(..., ge=0),
     Direction: int = Form(...),
@@ -1465,6 +1231,7 @@ def pulseguide(
 
 
 @router.put("/telescope/{device_number}/setpark", response_model=AlpacaResponse)
+@nonblocking
 def setpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("telescope", device_number)
     state = get_device_state("telescope", device_number)
@@ -1489,6 +1256,7 @@ def setpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = For
 
 
 @router.put("/telescope/{device_number}/slewtoaltaz", response_model=AlpacaResponse)
+@nonblocking
 def slewtoaltaz(
     device_number: int = Path(..., ge=0),
     Azimuth: float = Form(...),
@@ -1535,6 +1303,7 @@ def slewtoaltaz(
 
 
 @router.put("/telescope/{device_number}/slewtoaltazasync", response_model=AlpacaResponse)
+@nonblocking
 def slewtoaltazasync(
     device_number: int = Path(..., ge=0),
     Azimuth: float = Form(...),
@@ -1573,6 +1342,7 @@ def slewtoaltazasync(
 
 
 @router.put("/telescope/{device_number}/slewtocoordinates", response_model=AlpacaResponse)
+@nonblocking
 def slewtocoordinates(
     device_number: int = Path(..., ge=0),
     RightAscension: float = Form(...),
@@ -1610,6 +1380,7 @@ def slewtocoordinates(
 
 
 @router.put("/telescope/{device_number}/slewtocoordinatesasync", response_model=AlpacaResponse)
+@nonblocking
 def slewtocoordinatesasync(
     device_number: int = Path(..., ge=0),
     RightAscension: float = Form(...),
@@ -1650,6 +1421,7 @@ def slewtocoordinatesasync(
 
 
 @router.put("/telescope/{device_number}/slewtotarget", response_model=AlpacaResponse)
+@nonblocking
 def slewtotarget(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("telescope", device_number)
     state = get_device_state("telescope", device_number)
@@ -1680,6 +1452,7 @@ def slewtotarget(device_number: int = Path(..., ge=0), ClientTransactionID: int
 
 
 @router.put("/telescope/{device_number}/slewtotargetasync", response_model=AlpacaResponse)
+@nonblocking
 def slewtotargetasync(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("telescope", device_number)
     state = get_device_state("telescope", device_number)
@@ -1713,6 +1486,7 @@ def slewtotargetasync(device_number: int = Path(..., ge=0), ClientTransactionID:
 
 
 @router.put("/telescope/{device_number}/synctoaltaz", response_model=AlpacaResponse)
+@nonblocking
 def synctoaltaz(
     device_number: int = Path(..., ge=0),
     Azimuth: float = Form(...),
@@ -1739,6 +1513,7 @@ def synctoaltaz(
 
 
 @router.put("/telescope/{device_number}/synctocoordinates", response_model=AlpacaResponse)
+@nonblocking
 def synctocoordinates(
     device_number: int = Path(..., ge=0),
     RightAscension: float = Form(...),
@@ -1774,6 +1549,7 @@ def synctocoordinates(
 
 
 @router.put("/telescope/{device_number}/synctotarget", response_model=AlpacaResponse)
+@nonblocking
 def synctotarget(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("telescope", device_number)
     state = get_device_state("telescope", device_number)
@@ -1799,6 +1575,7 @@ def synctotarget(device_number: int = Path(..., ge=0), ClientTransactionID: int
 
 
 @router.put("/telescope/{device_number}/unpark", response_model=AlpacaResponse)
+@nonblocking
 def unpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form(0)):
     validate_device("telescope", device_number)
     # state = get_device_state("telescope", device_number)
@@ -1812,3 +1589,45 @@ def unpark(device_number: int = Path(..., ge=0), ClientTransactionID: int = Form
         ClientTransactionID=ClientTransactionID,
         ServerTransactionID=get_server_transaction_id(),
     )
+
+
+PROPERTIES = {
+    "alignmentmode": AlignmentModes.GERMAN_POLAR,
+    "altitude": 0.0,
+    "aperturediameter": 8.0,
+    "athome": False,
+    "atpark": False,
+    "azimuth": 0.0,
+    "canfindhome": True,
+    "canpark": True,
+    "canpulseguide": True,
+    "cansetdeclinationrate": True,
+    "cansetguiderates": True,
+    "cansetpark": True,
+    "cansetpierside": True,
+    "cansetrightascensionrate": True,
+    "cansettracking": True,
+    "canslew": True,
+    "canslewaltaz": True,
+    "canslewaltazasync": True,
+    "canslewasync": True,
+    "cansync": True,
+    "cansyncaltaz": True,
+    "canunpark": True,
+    "declinationrate": 0.0,
+    "doesrefraction": True,
+    "equatorialsystem": EquatorialCoordinateType.TOPOCENTRIC,
+    "focallength": 1000.0,
+    "guideratedeclination": 15.0,
+    "guideraterightascension": 15.0,
+    "ispulseguiding": False,
+    "rightascensionrate": 0.0,
+    "sideofpier": PierSide.UNKNOWN,
+    "siteelevation": 0.0,
+    "sitelatitude": 0.0,
+    "sitelongitude": 0.0,
+    "slewing": False,
+    "tracking": False,
+    "trackingrate": DriveRates.SIDEREAL,
+}
+add_property_routes(router, "telescope", PROPERTIES)
@@ -0,0 +1,148 @@
+"""
+Non-standard batch endpoint: many Alpaca requests in one round trip.
+
+``POST /api/batch`` takes a JSON list of requests such as
+``{"device_type": "telescope", "device_number": 0, "member": "rightascension"}`` (method
+defaults to GET; PUTs give their parameters in ``params``) and runs each through the app
+as if it had been sent on its own, in order. Reads come from one copy of the state of
+every device named in the batch, taken at once, plus the changes the batch's own
+requests make (see ``state.state_snapshot``), so a status refresh sees the mount, dome
+and camera at the same instant; telescope motion during the batch is not applied to the
+copy. Each result carries the HTTP status and the response the request would have
+received, which for Alpaca errors holds the ErrorNumber as usual.
+
+Work a request leaves running after its response, such as the background task of a slew
+or an exposure, carries on as its own task against the live state, as it would for a
+request sent on its own; the batch moves on as soon as the response is complete.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Literal
+from urllib.parse import urlencode
+
+from pydantic import BaseModel, Field
+
+from alpaca_simulators.routing import ALPACA_PREFIX
+from alpaca_simulators.state import (
+    detach_state_snapshot,
+    state_snapshot,
+    validate_device_exists,
+)
+
+MAX_BATCH = 256
+
+# Batched requests whose background work is still running, kept so they are not
+# garbage collected mid-flight.
+_running: set[asyncio.Task] = set()
+
+
+class BatchRequest(BaseModel):
+    device_type: str
+    device_number: int = Field(..., ge=0)
+    member: str
+    method: Literal["GET", "PUT"] = "GET"
+    params: dict[str, Any] = {}
+
+
+class BatchResult(BaseModel):
+    device_type: str
+    device_number: int
+    member: str
+    method: str
+    status: int
+    response: Any
+
+
+def _param(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+async def _call(app, request: BatchRequest) -> tuple[int, Any]:
+    """Run one request through the ASGI app and return its status and decoded body."""
+    query = urlencode({name: _param(value) for name, value in request.params.items()})
+    body = b""
+    headers = []
+    if request.method == "PUT":
+        query, body = "", query.encode()
+        headers = [(b"content-type", b"application/x-www-form-urlencoded")]
+    path = "/".join(
+        (ALPACA_PREFIX, request.device_type, str(request.device_number), request.member)
+    ).lower()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": request.method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": headers,
+        "client": None,
+        "server": None,
+        "app": app,
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status = 500
+    chunks = []
+    responded = asyncio.Event()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                # Background tasks run after this, in the request's task: keep them off
+                # the batch's snapshot.
+                detach_state_snapshot()
+                responded.set()
+
+    async def run():
+        try:
+            await app(scope, receive, send)
+        except Exception as e:
+            # Errors after the response (in background tasks) have nowhere else to go.
+            logging.error(f"Batched request {request.method} {path} failed: {e!r}")
+        finally:
+            responded.set()
+
+    task = asyncio.create_task(run())
+    _running.add(task)
+    task.add_done_callback(_running.discard)
+    await responded.wait()
+    content = b"".join(chunks)
+    try:
+        return status, json.loads(content)
+    except ValueError:
+        return status, content.decode("utf-8", "replace")
+
+
+async def run_batch(app, requests: list[BatchRequest]) -> list[BatchResult]:
+    """Run requests in order against one snapshot of the devices they name."""
+    devices = list(
+        dict.fromkeys(
+            (request.device_type.lower(), request.device_number)
+            for request in requests
+            if validate_device_exists(request.device_type.lower(), request.device_number)
+        )
+    )
+    results = []
+    with state_snapshot(devices):
+        for request in requests:
+            status, response = await _call(app, request)
+            results.append(
+                BatchResult(
+                    **request.model_dump(exclude={"params"}), status=status, response=response
+                )
+            )
+    return results
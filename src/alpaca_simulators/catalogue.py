@@ -0,0 +1,124 @@
+"""
+Star catalogue fetches shared between cameras on the same telescope.
+
+Cameras behind one telescope point at the same sky, so their Gaia queries are coalesced:
+the first camera to need a field fetches it with a radius covering every camera on the
+telescope, concurrent requests for the same pointing and catalogue wait for that single
+fetch when it covers their radius, and the result is kept so later exposures at the same
+pointing reuse it.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime, timezone
+
+import cabaret
+from cabaret.queries import GaiaQuery
+
+# Fields are fetched around the pointing rounded to this many degrees, with the rounding
+# and a margin added to the radius so nearby pointings share one fetch.
+POINTING_RESOLUTION = 0.001
+RADIUS_MARGIN = 1.1
+MAX_STAR_LIMIT = 20000
+_MAX_CACHED_FIELDS = 16
+
+_inflight: dict[tuple, tuple[float, Future]] = {}
+_fields: OrderedDict[tuple, tuple[float, cabaret.Sources]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def field_radius(cam_state: dict, tel_state: dict) -> float:
+    """Half-diagonal field of view of a camera behind a telescope, in degrees."""
+    cabaret_camera = cabaret.Camera(
+        width=cam_state.get("numx", 1024) * cam_state.get("binx", 1),
+        height=cam_state.get("numy", 1024) * cam_state.get("biny", 1),
+        pitch=cam_state.get("pixelsizex", 10.0),
+    )
+    cabaret_camera.set_plate_scale_from_focal_length(tel_state.get("focallength", 8.0))
+    return float(cabaret_camera.get_fov_radius().deg)
+
+
+def _pointing_key(telescope_number: int, ra_deg: float, dec_deg: float, tap_source) -> tuple:
+    return (
+        telescope_number,
+        round(ra_deg / POINTING_RESOLUTION) * POINTING_RESOLUTION,
+        round(dec_deg / POINTING_RESOLUTION) * POINTING_RESOLUTION,
+        tap_source,
+    )
+
+
+def _fetch(key: tuple, entry: tuple[float, Future], limit: int, timeout: float) -> None:
+    radius, future = entry
+    try:
+        sources = GaiaQuery.get_sources(
+            center=(key[1], key[2]),
+            radius=radius,
+            dateobs=datetime.now(timezone.utc),
+            limit=limit,
+            timeout=timeout,
+            tap_source=key[3],
+        )
+    except BaseException as e:
+        with _lock:
+            if _inflight.get(key) is entry:
+                del _inflight[key]
+        future.set_exception(e)
+        return
+
+    with _lock:
+        if _inflight.get(key) is entry:
+            del _inflight[key]
+        cached = _fields.get(key)
+        if cached is None or cached[0] < radius:
+            _fields[key] = (radius, sources)
+        while len(_fields) > _MAX_CACHED_FIELDS:
+            _fields.popitem(last=False)
+    future.set_result(sources)
+
+
+def get_shared_sources(
+    telescope_number: int,
+    ra_deg: float,
+    dec_deg: float,
+    radius: float,
+    min_radius: float,
+    n_star_limit: int = 2000,
+    timeout: float | None = None,
+    tap_source=None,
+) -> cabaret.Sources:
+    """Return the stars within radius of a telescope pointing, fetching them at most once.
+
+    radius should cover the largest camera on the telescope and min_radius the smallest;
+    the star limit is scaled by their area ratio so the smallest field still receives
+    about n_star_limit stars. Blocks until the shared fetch completes; a fetch already in
+    flight is only joined if its radius covers this one.
+    """
+    key = _pointing_key(telescope_number, ra_deg, dec_deg, tap_source)
+    radius = radius * RADIUS_MARGIN + POINTING_RESOLUTION
+
+    with _lock:
+        cached = _fields.get(key)
+        if cached is not None and cached[0] >= radius:
+            _fields.move_to_end(key)
+            return cached[1]
+        entry = _inflight.get(key)
+        owner = entry is None or entry[0] < radius
+        if owner:
+            entry = (radius, Future())
+            _inflight[key] = entry
+        future = entry[1]
+
+    if owner:
+        scale = (radius / max(min_radius, 1e-9)) ** 2
+        limit = min(MAX_STAR_LIMIT, math.ceil(n_star_limit * scale))
+        _fetch(key, entry, limit, timeout)
+
+    return future.result()
+
+
+def clear() -> None:
+    """Forget all cached fields."""
+    with _lock:
+        _fields.clear()
@@ -0,0 +1,104 @@
+"""
+Alpaca UDP discovery responder.
+
+Alpaca clients find servers by broadcasting ``alpacadiscovery1`` to UDP port 32227; each
+server answers with the port its HTTP API listens on. The reply never changes, so it is
+encoded once. The socket is opened with SO_REUSEADDR, so several simulators on one host
+all receive the broadcast and each answers for itself. Only IPv4 broadcast discovery is
+implemented.
+"""
+
+import asyncio
+import json
+import logging
+import socket
+import threading
+
+DISCOVERY_PORT = 32227
+DISCOVERY_MESSAGE = b"alpacadiscovery1"
+RECEIVE_BUFFER = 4 * 1024 * 1024
+
+
+class DiscoveryProtocol(asyncio.DatagramProtocol):
+    def __init__(self, alpaca_port: int):
+        self.reply = json.dumps({"AlpacaPort": alpaca_port}).encode()
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if data.startswith(DISCOVERY_MESSAGE):
+            self.transport.sendto(self.reply, addr)
+
+
+def discovery_socket(port: int = DISCOVERY_PORT, host: str = "") -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    sock.bind((host, port))
+    return sock
+
+
+async def serve_discovery(alpaca_port: int, port: int = DISCOVERY_PORT) -> None:
+    """Answer discovery requests for a server on ``alpaca_port`` until cancelled."""
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: DiscoveryProtocol(alpaca_port), sock=discovery_socket(port)
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        transport.close()
+
+
+def start_discovery_responder(alpaca_port: int, port: int = DISCOVERY_PORT) -> None:
+    """Answer discovery requests from a background thread for the life of the process."""
+
+    def run():
+        try:
+            asyncio.run(serve_discovery(alpaca_port, port))
+        except OSError as e:
+            logging.warning(f"Alpaca discovery disabled, cannot listen on UDP {port}: {e}")
+
+    threading.Thread(target=run, name="alpaca-discovery", daemon=True).start()
+
+
+async def discover(
+    timeout: float = 1.0,
+    port: int = DISCOVERY_PORT,
+    address: str = "255.255.255.255",
+    expected: int | None = None,
+) -> list[tuple[str, int]]:
+    """Broadcast a discovery request and return the (host, Alpaca port) of each answer.
+
+    Waits ``timeout`` seconds for answers, or until ``expected`` servers have answered.
+    """
+    loop = asyncio.get_running_loop()
+    found = []
+    done = asyncio.Event()
+
+    class Collector(asyncio.DatagramProtocol):
+        def datagram_received(self, data, addr):
+            try:
+                found.append((addr[0], int(json.loads(data)["AlpacaPort"])))
+            except (ValueError, KeyError, TypeError):
+                return
+            if expected is not None and len(found) >= expected:
+                done.set()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    # Answers from a large fleet arrive at once; don't let a small buffer drop them.
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER)
+    sock.bind(("", 0))
+    transport, _ = await loop.create_datagram_endpoint(Collector, sock=sock)
+    try:
+        transport.sendto(DISCOVERY_MESSAGE, (address, port))
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+    finally:
+        transport.close()
+    return found
@@ -1,6 +1,8 @@
 """
 Dynamic endpoint discovery for the observatory simulator.
 Analyzes the FastAPI application to determine available endpoints for each device type.
+
+The analysis is memoised per application and only redone when its set of routes changes.
 """
 
 import inspect
@@ -8,16 +10,39 @@ import inspect
 from fastapi import FastAPI
 
 
+def _iter_routes(routes):
+    """Yield every route, flattening routers that newer FastAPI versions keep included."""
+    for route in routes:
+        if hasattr(route, "effective_route_contexts"):
+            yield from route.effective_route_contexts()
+        else:
+            yield route
+
+
+# Discovery results by application, with the routes they were computed from.
+_discovered: dict[int, tuple[tuple[int, ...], dict[str, dict[str, list[str]]]]] = {}
+
+
 def discover_device_endpoints(app: FastAPI) -> dict[str, dict[str, list[str]]]:
     """
     Discover all available endpoints for each device type by analyzing the FastAPI routes.
 
     Returns a dictionary mapping device types to their available GET and PUT endpoints.
+    The same dictionary is returned until a route is added to or removed from the app, so
+    callers must not modify it.
     """
+    routes = tuple(map(id, app.routes))
+    cached = _discovered.get(id(app))
+    if cached is None or cached[0] != routes:
+        cached = _discovered[id(app)] = (routes, _discover(app))
+    return cached[1]
+
+
+def _discover(app: FastAPI) -> dict[str, dict[str, list[str]]]:
     device_endpoints = {}
 
     # Extract routes from the FastAPI app
-    for route in app.routes:
+    for route in _iter_routes(app.routes):
         if hasattr(route, "path") and hasattr(route, "methods"):
             path = route.path
             methods = route.methods
@@ -42,6 +67,19 @@ def discover_device_endpoints(app: FastAPI) -> dict[str, dict[str, list[str]]]:
                     if property_name == "{device_number}":
                         continue
 
+                    # Table-generated getters serve many properties from one route
+                    generated = getattr(endpoint_func, "properties", None)
+                    if generated is not None:
+                        device_entry = device_endpoints.setdefault(
+                            device_type, {"GET": [], "PUT": [], "info": {}}
+                        )
+                        for name in generated:
+                            device_entry["GET"].append(name)
+                            device_entry["info"].setdefault(
+                                name, {"name": "Value", "type": "bool"}
+                            )
+                        continue
+
                     params = []
                     for param_name, param in sig.parameters.items():
                         if param_name not in [
@@ -0,0 +1,97 @@
+"""
+Fleet mode: many simulated observatories generated from one site template.
+
+With a ``fleet`` section in the config, the ``devices`` and ``topology`` sections describe
+a single site, which is repeated ``sites`` times. Device numbers run on across sites, so
+with one telescope per site, site 3's telescope is telescope 3. Each site's cameras image
+through that site's own devices. Overrides are keyed by site index:
+
+    fleet:
+      sites: 250
+      overrides:
+        1:
+          latitude: -24.6         # sitelatitude/sitelongitude/siteelevation of the site
+          longitude: -70.4
+          counts: {camera: 2}     # devices of each type at this site (default: template)
+          camera: {gain: 2}       # merged into the config of every camera at this site
+
+Device configs are shallow copies of the template, and device state is still only
+created when a device is first used, so large fleets stay cheap until they are exercised.
+"""
+
+from typing import Any
+
+# Site-wide shorthands in overrides and the device config keys they set.
+SITE_KEYS = {
+    "latitude": "sitelatitude",
+    "longitude": "sitelongitude",
+    "elevation": "siteelevation",
+}
+
+
+def _template_entry(template: dict[int, dict], local_number: int) -> dict[str, Any]:
+    # Sites with more devices than the template repeat its last device.
+    numbers = sorted(template)
+    return template[numbers[min(local_number, len(numbers) - 1)]]
+
+
+def expand_fleet(config: dict[str, Any]) -> dict[str, Any]:
+    """Expand a config with a ``fleet`` section into one listing every site's devices.
+
+    Configs without a ``fleet`` section are returned unchanged.
+    """
+    fleet = config.get("fleet")
+    if not fleet:
+        return config
+
+    sites = int(fleet.get("sites", 1))
+    overrides = fleet.get("overrides") or {}
+    template_devices = {
+        device_type: entries
+        for device_type, entries in (config.get("devices") or {}).items()
+        if entries
+    }
+    template_topology = config.get("topology") or {}
+
+    devices: dict[str, dict[int, dict]] = {device_type: {} for device_type in template_devices}
+    topology: dict[int, dict[str, int | None]] = {}
+    next_number = dict.fromkeys(template_devices, 0)
+
+    for site in range(sites):
+        site_overrides = overrides.get(site) or {}
+        counts = site_overrides.get("counts") or {}
+        site_values = {
+            key: site_overrides[shorthand]
+            for shorthand, key in SITE_KEYS.items()
+            if shorthand in site_overrides
+        }
+
+        # First device number of each type at this site, and how many it has.
+        offsets = dict(next_number)
+        site_counts = {}
+        for device_type, template in template_devices.items():
+            count = int(counts.get(device_type, len(template)))
+            site_counts[device_type] = count
+            type_overrides = site_overrides.get(device_type) or {}
+            for local_number in range(count):
+                entry = dict(_template_entry(template, local_number))
+                entry.update({k: v for k, v in site_values.items() if k in entry})
+                entry.update(type_overrides)
+                if "name" in entry:
+                    entry["name"] = f"{entry['name']} (site {site})"
+                devices[device_type][offsets[device_type] + local_number] = entry
+            next_number[device_type] += count
+
+        for local_camera in range(site_counts.get("camera", 0)):
+            train = template_topology.get(local_camera) or {}
+            site_train = {}
+            for device_type, count in site_counts.items():
+                if device_type == "camera":
+                    continue
+                local_number = train.get(device_type, 0)
+                site_train[device_type] = (
+                    offsets[device_type] + local_number if local_number < count else None
+                )
+            topology[offsets["camera"] + local_camera] = site_train
+
+    return dict(config, devices=devices, topology=topology)
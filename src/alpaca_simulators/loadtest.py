@@ -0,0 +1,307 @@
+"""
+HTTP load benchmark: drive the simulator with a realistic mix of observatory clients.
+
+Four kinds of client run concurrently until --duration is up, each in a closed loop:
+
+- mount polling: reads the telescope and dome properties an observatory UI refreshes;
+- exposure loop: starts an exposure, polls ``imageready`` and downloads the image;
+- guiding: sends pulse guides and waits for ``ispulseguiding`` to clear;
+- dome slaving: reads the telescope position and slews the dome to follow it.
+
+The server is started in this process on a free loopback port, or with ``--spawn`` as a
+separate ``alpaca-simulators`` process, or ``--url`` points at one already running.
+Requests per second and p50/p95/p99 latency per endpoint are written as JSON, and
+``--compare`` prints how they changed against an earlier run's JSON.
+
+Client requests use httpx (pip install httpx).
+
+Usage:
+    alpaca-simulators-bench --duration 30 --output run.json
+    alpaca-simulators-bench --spawn --compare run.json
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from alpaca_simulators.routing import ALPACA_PREFIX
+from alpaca_simulators.state import GuideDirections
+
+MOUNT_PROPERTIES = [
+    "telescope/0/rightascension",
+    "telescope/0/declination",
+    "telescope/0/altitude",
+    "telescope/0/azimuth",
+    "telescope/0/slewing",
+    "telescope/0/tracking",
+    "dome/0/azimuth",
+    "dome/0/shutterstatus",
+    "dome/0/slewing",
+]
+
+
+class Recorder:
+    """Latencies and errors per endpoint, keyed ``METHOD path``."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def request(self, client, method: str, path: str, **kwargs):
+        """Send a request and return the response JSON, or None if it failed."""
+        endpoint = f"{method} {ALPACA_PREFIX}/{path}"
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, f"{ALPACA_PREFIX}/{path}", **kwargs)
+        except Exception:
+            self.errors[endpoint] += 1
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        if response.status_code != 200:
+            self.errors[endpoint] += 1
+            return None
+        if response.headers.get("content-type", "").startswith("application/json"):
+            body = response.json()
+            if body.get("ErrorNumber", 0):
+                self.errors[endpoint] += 1
+                return None
+            return body
+        return {}
+
+
+async def mount_polling(client, recorder: Recorder, stop: float, offset: int) -> None:
+    i = offset
+    while time.perf_counter() < stop:
+        await recorder.request(client, "GET", MOUNT_PROPERTIES[i % len(MOUNT_PROPERTIES)])
+        i += 1
+
+
+async def exposure_loop(
+    client, recorder: Recorder, stop: float, camera: int, exposure: float
+) -> None:
+    while time.perf_counter() < stop:
+        started = await recorder.request(
+            client,
+            "PUT",
+            f"camera/{camera}/startexposure",
+            data={"Duration": exposure, "Light": "false"},
+        )
+        if started is None:
+            await asyncio.sleep(exposure)
+            continue
+        while time.perf_counter() < stop:
+            ready = await recorder.request(client, "GET", f"camera/{camera}/imageready")
+            if ready is not None and ready["Value"]:
+                await recorder.request(client, "GET", f"camera/{camera}/imagearray")
+                break
+            await asyncio.sleep(0.05)
+
+
+async def guiding(client, recorder: Recorder, stop: float, pulse_ms: int) -> None:
+    directions = [
+        GuideDirections.NORTH,
+        GuideDirections.EAST,
+        GuideDirections.SOUTH,
+        GuideDirections.WEST,
+    ]
+    await recorder.request(client, "PUT", "telescope/0/unpark")
+    i = 0
+    while time.perf_counter() < stop:
+        await recorder.request(
+            client,
+            "PUT",
+            "telescope/0/pulseguide",
+            data={"Direction": directions[i % 4], "Duration": pulse_ms},
+        )
+        i += 1
+        while time.perf_counter() < stop:
+            guiding = await recorder.request(client, "GET", "telescope/0/ispulseguiding")
+            if guiding is None or not guiding["Value"]:
+                break
+            await asyncio.sleep(pulse_ms / 4000)
+
+
+async def dome_slaving(client, recorder: Recorder, stop: float) -> None:
+    while time.perf_counter() < stop:
+        azimuth = await recorder.request(client, "GET", "telescope/0/azimuth")
+        if azimuth is not None:
+            await recorder.request(
+                client, "PUT", "dome/0/slewtoazimuth", data={"Azimuth": azimuth["Value"] % 360}
+            )
+        await recorder.request(client, "GET", "dome/0/slewing")
+
+
+async def run_mix(url: str, args: argparse.Namespace) -> Recorder:
+    try:
+        import httpx
+    except ImportError as e:
+        raise SystemExit("The load benchmark requires httpx (pip install httpx)") from e
+
+    clients = args.pollers + args.cameras + args.guiders + args.domes
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    recorder = Recorder()
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        stop = time.perf_counter() + args.duration
+        await asyncio.gather(
+            *(mount_polling(client, recorder, stop, i) for i in range(args.pollers)),
+            *(
+                exposure_loop(client, recorder, stop, i, args.exposure)
+                for i in range(args.cameras)
+            ),
+            *(guiding(client, recorder, stop, args.pulse) for _ in range(args.guiders)),
+            *(dome_slaving(client, recorder, stop) for _ in range(args.domes)),
+        )
+    return recorder
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[round(q * (len(ordered) - 1))]
+
+
+def summarise(recorder: Recorder, duration: float) -> dict:
+    endpoints = {}
+    for endpoint in sorted(recorder.latencies.keys() | recorder.errors.keys()):
+        ordered = sorted(recorder.latencies.get(endpoint, ()))
+        entry = {
+            "requests": len(ordered),
+            "errors": recorder.errors.get(endpoint, 0),
+            "rps": len(ordered) / duration,
+        }
+        if ordered:
+            for name, q in (("p50_ms", 0.5), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+                entry[name] = _percentile(ordered, q) * 1e3
+        endpoints[endpoint] = entry
+    requests = sum(entry["requests"] for entry in endpoints.values())
+    return {
+        "requests": requests,
+        "errors": sum(entry["errors"] for entry in endpoints.values()),
+        "rps": requests / duration,
+        "endpoints": endpoints,
+    }
+
+
+def compare(result: dict, baseline: dict) -> str:
+    """A table of how throughput and latency changed against ``baseline``."""
+
+    def change(new, old):
+        return f"{(new - old) / old * 100:+.1f}%" if new is not None and old else "n/a"
+
+    lines = [f"{'endpoint':<50} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9}"]
+    rows = [("total", result, baseline)] + [
+        (endpoint, entry, baseline["endpoints"][endpoint])
+        for endpoint, entry in result["endpoints"].items()
+        if endpoint in baseline["endpoints"]
+    ]
+    for endpoint, new, old in rows:
+        keys = ("rps", "p50_ms", "p95_ms", "p99_ms")
+        changes = [change(new.get(key), old.get(key)) for key in keys]
+        lines.append(f"{endpoint:<50} " + " ".join(f"{c:>9}" for c in changes))
+    return "\n".join(lines)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_server(url: str, timeout: float = 30.0) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{url}/management/apiversions").status_code == 200:
+                return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not start")
+
+
+def start_in_process(port: int):
+    """Run the app under uvicorn in a daemon thread of this process."""
+    import uvicorn
+
+    server = uvicorn.Server(
+        uvicorn.Config("alpaca_simulators.main:app", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, name="benchmark-server", daemon=True).start()
+    return server
+
+
+def start_process(port: int, config: str) -> subprocess.Popen:
+    command = [sys.executable, "-m", "alpaca_simulators.run_simulator", "--host", "127.0.0.1"]
+    command += ["--port", str(port), "--config", config, "--discovery-port", "0"]
+    # The server prints to stdout, where the JSON result goes.
+    return subprocess.Popen(command, stdout=subprocess.DEVNULL)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Benchmark a running server, e.g. http://127.0.0.1:11111.")
+    target.add_argument(
+        "--spawn",
+        action="store_true",
+        help="Start the server as a separate process rather than in this one.",
+    )
+    parser.add_argument("--config", default="config.yaml", help="Config for --spawn.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run.")
+    parser.add_argument("--pollers", type=int, default=20, help="Mount polling clients.")
+    parser.add_argument("--cameras", type=int, default=1, help="Exposure loops, one per camera.")
+    parser.add_argument("--guiders", type=int, default=1, help="Guiding clients.")
+    parser.add_argument("--domes", type=int, default=1, help="Dome slaving clients.")
+    parser.add_argument("--exposure", type=float, default=0.1, help="Exposure time (s).")
+    parser.add_argument("--pulse", type=int, default=50, help="Guide pulse length (ms).")
+    parser.add_argument("--output", help="Write the JSON result to this file.")
+    parser.add_argument("--compare", help="Print changes against an earlier JSON result.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+
+    server = process = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        if args.spawn:
+            process = start_process(port, args.config)
+        else:
+            server = start_in_process(port)
+    try:
+        wait_for_server(url)
+        recorder = asyncio.run(run_mix(url, args))
+    finally:
+        if server is not None:
+            server.should_exit = True
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    result = summarise(recorder, args.duration)
+    result["settings"] = {
+        key: getattr(args, key)
+        for key in ("duration", "pollers", "cameras", "guiders", "domes", "exposure", "pulse")
+    }
+    result["server"] = "url" if args.url else "process" if args.spawn else "in-process"
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print(compare(result, json.load(f)))
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
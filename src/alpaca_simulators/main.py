@@ -1,11 +1,20 @@
+import hashlib
 import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Request
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.templating import Jinja2Templates
 
+from alpaca_simulators.admin import router as admin_router
 from alpaca_simulators.api import (
     camera,
     common,
@@ -20,22 +29,41 @@ from alpaca_simulators.api import (
     telescope,
 )
 from alpaca_simulators.api.common import AlpacaError
-from alpaca_simulators.config import Config
+from alpaca_simulators.api.forms import get_parameter
+from alpaca_simulators.batch import MAX_BATCH, BatchRequest, BatchResult, run_batch
 from alpaca_simulators.endpoint_discovery import (
     discover_device_endpoints,
     get_action_endpoints,
 )
+from alpaca_simulators.management import router as management_router
+from alpaca_simulators.metrics import MetricsMiddleware, render_metrics
+from alpaca_simulators.routing import ALPACA_PREFIX, AlpacaDispatcher
+from alpaca_simulators.sharding import ShardRouter, get_shard_routes
 from alpaca_simulators.state import (
     get_all_configured_devices,
     get_server_transaction_id,
+    get_setting,
     reload_config,
+    set_setting,
+    uses_state_server,
 )
+from alpaca_simulators.streaming import parse_topics, state_stream
+from alpaca_simulators.tracing import query_spans
+
+# Size of the threadpool running blocking handlers (image downloads, previews); anyio's
+# default of 40 is kept unless this is set.
+THREADS_ENV = "ALPACA_SIMULATORS_THREADS"
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    devices = get_all_configured_devices()
-    telescope.start_background_updater(devices.get("telescope", []))
+    threads = os.environ.get(THREADS_ENV)
+    if threads:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = int(threads)
+    # With several workers the state server advances the telescopes instead.
+    if not uses_state_server():
+        devices = get_all_configured_devices()
+        telescope.start_background_updater(devices.get("telescope", []))
     yield
 
 
@@ -57,24 +85,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# In sharded mode the front process forwards device requests to the owning shard.
+shard_routes = get_shard_routes()
+if shard_routes:
+    app.add_middleware(ShardRouter, routes=shard_routes)
+
+# Outermost, so requests forwarded to shards are counted too.
+app.add_middleware(MetricsMiddleware)
+
 # Setup templates
 templates = Jinja2Templates(directory=os.path.join(os.path.dirname(__file__), "templates"))
 
 
-@app.exception_handler(AlpacaError)
-async def alpaca_exception_handler(request: Request, exc: AlpacaError):
-    client_transaction_id = 0
+def _client_transaction_id(request: Request) -> int:
+    """ClientTransactionID from the query string or the PUT body, whatever its case.
 
-    # Try to get ClientTransactionID from query params
-    if "ClientTransactionID" in request.query_params:
-        try:
-            client_transaction_id = int(request.query_params["ClientTransactionID"])
-        except (ValueError, TypeError):
-            pass
+    The body is only looked at if the handler's form was already parsed (see api/forms.py);
+    it cannot be read again here.
+    """
+    try:
+        return int(get_parameter(request, "ClientTransactionID", 0))
+    except (ValueError, TypeError):
+        return 0
 
-    # Note: We don't try to read the request body here as it may have been
-    # consumed by FastAPI's form parsing. The ClientTransactionID should be
-    # handled by the endpoint itself if it's in the body.
+
+@app.exception_handler(AlpacaError)
+async def alpaca_exception_handler(request: Request, exc: AlpacaError):
+    client_transaction_id = _client_transaction_id(request)
 
     return JSONResponse(
         status_code=200,  # Per Alpaca spec, most errors return HTTP 200
@@ -90,13 +127,7 @@ async def alpaca_exception_handler(request: Request, exc: AlpacaError):
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions and convert them to Alpaca format when appropriate"""
-    client_transaction_id = 0
-
-    if "ClientTransactionID" in request.query_params:
-        try:
-            client_transaction_id = int(request.query_params["ClientTransactionID"])
-        except (ValueError, TypeError):
-            pass
+    client_transaction_id = _client_transaction_id(request)
 
     error_response = {
         "error": {
@@ -123,13 +154,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions"""
-    client_transaction_id = 0
-
-    if "ClientTransactionID" in request.query_params:
-        try:
-            client_transaction_id = int(request.query_params["ClientTransactionID"])
-        except (ValueError, TypeError):
-            pass
+    client_transaction_id = _client_transaction_id(request)
 
     return JSONResponse(
         status_code=500,
@@ -143,17 +168,29 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 
 # Include routers
-app.include_router(common.router, prefix="/api/v1", tags=["Common"])
-app.include_router(camera.router, prefix="/api/v1", tags=["Camera"])
-app.include_router(safetymonitor.router, prefix="/api/v1", tags=["SafetyMonitor"])
-app.include_router(filterwheel.router, prefix="/api/v1", tags=["FilterWheel"])
-app.include_router(focuser.router, prefix="/api/v1", tags=["Focuser"])
-app.include_router(rotator.router, prefix="/api/v1", tags=["Rotator"])
-app.include_router(switch.router, prefix="/api/v1", tags=["Switch"])
-app.include_router(observingconditions.router, prefix="/api/v1", tags=["ObservingConditions"])
-app.include_router(covercalibrator.router, prefix="/api/v1", tags=["CoverCalibrator"])
-app.include_router(telescope.router, prefix="/api/v1", tags=["Telescope"])
-app.include_router(dome.router, prefix="/api/v1", tags=["Dome"])
+DEVICE_ROUTERS = [
+    (common.router, "Common"),
+    (camera.router, "Camera"),
+    (safetymonitor.router, "SafetyMonitor"),
+    (filterwheel.router, "FilterWheel"),
+    (focuser.router, "Focuser"),
+    (rotator.router, "Rotator"),
+    (switch.router, "Switch"),
+    (observingconditions.router, "ObservingConditions"),
+    (covercalibrator.router, "CoverCalibrator"),
+    (telescope.router, "Telescope"),
+    (dome.router, "Dome"),
+]
+for router, tag in DEVICE_ROUTERS:
+    app.include_router(router, prefix=ALPACA_PREFIX, tags=[tag])
+
+app.include_router(management_router)
+app.include_router(admin_router)
+
+# Device requests are dispatched by dict lookup rather than by walking every route.
+app.router.middleware_stack = AlpacaDispatcher(
+    app.router, [route for router, _ in DEVICE_ROUTERS for route in router.routes]
+)
 
 
 @app.get("/")
@@ -169,17 +206,35 @@ async def root():
     }
 
 
+# Rendered discovery pages by path: the discovery result each was rendered from, the
+# body and its ETag.
+_discovery_pages: dict[str, tuple[dict, bytes, str]] = {}
+
+
+def _discovery_page(request: Request, render, media_type: str) -> Response:
+    """Serve a page rendered from the discovered endpoints, re-rendering only when they
+    change and answering conditional requests for the current version with 304."""
+    endpoints = discover_device_endpoints(app)
+    page = _discovery_pages.get(request.url.path)
+    if page is None or page[0] is not endpoints:
+        body = render(endpoints)
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        page = _discovery_pages[request.url.path] = (endpoints, body, etag)
+    headers = {"ETag": page[2], "Cache-Control": "no-cache"}
+    if page[2] in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(page[1], media_type=media_type, headers=headers)
+
+
 @app.get("/test_interface", response_class=HTMLResponse)
 async def test_interface(request: Request):
     """Dynamic test interface for all devices"""
-    # Discover available endpoints dynamically
-    endpoints = discover_device_endpoints(app)
 
-    return templates.TemplateResponse(
-        request,
-        "index2.html.j2",
-        {"endpoints": endpoints},
-    )
+    def render(endpoints):
+        template = templates.get_template("index2.html.j2")
+        return template.render(endpoints=endpoints).encode()
+
+    return _discovery_page(request, render, "text/html")
 
 
 @app.get("/reload")
@@ -192,9 +247,9 @@ async def reload_config_state():
 @app.put("/sunlight")
 async def enable_sunlight(state: bool):
     """Enable or disable sunlight simulation"""
-    print(Config().load().get("sunlight"))
-    Config().load().update({"sunlight": state})
-    print(Config().load().get("sunlight"))
+    print(get_setting("sunlight"))
+    set_setting("sunlight", state)
+    print(get_setting("sunlight"))
 
     return {"message": f"Sunlight simulation {'enabled' if state else 'disabled'}"}
 
@@ -202,16 +257,16 @@ async def enable_sunlight(state: bool):
 @app.get("/sunlight")
 async def get_sunlight():
     """Get current sunlight simulation state"""
-    state = Config().load().get("sunlight", False)
+    state = get_setting("sunlight", False)
     return {"sunlight": state}
 
 
 @app.put("/bad_tracking")
 async def enable_bad_tracking(state: bool):
     """Enable or disable bad_tracking simulation"""
-    print(Config().load().get("bad_tracking"))
-    Config().load().update({"bad_tracking": state})
-    print(Config().load().get("bad_tracking"))
+    print(get_setting("bad_tracking"))
+    set_setting("bad_tracking", state)
+    print(get_setting("bad_tracking"))
 
     return {"message": f"bad_tracking simulation {'enabled' if state else 'disabled'}"}
 
@@ -219,7 +274,7 @@ async def enable_bad_tracking(state: bool):
 @app.get("/bad_tracking")
 async def get_bad_tracking():
     """Get current bad_tracking simulation state"""
-    state = Config().load().get("bad_tracking", False)
+    state = get_setting("bad_tracking", False)
     return {"bad_tracking": state}
 
 
@@ -235,17 +290,64 @@ async def api_info():
 
 
 @app.get("/api/endpoints")
-async def get_discovered_endpoints():
+async def get_discovered_endpoints(request: Request):
     """Return discovered endpoints for all device types"""
-    endpoints = discover_device_endpoints(app)
-    return {
-        "discovered_endpoints": endpoints,
-        "summary": {
-            device_type: {
-                "action_count": len(get_action_endpoints(device_type, endpoints)),
-                "total_endpoints": len(endpoints.get(device_type, {}).get("GET", []))
-                + len(endpoints.get(device_type, {}).get("PUT", [])),
+
+    def render(endpoints):
+        return JSONResponse(
+            {
+                "discovered_endpoints": endpoints,
+                "summary": {
+                    device_type: {
+                        "action_count": len(get_action_endpoints(device_type, endpoints)),
+                        "total_endpoints": len(endpoints.get(device_type, {}).get("GET", []))
+                        + len(endpoints.get(device_type, {}).get("PUT", [])),
+                    }
+                    for device_type in endpoints.keys()
+                },
             }
-            for device_type in endpoints.keys()
-        },
-    }
+        ).body
+
+    return _discovery_page(request, render, "application/json")
+
+
+@app.get("/api/stream")
+async def stream_state(topic: list[str] = Query(...)):
+    """Stream state changes of the given devices or properties as Server-Sent Events.
+
+    Topics are ``<device type>/<device number>`` or ``<device type>/<device number>/<key>``,
+    e.g. ``/api/stream?topic=telescope/0&topic=dome/0/azimuth`` (see streaming.py).
+    """
+    return StreamingResponse(
+        state_stream.events(parse_topics(topic)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/batch", response_model=list[BatchResult])
+async def batch(requests: list[BatchRequest]):
+    """Run several device requests in one round trip, against one state snapshot.
+
+    Non-standard; see batch.py for the request and result format.
+    """
+    if len(requests) > MAX_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH} requests per batch")
+    return await run_batch(app, requests)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Request counts, latency histograms and gauges in the Prometheus text format"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/traces")
+async def get_traces(
+    trace_id: str | None = None,
+    name: str | None = None,
+    camera: int | None = None,
+    limit: int = Query(100, ge=1),
+):
+    """Recent exposure pipeline spans, newest first (see tracing.py)"""
+    return query_spans(trace_id, name, camera, limit)
@@ -0,0 +1,119 @@
+"""
+Alpaca management API.
+
+``/management/apiversions``, ``/management/v1/description`` and
+``/management/v1/configureddevices`` let clients find the devices this server offers
+instead of relying on hard-coded lists. The device list is built from the configuration,
+so all three are served from values encoded once per config load (see
+``api/responses.static_value_response``).
+"""
+
+import socket
+import uuid
+
+from fastapi import APIRouter, Query
+from pydantic import BaseModel
+
+from alpaca_simulators.api.common import DRIVER_VERSION
+from alpaca_simulators.api.responses import static_value_response
+from alpaca_simulators.state import (
+    CONFIG_NAME,
+    AlpacaResponse,
+    IntArrayResponse,
+    get_all_configured_devices,
+    get_device_config,
+)
+
+router = APIRouter(prefix="/management", tags=["Management"])
+
+# Alpaca DeviceType names of the device types in the configuration.
+DEVICE_TYPE_NAMES = {
+    "camera": "Camera",
+    "covercalibrator": "CoverCalibrator",
+    "dome": "Dome",
+    "filterwheel": "FilterWheel",
+    "focuser": "Focuser",
+    "observingconditions": "ObservingConditions",
+    "rotator": "Rotator",
+    "safetymonitor": "SafetyMonitor",
+    "switch": "Switch",
+    "telescope": "Telescope",
+}
+
+
+class ServerDescription(BaseModel):
+    ServerName: str
+    Manufacturer: str
+    ManufacturerVersion: str
+    Location: str
+
+
+class ConfiguredDevice(BaseModel):
+    DeviceName: str
+    DeviceType: str
+    DeviceNumber: int
+    UniqueID: str
+
+
+class DescriptionResponse(AlpacaResponse):
+    Value: ServerDescription
+
+
+class ConfiguredDevicesResponse(AlpacaResponse):
+    Value: list[ConfiguredDevice]
+
+
+def unique_id(device_type: str, device_number: int) -> str:
+    """A device's UniqueID, stable across restarts of the same host and configuration."""
+    name = f"alpaca-simulators/{socket.gethostname()}/{CONFIG_NAME}/{device_type}/{device_number}"
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, name))
+
+
+def configured_devices() -> list[ConfiguredDevice]:
+    devices = []
+    for device_type, device_numbers in get_all_configured_devices().items():
+        for device_number in device_numbers:
+            cfg = get_device_config(device_type, device_number)
+            devices.append(
+                ConfiguredDevice(
+                    DeviceName=cfg.get(
+                        "name", f"Simulator {device_type.title()} #{device_number}"
+                    ),
+                    DeviceType=DEVICE_TYPE_NAMES.get(device_type, device_type.title()),
+                    DeviceNumber=device_number,
+                    UniqueID=unique_id(device_type, device_number),
+                )
+            )
+    return devices
+
+
+@router.get("/apiversions", response_model=IntArrayResponse)
+async def get_apiversions(ClientTransactionID: int = Query(0)):
+    return static_value_response(
+        ("management", 0, "apiversions"), IntArrayResponse, lambda: [1], ClientTransactionID
+    )
+
+
+@router.get("/v1/description", response_model=DescriptionResponse)
+async def get_description(ClientTransactionID: int = Query(0)):
+    def compute():
+        return ServerDescription(
+            ServerName="Alpaca Observatory Simulator",
+            Manufacturer="alpaca-simulators",
+            ManufacturerVersion=DRIVER_VERSION,
+            Location=socket.gethostname(),
+        )
+
+    return static_value_response(
+        ("management", 0, "description"), DescriptionResponse, compute, ClientTransactionID
+    )
+
+
+@router.get("/v1/configureddevices", response_model=ConfiguredDevicesResponse)
+async def get_configureddevices(ClientTransactionID: int = Query(0)):
+    return static_value_response(
+        ("management", 0, "configureddevices"),
+        ConfiguredDevicesResponse,
+        configured_devices,
+        ClientTransactionID,
+    )
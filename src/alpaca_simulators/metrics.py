@@ -0,0 +1,201 @@
+"""
+Request metrics and gauges in the Prometheus text format.
+
+``MetricsMiddleware`` counts requests per endpoint, device type, method and status, and
+keeps a latency histogram per endpoint, device type and method. Endpoints are route
+templates (``/{device_type}/{device_number}/name`` for device routes, which omit the API
+prefix), with the member filled in for table-generated getters, so the number of series
+is bounded by the routes and never by what clients send. Histograms have fixed buckets,
+so memory does not grow with traffic. Latency runs until the last byte of the response
+is sent; background tasks started by a request (exposures) are not included.
+
+``render_metrics`` adds gauges read at scrape time: render queue depth per camera, bytes
+held by the frame, preview and calibration caches, state lock waits, exposures in progress,
+asyncio tasks and threads. ``GET /metrics`` serves them.
+
+Everything is recorded on the event loop, so no locking is needed; with several workers
+each worker reports its own metrics.
+"""
+
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+
+from alpaca_simulators import calibration
+from alpaca_simulators.api import camera
+from alpaca_simulators.routing import ALPACA_PREFIX
+from alpaca_simulators.state import STATE_MODELS, state_lock_waits
+
+# Upper bounds (s) of the latency histogram buckets.
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+
+
+# Request counts by (endpoint, device type, method, status).
+request_counts: dict[tuple[str, str, str, int], int] = {}
+# Latency histograms by (endpoint, device type, method).
+request_latency: dict[tuple[str, str, str], Histogram] = {}
+
+
+def _labels(scope: dict) -> tuple[str, str]:
+    """Return the endpoint and device type labels of a handled request."""
+    route = scope.get("route")
+    endpoint = getattr(route, "path", None)
+    if endpoint is None:
+        endpoint = "unmatched"
+    else:
+        member = scope.get("path_params", {}).get("member")
+        if member in getattr(scope.get("endpoint"), "properties", ()):
+            endpoint = endpoint.replace("{member}", member)
+    device_type = ""
+    path = scope["path"]
+    if path.startswith(ALPACA_PREFIX + "/"):
+        device_type = path[len(ALPACA_PREFIX) + 1 :].partition("/")[0]
+        if device_type not in STATE_MODELS:
+            device_type = "other"
+    return endpoint, device_type
+
+
+def record_request(scope: dict, status: int, seconds: float) -> None:
+    endpoint, device_type = _labels(scope)
+    key = (endpoint, device_type, scope["method"])
+    histogram = request_latency.get(key)
+    if histogram is None:
+        histogram = request_latency[key] = Histogram()
+    histogram.observe(seconds)
+    key += (status,)
+    request_counts[key] = request_counts.get(key, 0) + 1
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the count and latency of every HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+        recorded = False
+
+        async def send_and_record(message):
+            nonlocal status, recorded
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body" and not message.get("more_body"):
+                recorded = True
+                record_request(scope, status, time.perf_counter() - start)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_record)
+        finally:
+            if not recorded:
+                record_request(scope, status, time.perf_counter() - start)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _series(name: str, labels: dict[str, object], value: float) -> str:
+    label_text = ",".join(f'{key}="{_escape(str(label))}"' for key, label in labels.items())
+    return f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}"
+
+
+def _cache_bytes() -> dict[str, int]:
+    frames = sum(
+        image.nbytes
+        for images in list(camera.image_cache.values())
+        for image in list(images.values())
+    )
+    previews = sum(
+        len(body)
+        for _, renders in list(camera._preview_cache.values())
+        for body in list(renders.values())
+    )
+    maps = sum(image.nbytes for image in list(calibration._maps.values()))
+    return {"frames": frames, "previews": previews, "calibration": maps}
+
+
+def render_metrics() -> str:
+    """Return all metrics in the Prometheus text exposition format."""
+    lines = [
+        "# HELP alpaca_requests_total HTTP requests handled.",
+        "# TYPE alpaca_requests_total counter",
+    ]
+    for (endpoint, device_type, method, status), count in sorted(request_counts.items()):
+        labels = {"endpoint": endpoint, "device_type": device_type, "method": method}
+        lines.append(_series("alpaca_requests_total", labels | {"status": status}, count))
+
+    lines += [
+        "# HELP alpaca_request_duration_seconds HTTP request latency.",
+        "# TYPE alpaca_request_duration_seconds histogram",
+    ]
+    for (endpoint, device_type, method), histogram in sorted(request_latency.items()):
+        labels = {"endpoint": endpoint, "device_type": device_type, "method": method}
+        cumulative = 0
+        for bound, count in zip(BUCKETS + ("+Inf",), histogram.counts):
+            cumulative += count
+            lines.append(
+                _series(
+                    "alpaca_request_duration_seconds_bucket", labels | {"le": bound}, cumulative
+                )
+            )
+        lines.append(_series("alpaca_request_duration_seconds_sum", labels, histogram.sum))
+        lines.append(_series("alpaca_request_duration_seconds_count", labels, cumulative))
+
+    lines += [
+        "# HELP alpaca_render_queue_depth Frames waiting for or being rendered, per camera.",
+        "# TYPE alpaca_render_queue_depth gauge",
+    ]
+    for device_number, depth in sorted(camera.render_queue_depth.items()):
+        lines.append(_series("alpaca_render_queue_depth", {"device_number": device_number}, depth))
+
+    lines += [
+        "# HELP alpaca_cache_bytes Bytes held by image caches.",
+        "# TYPE alpaca_cache_bytes gauge",
+    ]
+    for cache, size in _cache_bytes().items():
+        lines.append(_series("alpaca_cache_bytes", {"cache": cache}, size))
+
+    waits = state_lock_waits()
+    if waits is not None:
+        lines += [
+            "# HELP alpaca_state_lock_waits_total Times a thread had to wait for the state lock.",
+            "# TYPE alpaca_state_lock_waits_total counter",
+            _series("alpaca_state_lock_waits_total", {}, waits[0]),
+            "# HELP alpaca_state_lock_wait_seconds_total Time threads spent waiting for the "
+            "state lock.",
+            "# TYPE alpaca_state_lock_wait_seconds_total counter",
+            _series("alpaca_state_lock_wait_seconds_total", {}, waits[1]),
+        ]
+
+    lines += [
+        "# HELP alpaca_active_exposures Camera exposures in progress.",
+        "# TYPE alpaca_active_exposures gauge",
+        _series("alpaca_active_exposures", {}, camera.active_exposures),
+        "# HELP alpaca_asyncio_tasks Tasks on the event loop.",
+        "# TYPE alpaca_asyncio_tasks gauge",
+        _series("alpaca_asyncio_tasks", {}, len(asyncio.all_tasks())),
+        "# HELP alpaca_threads Threads in this process.",
+        "# TYPE alpaca_threads gauge",
+        _series("alpaca_threads", {}, threading.active_count()),
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,85 @@
+"""
+Small stretched previews of camera frames.
+
+Frames are block-averaged down to the requested size, percentile-stretched to 8 bits and
+encoded as PNG (pure numpy/zlib) or JPEG (requires Pillow).
+"""
+
+import io
+import struct
+import zlib
+
+import numpy as np
+
+PREVIEW_FORMATS = ("png", "jpeg")
+
+
+def block_average(image: np.ndarray, size: int) -> np.ndarray:
+    """Downsample a 2D image by integer block averaging so its longest side is <= size."""
+    height, width = image.shape
+    factor = max(1, -(-max(height, width) // size))  # ceil division
+    if factor == 1:
+        return image.astype(np.float32)
+
+    out_height = max(1, height // factor)
+    out_width = max(1, width // factor)
+    # Frames smaller than one block in a dimension are averaged as a whole.
+    block_y = min(factor, height)
+    block_x = min(factor, width)
+    cropped = image[: out_height * block_y, : out_width * block_x]
+    return cropped.reshape(out_height, block_y, out_width, block_x).mean(
+        axis=(1, 3), dtype=np.float32
+    )
+
+
+def percentile_stretch(image: np.ndarray, low: float = 0.5, high: float = 99.5) -> np.ndarray:
+    """Linearly map the [low, high] percentile range of an image onto 0-255."""
+    vmin, vmax = np.percentile(image, [low, high])
+    if vmax <= vmin:
+        return np.zeros(image.shape, dtype=np.uint8)
+    scaled = (image - vmin) * (255.0 / (vmax - vmin))
+    return np.clip(scaled, 0, 255).astype(np.uint8)
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data))
+        + tag
+        + data
+        + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+    )
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    """Encode an 8-bit greyscale image as PNG."""
+    height, width = image.shape
+    # Each scanline is prefixed with filter type 0 (None).
+    raw = np.zeros((height, width + 1), dtype=np.uint8)
+    raw[:, 1:] = image
+    header = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def encode_jpeg(image: np.ndarray, quality: int = 85) -> bytes:
+    """Encode an 8-bit greyscale image as JPEG. Requires Pillow."""
+    try:
+        from PIL import Image
+    except ImportError as e:
+        raise RuntimeError("JPEG previews require Pillow (pip install pillow)") from e
+
+    buffer = io.BytesIO()
+    Image.fromarray(image, mode="L").save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def render_preview(image: np.ndarray, size: int, fmt: str) -> bytes:
+    """Downsample, stretch and encode a frame."""
+    stretched = percentile_stretch(block_average(np.asarray(image), size))
+    if fmt == "jpeg":
+        return encode_jpeg(stretched)
+    return encode_png(stretched)
@@ -0,0 +1,96 @@
+"""
+Compiled dispatch for Alpaca device requests.
+
+Starlette matches a request by trying every route's regex in registration order, and the
+device API has several hundred routes behind the generic ``/{device_type}/...`` ones. The
+dispatcher instead splits ``/api/v1/<type>/<number>/<member>`` once and looks the route up
+in a dict keyed by (device type, member, method). Requests it does not know about fall
+through to the normal router, so 404/405 handling, docs and the UI are unchanged.
+"""
+
+import re
+
+from starlette.routing import Route
+
+ALPACA_PREFIX = "/api/v1"
+
+_SEGMENT_PARAM = re.compile(r"^\{(\w+)\}$")
+
+
+def _segment(segment: str) -> tuple[str | None, str | None]:
+    """Split a path template segment into (literal, parameter name)."""
+    match = _SEGMENT_PARAM.match(segment)
+    if match:
+        return None, match.group(1)
+    if "{" in segment:
+        raise ValueError(segment)
+    return segment, None
+
+
+def compile_routes(routes: list[Route]) -> dict[tuple, tuple]:
+    """Build the dispatch table for routes shaped like ``/<type>/<number>/<member>``.
+
+    Routes are given in registration order with paths relative to the API prefix. Keys are
+    (device type, member, method) with None standing for a path parameter. Values are
+    (registration index, route, parameter names of the three segments).
+    """
+    table = {}
+    for index, route in enumerate(routes):
+        path = getattr(route, "path", "")
+        segments = path.split("/")[1:]
+        if len(segments) != 3 or not getattr(route, "methods", None):
+            continue
+        try:
+            (device_type, type_param), (_, number_param), (member, member_param) = (
+                _segment(segment) for segment in segments
+            )
+        except ValueError:
+            continue  # typed convertors and partial parameters keep regex matching
+        if number_param is None:
+            continue
+        params = (type_param, number_param, member_param)
+        for method in route.methods:
+            table.setdefault((device_type, member, method), (index, route, params))
+    return table
+
+
+class AlpacaDispatcher:
+    """ASGI wrapper around the app's router dispatching device requests by dict lookup."""
+
+    def __init__(self, router, routes: list[Route], prefix: str = ALPACA_PREFIX):
+        self.router = router
+        self.app = router.middleware_stack
+        self.prefix = prefix + "/"
+        self.table = compile_routes(routes)
+
+    def lookup(self, device_type: str, member: str, method: str) -> tuple | None:
+        """Return the (index, route, params) a request would match first, if compiled."""
+        table = self.table
+        best = None
+        for key in (
+            (device_type, member, method),
+            (None, member, method),
+            (device_type, None, method),
+            (None, None, method),
+        ):
+            entry = table.get(key)
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best = entry
+        return best
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.prefix):
+            parts = scope["path"][len(self.prefix) :].split("/")
+            if len(parts) == 3 and all(parts):
+                entry = self.lookup(parts[0], parts[2], scope["method"])
+                if entry is not None:
+                    _, route, params = entry
+                    scope.setdefault("router", self.router)
+                    scope["endpoint"] = route.endpoint
+                    scope["route"] = route
+                    scope["path_params"] = {
+                        name: value for name, value in zip(params, parts) if name is not None
+                    }
+                    await route.app(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
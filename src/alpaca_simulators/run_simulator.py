@@ -23,6 +23,33 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Enable auto-reload for development.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes; more than one shares device state through a "
+        "state server process (default: 1).",
+    )
+    parser.add_argument(
+        "--shards",
+        type=str,
+        default=None,
+        help="Serve device types from their own worker processes, e.g. "
+        "'camera;telescope,dome,focuser'. Other device types are served by the front process.",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="Threads for handlers that block, such as image downloads, in each worker "
+        "(default: 40).",
+    )
+    parser.add_argument(
+        "--discovery-port",
+        type=int,
+        default=32227,
+        help="UDP port to answer Alpaca discovery requests on, 0 to disable (default: 32227).",
+    )
 
     return parser.parse_args()
 
@@ -30,18 +57,51 @@ def parse_args() -> argparse.Namespace:
 def main():
     args = parse_args()
 
+    if (args.workers > 1 or args.shards) and args.reload:
+        raise SystemExit("--reload cannot be combined with --workers or --shards")
+
     logging.info(
         f"Starting uvicorn server on {args.host}:{args.port}"
         + (" with auto-reload." if args.reload else ".")
     )
     os.environ["ASTRA_SIMULATORS_CONFIG"] = args.config
+    if args.threads:
+        os.environ["ALPACA_SIMULATORS_THREADS"] = str(args.threads)
 
-    uvicorn.run(
-        "alpaca_simulators.main:app",
-        host=args.host,
-        port=args.port,
-        reload=args.reload,
-    )
+    state_server = None
+    shard_processes = []
+    if args.workers > 1 or args.shards:
+        # Imported only now so the state server loads the configuration chosen above.
+        from alpaca_simulators.sharding import parse_shards, start_shards
+        from alpaca_simulators.state import start_state_server
+
+        shards = parse_shards(args.shards) if args.shards else []
+        state_server = start_state_server()
+        logging.info(f"Started state server for {args.workers} workers.")
+        if shards:
+            shard_processes = start_shards(shards)
+            for device_types in shards:
+                logging.info(f"Serving {', '.join(device_types)} from their own process.")
+
+    if args.discovery_port:
+        from alpaca_simulators.discovery import start_discovery_responder
+
+        start_discovery_responder(args.port, args.discovery_port)
+        logging.info(f"Answering Alpaca discovery on UDP port {args.discovery_port}.")
+
+    try:
+        uvicorn.run(
+            "alpaca_simulators.main:app",
+            host=args.host,
+            port=args.port,
+            reload=args.reload,
+            workers=args.workers,
+        )
+    finally:
+        for process in shard_processes:
+            process.terminate()
+        if state_server is not None:
+            state_server.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,161 @@
+"""
+Device-sharded serving: device families served by their own worker processes.
+
+Each shard is a full copy of the app listening on a unix socket, started with the
+device types it owns. The front process forwards ``/api/v1/{device_type}/...`` requests
+for those types to their shard and serves everything else itself, so a CPU-heavy camera
+render in one shard cannot add latency to mount polling in another. All processes share
+device state through the state server (see ``state.start_state_server``).
+
+Forwarding uses httpx (pip install httpx).
+"""
+
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+
+SHARDS_ENV = "ALPACA_SIMULATORS_SHARDS"
+
+_HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "upgrade"}
+
+
+def parse_shards(spec: str) -> list[list[str]]:
+    """Parse a shard spec such as ``camera;telescope,dome,focuser`` into device type groups."""
+    shards = []
+    for group in spec.split(";"):
+        device_types = [name.strip().lower() for name in group.split(",") if name.strip()]
+        if device_types:
+            shards.append(device_types)
+
+    seen = set()
+    for device_types in shards:
+        for device_type in device_types:
+            if device_type in seen:
+                raise ValueError(f"Device type {device_type} is assigned to more than one shard")
+            seen.add(device_type)
+    return shards
+
+
+def get_shard_routes() -> dict[str, str]:
+    """Device type to shard socket mapping handed to the front process, if sharded."""
+    routes = os.environ.get(SHARDS_ENV)
+    return json.loads(routes) if routes else {}
+
+
+def _make_transport(socket_path: str):
+    try:
+        import httpx
+    except ImportError as e:
+        raise RuntimeError("Sharded mode requires httpx (pip install httpx)") from e
+
+    return httpx.AsyncHTTPTransport(uds=socket_path)
+
+
+class ShardRouter:
+    """ASGI middleware forwarding device API requests to the shard that owns the device type."""
+
+    def __init__(self, app, routes: dict[str, str]):
+        self.app = app
+        self.routes = routes
+        self._clients = {}
+
+    def _client(self, socket_path: str):
+        client = self._clients.get(socket_path)
+        if client is None:
+            import httpx
+
+            client = httpx.AsyncClient(
+                transport=_make_transport(socket_path), base_url="http://shard", timeout=None
+            )
+            self._clients[socket_path] = client
+        return client
+
+    def _shard_for(self, path: str) -> str | None:
+        parts = path.split("/", 5)
+        # ["", "api", "v1", device_type, ...]
+        if len(parts) < 5 or parts[1] != "api" or parts[2] != "v1":
+            return None
+        return self.routes.get(parts[3].lower())
+
+    async def __call__(self, scope, receive, send):
+        socket_path = self._shard_for(scope["path"]) if scope["type"] == "http" else None
+        if socket_path is None:
+            await self.app(scope, receive, send)
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        client = self._client(socket_path)
+        request = client.build_request(
+            scope["method"],
+            scope["raw_path"].decode("latin-1") if scope.get("raw_path") else scope["path"],
+            params=scope["query_string"].decode("latin-1") or None,
+            headers=[(k, v) for k, v in scope["headers"] if k.lower() != b"host"],
+            content=body,
+        )
+        try:
+            response = await client.send(request, stream=True)
+        except Exception as e:
+            message = f"Shard at {socket_path} is unavailable: {e}".encode()
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 502,
+                    "headers": [(b"content-type", b"text/plain")],
+                }
+            )
+            await send({"type": "http.response.body", "body": message})
+            return
+
+        try:
+            headers = [
+                (k, v)
+                for k, v in response.headers.raw
+                if k.decode("latin-1").lower() not in _HOP_BY_HOP_HEADERS
+            ]
+            await send(
+                {"type": "http.response.start", "status": response.status_code, "headers": headers}
+            )
+            async for chunk in response.aiter_raw():
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            await response.aclose()
+
+
+def _serve_shard(socket_path: str) -> None:
+    import uvicorn
+
+    uvicorn.run("alpaca_simulators.main:app", uds=socket_path, log_level="warning")
+
+
+def start_shards(shards: list[list[str]], timeout: float = 30.0) -> list:
+    """Start one worker process per shard and point the front process started afterwards
+    at them. Returns the shard processes."""
+    socket_dir = tempfile.mkdtemp(prefix="alpaca-shards-")
+    context = multiprocessing.get_context("spawn")
+    processes = []
+    routes = {}
+    for index, device_types in enumerate(shards):
+        socket_path = os.path.join(socket_dir, f"shard{index}.sock")
+        process = context.Process(target=_serve_shard, args=(socket_path,), daemon=True)
+        process.start()
+        processes.append(process)
+        routes.update({device_type: socket_path for device_type in device_types})
+
+    deadline = time.monotonic() + timeout
+    for socket_path in set(routes.values()):
+        while not os.path.exists(socket_path):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Shard at {socket_path} did not start")
+            time.sleep(0.1)
+
+    os.environ[SHARDS_ENV] = json.dumps(routes)
+    return processes
@@ -1,15 +1,24 @@
+import multiprocessing
 import os
 import threading
-from collections import defaultdict
+import time
+import weakref
+import zlib
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from multiprocessing import shared_memory
+from multiprocessing.managers import BaseManager
 from typing import Any
 
+import numpy as np
+import yaml
 from pydantic import BaseModel
 
 from .config import Config
+from .fleet import expand_fleet
 
-# Load configuration
 CONFIG_NAME = os.environ.get("ASTRA_SIMULATORS_CONFIG", "config.yaml")
-DEVICE_CONFIG = Config(CONFIG_NAME).load()
 
 
 # --- Pydantic Models for API Responses ---
@@ -167,6 +176,7 @@ class CameraState(BaseModel):
     image_ready: bool = False
     exposure_start_time: str | None = None
     exposure_duration: float = 0.0
+    subexposureduration: float = 0.0  # 0 disables sub-exposure stacking
     image_data: list[list[int]] | None = None
     light: bool = True
     # Binning and subframe - these will be overridden by config
@@ -305,15 +315,158 @@ class CoverCalibratorState(BaseModel):
     coverstate: int = CoverStatus.CLOSED
 
 
-# Global state management
-_state = defaultdict(lambda: defaultdict(dict))
+# --- Device state schemas ---
+# Each device type's state may hold the state model's fields, the keys its section of
+# template.yaml may configure, and the runtime keys the simulators set. State stays a plain
+# dict; configs are checked against the schema when loaded, so a typo fails at startup.
+STATE_MODELS: dict[str, type[BaseModel]] = {
+    "camera": CameraState,
+    "telescope": TelescopeState,
+    "dome": DomeState,
+    "focuser": FocuserState,
+    "filterwheel": FilterWheelState,
+    "rotator": RotatorState,
+    "safetymonitor": SafetyMonitorState,
+    "switch": SwitchState,
+    "observingconditions": ObservingConditionsState,
+    "covercalibrator": CoverCalibratorState,
+}
+
+# Keys set at runtime, or optional config keys not in template.yaml.
+EXTRA_STATE_KEYS: dict[str, tuple[str, ...]] = {
+    "camera": ("pixel_defects",),
+    "telescope": (
+        "last_motion_update",
+        "last_slew_time",
+        "parkrightascension",
+        "parkdeclination",
+        "slew_target_alt",
+        "slew_target_az",
+        "slew_target_ra",
+        "slew_target_dec",
+        "canmoveaxis0",
+        "canmoveaxis1",
+        "canmoveaxis2",
+        "moveaxis_primary_rate",
+        "moveaxis_secondary_rate",
+        "moveaxis_tertiary_rate",
+        "moveaxis_primary_saved_tracking",
+        "moveaxis_secondary_saved_tracking",
+        "moveaxis_tertiary_saved_tracking",
+    ),
+    "dome": ("parkazimuth", "slew_gen"),
+}
+
+
+def _template_keys(device_type: str) -> set[str]:
+    with open(Config._DEFAULT_PATH, encoding="utf-8") as f:
+        template = yaml.safe_load(f)
+    entries = template.get("devices", {}).get(device_type) or {}
+    return {key for entry in entries.values() for key in entry}
+
+
+_state_keys: dict[str, frozenset[str]] = {}
+
+
+def state_keys(device_type: str) -> frozenset[str] | None:
+    """Return the keys a device type's state may hold, or None if it has no schema."""
+    keys = _state_keys.get(device_type)
+    if keys is None and device_type in STATE_MODELS:
+        keys = frozenset(
+            set(STATE_MODELS[device_type].model_fields)
+            | _template_keys(device_type)
+            | set(EXTRA_STATE_KEYS.get(device_type, ()))
+        )
+        _state_keys[device_type] = keys
+    return keys
+
+
+_static_keys: dict[str, frozenset[str]] = {}
+
+
+def static_state_keys(device_type: str) -> frozenset[str]:
+    """Return the state keys of a device type that only ever hold their configured value.
+
+    These are the keys template.yaml configures that are neither state model fields nor
+    runtime keys: capabilities and fixed characteristics such as canpark or cameraxsize.
+    """
+    keys = _static_keys.get(device_type)
+    if keys is None:
+        keys = frozenset()
+        if device_type in STATE_MODELS:
+            keys = frozenset(
+                _template_keys(device_type)
+                - set(STATE_MODELS[device_type].model_fields)
+                - set(EXTRA_STATE_KEYS.get(device_type, ()))
+            )
+        _static_keys[device_type] = keys
+    return keys
+
+
+def validate_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Check every configured device against its state schema, raising on unknown keys,
+    and every ``topology`` entry against the configured devices."""
+    devices = config.get("devices") or {}
+    for camera_number, train in (config.get("topology") or {}).items():
+        if camera_number not in (devices.get("camera") or {}):
+            raise ValueError(f"Topology names camera {camera_number}, which is not configured")
+        for device_type, device_number in (train or {}).items():
+            if device_number is not None and device_number not in (devices.get(device_type) or {}):
+                raise ValueError(
+                    f"Topology of camera {camera_number} names {device_type} {device_number}, "
+                    "which is not configured"
+                )
+    for device_type, entries in devices.items():
+        keys = state_keys(device_type)
+        if keys is None:
+            continue
+        for device_number, entry in (entries or {}).items():
+            unknown = sorted(set(entry) - keys)
+            if unknown:
+                raise ValueError(
+                    f"Unknown config keys for {device_type} {device_number}: {', '.join(unknown)}"
+                )
+    return config
+
+
+# Load configuration
+DEVICE_CONFIG = validate_config(expand_fleet(Config(CONFIG_NAME).load()))
+
+# Incremented each time this process reloads DEVICE_CONFIG, so values cached from the
+# configuration can tell they are stale.
+_config_version = 0
+
+# Global state management. ServerTransactionIDs are taken from blocks reserved from the
+# store, so processes sharing a state server never hand out the same id.
+TRANSACTION_ID_BLOCK = 1024
 _server_transaction_id = 0
-_state_lock = threading.Lock()
+_transaction_ids_end = 0
+_transaction_lock = threading.Lock()
+
+# Multi-worker mode: one state server process owns the device state and every worker
+# reaches it over a local socket. The address and key are handed down in the environment,
+# along with the name of the shared memory holding the generation counters.
+STATE_SERVER_ENV = "ALPACA_SIMULATORS_STATE_SERVER"
+STATE_AUTHKEY_ENV = "ALPACA_SIMULATORS_STATE_AUTHKEY"
+STATE_GENERATIONS_ENV = "ALPACA_SIMULATORS_STATE_GENERATIONS"
+
+# Generation counters in shared memory: one for config reloads, one for the settings and
+# the rest for device state, a device's slot picked by a hash of its name (devices sharing
+# a slot only cost each other a needless refetch).
+GENERATION_SLOTS = 4096
+CONFIG_SLOT = 0
+SETTINGS_SLOT = 1
+
+# State keys holding large arrays. Workers keep the last copy of each and the state server
+# only sends it again when it has changed, so a frame crosses the socket once per worker.
+FRAME_KEYS = ("image_data",)
 
 
 def get_server_transaction_id() -> int:
-    global _server_transaction_id
-    with _state_lock:
+    global _server_transaction_id, _transaction_ids_end
+    with _transaction_lock:
+        if _server_transaction_id >= _transaction_ids_end:
+            _server_transaction_id, _transaction_ids_end = _store.reserve_transaction_ids()
         _server_transaction_id += 1
         return _server_transaction_id
 
@@ -322,57 +475,486 @@ def _create_default_state(device_type: str, device_number: int) -> dict[str, Any
     """Create default state for a device, incorporating configuration values"""
     config_data = get_device_config(device_type, device_number)
 
-    # Start with minimal base state
+    model = STATE_MODELS.get(device_type)
+    state = model().model_dump() if model is not None else {"connected": False}
+    state.update(config_data)
+    # Handle the special case where config uses 'cameraxsize'/'cameraysize'
+    # but state uses 'numx'/'numy'
     if device_type == "camera":
-        state = CameraState().model_dump()
-        # Handle the special case where config uses 'cameraxsize'/'cameraysize'
-        # but state uses 'numx'/'numy'
-        if "cameraxsize" in config_data:
+        if "cameraxsize" in config_data and "numx" not in config_data:
             state["numx"] = config_data["cameraxsize"]
-        if "cameraysize" in config_data:
+        if "cameraysize" in config_data and "numy" not in config_data:
             state["numy"] = config_data["cameraysize"]
-    elif device_type == "telescope":
-        state = TelescopeState().model_dump()
-    elif device_type == "dome":
-        state = DomeState().model_dump()
-    elif device_type == "focuser":
-        state = FocuserState().model_dump()
-    elif device_type == "filterwheel":
-        state = FilterWheelState().model_dump()
-    elif device_type == "rotator":
-        state = RotatorState().model_dump()
-    elif device_type == "safetymonitor":
-        state = SafetyMonitorState().model_dump()
-    elif device_type == "switch":
-        state = SwitchState().model_dump()
-    elif device_type == "observingconditions":
-        state = ObservingConditionsState().model_dump()
-    elif device_type == "covercalibrator":
-        state = CoverCalibratorState().model_dump()
-    else:
-        state = {"connected": False}
-
-    # Apply ALL configuration values, overriding defaults
-    state.update(config_data)
     return state
 
 
-def get_device_state(device_type: str, device_number: int) -> dict[str, Any]:
-    with _state_lock:
-        if not _state[device_type][device_number]:
+class TimedLock:
+    """A lock that keeps count of the waits for it and the time spent waiting."""
+
+    __slots__ = ("_lock", "waits", "wait_seconds")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def __enter__(self):
+        if not self._lock.acquire(blocking=False):
+            start = time.perf_counter()
+            self._lock.acquire()
+            self.waits += 1
+            self.wait_seconds += time.perf_counter() - start
+        return self
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+class Generations:
+    """Counters the state server bumps on every change and workers read without a round
+    trip, so a worker only fetches state that changed since it last did."""
+
+    def __init__(self, name: str | None = None):
+        self._memory = shared_memory.SharedMemory(
+            name=name, create=name is None, size=GENERATION_SLOTS * 8
+        )
+        self.name = self._memory.name
+        self.counters = np.ndarray((GENERATION_SLOTS,), dtype=np.int64, buffer=self._memory.buf)
+        if name is None:
+            self.counters[:] = 0
+
+    @staticmethod
+    def device_slot(device_type: str, device_number: int) -> int:
+        # crc32 rather than hash(), which differs between processes.
+        key = f"{device_type}/{device_number}".encode()
+        return SETTINGS_SLOT + 1 + zlib.crc32(key) % (GENERATION_SLOTS - SETTINGS_SLOT - 1)
+
+    def __getitem__(self, slot: int) -> int:
+        return int(self.counters[slot])
+
+    def bump(self, slot: int | slice) -> None:
+        self.counters[slot] += 1
+
+    def unlink(self) -> None:
+        self._memory.unlink()
+
+
+def _matches(state: dict[str, Any], expected: dict[str, Any] | None) -> bool:
+    if expected is not None:
+        for key, value in expected.items():
+            if state.get(key) != value:
+                return False
+    return True
+
+
+class StateStore:
+    """Device state held in this process."""
+
+    def __init__(self):
+        self._state: dict[tuple[str, int], dict[str, Any]] = {}
+        # Runtime settings such as sunlight, overriding the config until it is reloaded.
+        self._settings: dict[str, Any] = {}
+        self._next_transaction_id = 0
+        self._lock = TimedLock()
+
+    def _device(self, device_type: str, device_number: int) -> dict[str, Any]:
+        device = (device_type, device_number)
+        if not self._state.get(device):
             # Initialize device state with configuration
-            _state[device_type][device_number] = _create_default_state(device_type, device_number)
+            self._state[device] = _create_default_state(device_type, device_number)
+        return self._state[device]
+
+    def get(self, device_type: str, device_number: int) -> dict[str, Any]:
+        with self._lock:
+            return self._device(device_type, device_number).copy()
+
+    def get_many(self, devices: list[tuple[str, int]]) -> list[dict[str, Any]]:
+        """Copy the state of several devices at one instant."""
+        with self._lock:
+            return [self._device(*device).copy() for device in devices]
+
+    def update(
+        self,
+        device_type: str,
+        device_number: int,
+        new_state: dict[str, Any],
+        expected: dict[str, Any] | None = None,
+    ) -> bool:
+        """Apply new_state, unless a key in expected no longer holds its value there.
+
+        Returns whether the state was updated.
+        """
+        with self._lock:
+            state = self._device(device_type, device_number)
+            if not _matches(state, expected):
+                return False
+            state.update(new_state)
+            return True
+
+    def exists(self, device_type: str, device_number: int) -> bool:
+        """Whether the device's state has been created, i.e. it has been used."""
+        return bool(self._state.get((device_type, device_number)))
+
+    def get_setting(self, key: str, default: Any) -> Any:
+        return self._settings.get(key, default)
+
+    def get_settings(self) -> dict[str, Any]:
+        with self._lock:
+            return dict(self._settings)
+
+    def set_setting(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._settings[key] = value
+
+    def reserve_transaction_ids(self) -> tuple[int, int]:
+        """Reserve a block of ServerTransactionIDs, (start, end]; blocks never overlap."""
+        with self._lock:
+            start = self._next_transaction_id
+            self._next_transaction_id += TRANSACTION_ID_BLOCK
+        return start, start + TRANSACTION_ID_BLOCK
+
+    def reset(self, reload_config: bool = False) -> None:
+        with self._lock:
+            self._state.clear()
+            if reload_config:
+                self._settings.clear()
+
+
+class SharedStateStore(StateStore):
+    """The state server's store, which versions frames and counts changes for workers."""
+
+    def __init__(self, generations: Generations):
+        super().__init__()
+        self._frame_versions: dict[tuple[str, int], dict[str, int]] = {}
+        self._last_frame_version = 0
+        self._generations = generations
+
+    def update(
+        self,
+        device_type: str,
+        device_number: int,
+        new_state: dict[str, Any],
+        expected: dict[str, Any] | None = None,
+    ) -> bool:
+        with self._lock:
+            state = self._device(device_type, device_number)
+            if not _matches(state, expected):
+                return False
+            state.update(new_state)
+            for key in FRAME_KEYS:
+                if key in new_state:
+                    self._last_frame_version += 1
+                    versions = self._frame_versions.setdefault((device_type, device_number), {})
+                    versions[key] = self._last_frame_version
+            self._generations.bump(Generations.device_slot(device_type, device_number))
+            return True
+
+    def get_shared(
+        self, device_type: str, device_number: int, known_frames: dict[str, int]
+    ) -> tuple[dict[str, Any], dict[str, int]]:
+        """Return a device's state without the frames the worker already holds.
+
+        Also returns the current frame versions.
+        """
+        with self._lock:
+            state = self._device(device_type, device_number).copy()
+            versions = dict(self._frame_versions.get((device_type, device_number), {}))
+        for key, version in versions.items():
+            if known_frames.get(key) == version:
+                del state[key]
+        return state, versions
+
+    def set_setting(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._settings[key] = value
+            self._generations.bump(SETTINGS_SLOT)
+
+    def reset(self, reload_config: bool = False) -> None:
+        if reload_config:
+            _reload_device_config()
+        with self._lock:
+            self._state.clear()
+            self._frame_versions.clear()
+            self._generations.bump(slice(SETTINGS_SLOT + 1, None))
+            if reload_config:
+                self._settings.clear()
+                self._generations.bump(SETTINGS_SLOT)
+                self._generations.bump(CONFIG_SLOT)
+
+
+class StateManager(BaseManager):
+    pass
+
+
+def _get_store() -> StateStore:
+    return _store
+
+
+StateManager.register("store", callable=_get_store)
+
+
+class RemoteStateStore:
+    """Device state held by the state server and shared by every worker.
+
+    The worker keeps the last copy it fetched of each device and of the settings, and
+    only asks the state server again once their generation counter has moved, so reads of
+    unchanged state cost no round trip.
+    """
 
-        return _state[device_type][device_number].copy()
+    def __init__(self, address: str, authkey: bytes, generations: str):
+        manager = StateManager(address=address, authkey=authkey)
+        manager.connect()
+        self._store = manager.store()
+        self._generations = Generations(generations)
+        self._cache: dict[tuple[str, int], tuple[int, dict[str, Any]]] = {}
+        self._frames: dict[tuple[str, int], dict[str, tuple[int, Any]]] = {}
+        self._settings: tuple[int, dict[str, Any]] = (-1, {})
+        self._config_generation = self._generations[CONFIG_SLOT]
+        self._lock = threading.Lock()
+
+    def get(self, device_type: str, device_number: int) -> dict[str, Any]:
+        self.check_config()
+        device = (device_type, device_number)
+        # Read the generation before fetching: an update racing the fetch moves it on
+        # and the next read fetches again.
+        generation = self._generations[Generations.device_slot(device_type, device_number)]
+        with self._lock:
+            cached = self._cache.get(device)
+            if cached is not None and cached[0] == generation:
+                return cached[1].copy()
+            frames = dict(self._frames.get(device, {}))
+        known = {key: version for key, (version, _) in frames.items()}
+        state, versions = self._store.get_shared(device_type, device_number, known)
+
+        for key, version in versions.items():
+            if key in state:
+                frames[key] = (version, state[key])
+            else:
+                state[key] = frames[key][1]
+        with self._lock:
+            self._frames[device] = frames
+            self._cache[device] = (generation, state)
+        return state.copy()
+
+    def _follow_config(self, generation: int) -> None:
+        if generation != self._config_generation:
+            # Another worker reloaded the configuration.
+            self._config_generation = generation
+            _reload_device_config()
+
+    def check_config(self) -> None:
+        """Reload the configuration if another worker has reloaded it since we last looked."""
+        self._follow_config(self._generations[CONFIG_SLOT])
+
+    def get_many(self, devices: list[tuple[str, int]]) -> list[dict[str, Any]]:
+        """Fetch the state of several devices; each is consistent, but read separately."""
+        return [self.get(*device) for device in devices]
+
+    def update(
+        self,
+        device_type: str,
+        device_number: int,
+        new_state: dict[str, Any],
+        expected: dict[str, Any] | None = None,
+    ) -> bool:
+        return self._store.update(device_type, device_number, new_state, expected)
+
+    def exists(self, device_type: str, device_number: int) -> bool:
+        return self._store.exists(device_type, device_number)
+
+    def get_setting(self, key: str, default: Any) -> Any:
+        generation = self._generations[SETTINGS_SLOT]
+        cached_generation, settings = self._settings
+        if cached_generation != generation:
+            settings = self._store.get_settings()
+            self._settings = (generation, settings)
+        return settings.get(key, default)
+
+    def set_setting(self, key: str, value: Any) -> None:
+        self._store.set_setting(key, value)
+
+    def reserve_transaction_ids(self) -> tuple[int, int]:
+        return self._store.reserve_transaction_ids()
+
+    def reset(self, reload_config: bool = False) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._frames.clear()
+        self._store.reset(reload_config)
+
+
+def _connect_store() -> StateStore | RemoteStateStore:
+    address = os.environ.get(STATE_SERVER_ENV)
+    if not address:
+        return StateStore()
+    authkey = bytes.fromhex(os.environ[STATE_AUTHKEY_ENV])
+    return RemoteStateStore(address, authkey, os.environ[STATE_GENERATIONS_ENV])
+
+
+def _use_store(store: StateStore | RemoteStateStore) -> None:
+    global _store, _transaction_ids_end
+    _store = store
+    # Take ids from the new store's blocks from now on.
+    _transaction_ids_end = 0
+
+
+_use_store(_connect_store())
+
+
+def state_lock_waits() -> tuple[int, float] | None:
+    """Return how often and for how long (s) threads waited for the state lock.
+
+    None with a state server, where the lock is in the state server process.
+    """
+    if isinstance(_store, StateStore):
+        return _store._lock.waits, _store._lock.wait_seconds
+    return None
+
+
+def uses_state_server() -> bool:
+    """Whether this process is a worker sharing device state through a state server."""
+    return isinstance(_store, RemoteStateStore)
+
+
+def _serve_state(background_updates: bool, generations: str) -> None:
+    """Initialise the state server process."""
+    _use_store(SharedStateStore(Generations(generations)))
+    if background_updates:
+        # Telescope motion is advanced here, once, rather than in every worker.
+        from .api import telescope
+
+        telescope.start_background_updater(get_all_configured_devices().get("telescope", []))
+
+
+def start_state_server(background_updates: bool = True) -> StateManager:
+    """Start a state server process.
+
+    This process and any worker started afterwards share their device state through it.
+    """
+    authkey = os.urandom(16)
+    generations = Generations()
+    manager = StateManager(authkey=authkey, ctx=multiprocessing.get_context("spawn"))
+    manager.start(_serve_state, (background_updates, generations.name))
+    weakref.finalize(manager, generations.unlink)
+    os.environ[STATE_SERVER_ENV] = manager.address
+    os.environ[STATE_AUTHKEY_ENV] = authkey.hex()
+    os.environ[STATE_GENERATIONS_ENV] = generations.name
+    _use_store(RemoteStateStore(manager.address, authkey, generations.name))
+    return manager
+
+
+# Device state copied for the batch running in this context (see state_snapshot).
+_snapshot: ContextVar[dict[tuple[str, int], dict[str, Any]] | None] = ContextVar(
+    "state_snapshot", default=None
+)
+
+
+@contextmanager
+def state_snapshot(devices: list[tuple[str, int]]):
+    """Serve reads of ``devices`` within the block from one copy of their state.
+
+    The copy is taken at one instant, so a batch of reads sees consistent values across
+    devices. Updates made within the block with update_device_state, i.e. by the batch's
+    own requests, are applied to the store and to the copy. Motion the simulator advances
+    by itself (update_live_device_state) only reaches the store: reads in the block see
+    the devices as they were at the snapshot instant plus the batch's own changes.
+    """
+    token = _snapshot.set(dict(zip(devices, _store.get_many(devices))))
+    try:
+        yield
+    finally:
+        _snapshot.reset(token)
+
+
+def get_device_state(device_type: str, device_number: int) -> dict[str, Any]:
+    snapshot = _snapshot.get()
+    if snapshot is not None and (device_type, device_number) in snapshot:
+        return snapshot[device_type, device_number].copy()
+    return _store.get(device_type, device_number)
+
+
+def get_live_device_state(device_type: str, device_number: int) -> dict[str, Any]:
+    """Read a device's state from the store, ignoring any batch snapshot.
+
+    For code that writes back values derived from what it reads, such as the telescope
+    motion model, which must not overwrite newer state with values from an old snapshot.
+    """
+    return _store.get(device_type, device_number)
+
+
+def detach_state_snapshot() -> None:
+    """Stop serving reads from the batch snapshot in this context.
+
+    Work that outlives a batched request, such as its background tasks, calls this so it
+    sees and updates the live state only.
+    """
+    _snapshot.set(None)
+
+
+def get_device_states(devices: list[tuple[str, int]]) -> list[dict[str, Any]]:
+    """Get the state of several devices, read together where the store allows."""
+    return _store.get_many(devices)
+
+
+# Called after every state update made in this process (see add_state_listener).
+_state_listeners: list[Callable[[str, int, dict[str, Any]], None]] = []
+
+
+def add_state_listener(listener: Callable[[str, int, dict[str, Any]], None]) -> None:
+    """Call ``listener(device_type, device_number, new_state)`` after each state update.
+
+    Only updates made in this process are seen, from whichever thread makes them, so
+    listeners must be quick and thread-safe.
+    """
+    _state_listeners.append(listener)
+
+
+def remove_state_listener(listener: Callable[[str, int, dict[str, Any]], None]) -> None:
+    """Stop calling a listener added with add_state_listener."""
+    _state_listeners.remove(listener)
 
 
 def update_device_state(device_type: str, device_number: int, new_state: dict[str, Any]):
-    with _state_lock:
-        if device_type not in _state or device_number not in _state[device_type]:
-            # Initialize if not exists
-            _state[device_type][device_number] = _create_default_state(device_type, device_number)
+    snapshot = _snapshot.get()
+    if snapshot is not None and (device_type, device_number) in snapshot:
+        snapshot[device_type, device_number].update(new_state)
+    update_live_device_state(device_type, device_number, new_state)
+
+
+def update_live_device_state(
+    device_type: str,
+    device_number: int,
+    new_state: dict[str, Any],
+    expected: dict[str, Any] | None = None,
+) -> bool:
+    """Update a device's state in the store, leaving any batch snapshot as it was.
+
+    For state the simulator advances by itself, such as telescope motion, which would
+    otherwise mix values from after the snapshot into a batch's reads. With ``expected``,
+    the update is only applied if those keys still hold the given values, checked under
+    the store's lock; returns whether it was applied.
+    """
+    if not _store.update(device_type, device_number, new_state, expected):
+        return False
+    for listener in _state_listeners:
+        listener(device_type, device_number, new_state)
+    return True
+
+
+def device_state_exists(device_type: str, device_number: int) -> bool:
+    """Whether a device's state has been created. State is created when first used."""
+    return _store.exists(device_type, device_number)
+
+
+def get_setting(key: str, default: Any = None) -> Any:
+    """A runtime setting such as ``sunlight``: the value last set with set_setting, shared
+    by every worker, or else the config's value."""
+    return _store.get_setting(key, Config(CONFIG_NAME).load().get(key, default))
 
-        _state[device_type][device_number].update(new_state)
+
+def set_setting(key: str, value: Any) -> None:
+    """Set a runtime setting for every worker until the configuration is reloaded."""
+    _store.set_setting(key, value)
 
 
 def get_device_config(device_type: str, device_number: int) -> dict[str, Any]:
@@ -385,14 +967,54 @@ def validate_device_exists(device_type: str, device_number: int) -> bool:
     return device_number in DEVICE_CONFIG.get("devices", {}).get(device_type, {})
 
 
+def _reload_device_config() -> None:
+    global DEVICE_CONFIG, _config_version
+    DEVICE_CONFIG = validate_config(expand_fleet(Config(CONFIG_NAME).reload()))
+    _config_version += 1
+
+
+def config_version() -> int:
+    """Return a number that changes whenever this process reloads the configuration.
+
+    With a state server, first catches up with reloads made by other workers (a read of
+    the shared generation counters, not a round trip), so values cached against this
+    number never outlive a reload anywhere.
+    """
+    if isinstance(_store, RemoteStateStore):
+        _store.check_config()
+    return _config_version
+
+
 def reload_config() -> None:
     """Reload configuration from file (useful for development)"""
-    global DEVICE_CONFIG
-    DEVICE_CONFIG = Config(CONFIG_NAME).reload()
+    _reload_device_config()
     # Clear existing state so it will be re-initialized with new config
-    global _state
-    with _state_lock:
-        _state.clear()
+    _store.reset(reload_config=True)
+
+
+def reset_state() -> None:
+    """Discard all device state so it is re-initialized from the loaded configuration."""
+    _store.reset()
+
+
+# Device types that make up a camera's optical train, in the order listed in the config.
+OPTICAL_TRAIN_DEVICES = ("telescope", "focuser", "filterwheel", "rotator", "covercalibrator")
+
+
+def get_optical_train(camera_number: int) -> dict[str, int | None]:
+    """Get the devices a camera images through, from the ``topology`` config section.
+
+    Device types missing from a camera's entry default to device 0, and map to None if
+    device 0 is not configured. Devices named in the entry are checked by validate_config.
+    """
+    train_config = (DEVICE_CONFIG.get("topology") or {}).get(camera_number) or {}
+    train = {}
+    for device_type in OPTICAL_TRAIN_DEVICES:
+        device_number = train_config.get(device_type, 0)
+        train[device_type] = (
+            device_number if validate_device_exists(device_type, device_number) else None
+        )
+    return train
 
 
 def get_all_configured_devices() -> dict[str, list[int]]:
@@ -0,0 +1,188 @@
+"""
+Push streaming of device state changes over Server-Sent Events.
+
+Instead of polling properties, a client opens ``GET /api/stream`` with one ``topic``
+parameter per device (``telescope/0``) or device property (``telescope/0/rightascension``)
+it follows. It first receives a ``snapshot`` event per device with the current values,
+then a ``state`` event per device with the values that changed. Changes are collected
+from ``update_device_state`` and flushed once per TICK, so a key written many times
+within a tick is sent once, with its latest value. A ``heartbeat`` event is sent whenever
+a client has had nothing for HEARTBEAT seconds.
+
+Property names are device state keys, which are the Alpaca member names except for a few
+(camera_state, image_ready). Image frames are never streamed.
+
+With a state server, state is also updated by other processes, so the stream reads each
+followed device once per tick instead and sends the keys that differ from the last read.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import anyio.to_thread
+from fastapi import HTTPException
+from pydantic_core import to_json
+
+from alpaca_simulators.state import (
+    FRAME_KEYS,
+    add_state_listener,
+    get_device_state,
+    uses_state_server,
+    validate_device_exists,
+)
+
+TICK = 0.1  # seconds
+HEARTBEAT = 15.0  # seconds
+
+Device = tuple[str, int]
+
+
+def parse_topics(topics: list[str]) -> dict[Device, set[str] | None]:
+    """Parse ``type/number[/key]`` topics into the keys followed per device, None for all.
+
+    Raises a 400 HTTPException for malformed topics and devices that are not configured.
+    """
+    parsed: dict[Device, set[str] | None] = {}
+    for topic in topics:
+        parts = topic.strip("/").lower().split("/")
+        if len(parts) not in (2, 3) or not parts[1].isdigit():
+            raise HTTPException(status_code=400, detail=f"Invalid topic {topic!r}")
+        device = (parts[0], int(parts[1]))
+        if not validate_device_exists(*device):
+            raise HTTPException(status_code=400, detail=f"Device {topic!r} not found")
+        if len(parts) == 2:
+            parsed[device] = None
+        elif device not in parsed or parsed[device] is not None:
+            parsed.setdefault(device, set()).add(parts[2])
+    return parsed
+
+
+def _streamable(values: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in values.items() if key not in FRAME_KEYS}
+
+
+def _differs(a: Any, b: Any) -> bool:
+    try:
+        return bool(a != b)
+    except ValueError:  # numpy arrays compare element-wise
+        return True
+
+
+def _event(name: str, data: dict[str, Any]) -> bytes:
+    payload = to_json(data, inf_nan_mode="null", fallback=lambda value: value.tolist())
+    return b"event: " + name.encode() + b"\ndata: " + payload + b"\n\n"
+
+
+def _device_event(name: str, device: Device, values: dict[str, Any]) -> bytes:
+    return _event(name, {"device_type": device[0], "device_number": device[1], "values": values})
+
+
+class Subscription:
+    """One client's followed keys and the changes not yet sent to it."""
+
+    def __init__(self, topics: dict[Device, set[str] | None]):
+        self.topics = topics
+        self.pending: dict[Device, dict[str, Any]] = {}
+        self.ready = asyncio.Event()
+
+    def select(self, device: Device, values: dict[str, Any]) -> dict[str, Any]:
+        keys = self.topics.get(device, set())
+        if keys is None:
+            return values
+        return {key: value for key, value in values.items() if key in keys}
+
+    def offer(self, device: Device, changes: dict[str, Any]) -> None:
+        changes = self.select(device, changes)
+        if changes:
+            self.pending.setdefault(device, {}).update(changes)
+            self.ready.set()
+
+
+class StateStream:
+    """Collects state changes and fans them out to subscriptions once per tick."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._changes: dict[Device, dict[str, Any]] = {}
+        self._subscriptions: set[Subscription] = set()
+        self._devices: frozenset[Device] = frozenset()
+        self._last_read: dict[Device, dict[str, Any]] = {}
+        self._task: asyncio.Task | None = None
+        add_state_listener(self.record)
+
+    def record(self, device_type: str, device_number: int, new_state: dict[str, Any]) -> None:
+        """State listener: note the changes to followed devices for the next tick."""
+        device = (device_type, device_number)
+        if device in self._devices:
+            with self._lock:
+                self._changes.setdefault(device, {}).update(new_state)
+
+    def subscribe(self, topics: dict[Device, set[str] | None]) -> Subscription:
+        subscription = Subscription(topics)
+        self._subscriptions.add(subscription)
+        self._follow()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+        self._follow()
+
+    def _follow(self) -> None:
+        self._devices = frozenset(
+            device for subscription in self._subscriptions for device in subscription.topics
+        )
+
+    def _read_changes(self) -> dict[Device, dict[str, Any]]:
+        changes, last_read = {}, {}
+        for device in self._devices:
+            state = last_read[device] = _streamable(get_device_state(*device))
+            last = self._last_read.get(device)
+            if last is not None:
+                changes[device] = {
+                    key: value
+                    for key, value in state.items()
+                    if key not in last or _differs(value, last[key])
+                }
+        self._last_read = last_read
+        return changes
+
+    async def _run(self) -> None:
+        while self._subscriptions:
+            await asyncio.sleep(TICK)
+            with self._lock:
+                changes, self._changes = self._changes, {}
+            if uses_state_server():
+                changes = await anyio.to_thread.run_sync(self._read_changes)
+            for device, values in changes.items():
+                values = _streamable(values)
+                for subscription in self._subscriptions:
+                    subscription.offer(device, values)
+
+    async def events(self, topics: dict[Device, set[str] | None]):
+        """Yield the SSE stream for a client following ``topics``."""
+        subscription = self.subscribe(topics)
+        try:
+            for device in topics:
+                state = await anyio.to_thread.run_sync(get_device_state, *device)
+                yield _device_event(
+                    "snapshot", device, subscription.select(device, _streamable(state))
+                )
+            while True:
+                try:
+                    await asyncio.wait_for(subscription.ready.wait(), HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield _event("heartbeat", {"time": time.time()})
+                    continue
+                subscription.ready.clear()
+                pending, subscription.pending = subscription.pending, {}
+                for device, values in pending.items():
+                    yield _device_event("state", device, values)
+        finally:
+            self.unsubscribe(subscription)
+
+
+state_stream = StateStream()
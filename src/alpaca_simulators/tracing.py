@@ -0,0 +1,99 @@
+"""
+Span timings of the exposure pipeline.
+
+Each phase of an exposure (waiting out the exposure, queueing for the render thread,
+catalogue fetch, cabaret setup, rendering, stacking, download) is recorded as a span
+with its start time, duration and tags such as the camera number, cache hit or miss and
+frame size. Spans of one exposure share a trace id, so its phases can be read side by
+side. The last MAX_SPANS spans are kept in memory and served by ``GET /traces``; if the
+config sets ``trace_file``, every span is also appended to that file as one JSON line.
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from alpaca_simulators.config import Config
+
+MAX_SPANS = 2000
+
+spans: deque[dict[str, Any]] = deque(maxlen=MAX_SPANS)
+
+# Trace id of the exposure being worked on in this context.
+current_trace: ContextVar[str | None] = ContextVar("current_trace", default=None)
+
+_trace_ids = itertools.count(1)
+_file_lock = threading.Lock()
+
+
+def new_trace(prefix: str) -> str:
+    """Start a new trace in this context and return its id."""
+    trace_id = f"{prefix}-{next(_trace_ids)}"
+    current_trace.set(trace_id)
+    return trace_id
+
+
+def record_span(
+    name: str,
+    start: float,
+    duration: float,
+    tags: dict[str, Any],
+    trace_id: str | None = None,
+) -> None:
+    """Record a finished span; ``start`` is a Unix time in seconds.
+
+    The span belongs to ``trace_id``, or to the current trace if that is not given.
+    """
+    entry = {
+        "trace_id": trace_id or current_trace.get(),
+        "name": name,
+        "start": start,
+        "duration": duration,
+        "tags": tags,
+    }
+    spans.append(entry)
+    trace_file = Config().load().get("trace_file")
+    if trace_file:
+        line = json.dumps(entry, default=str) + "\n"
+        with _file_lock, open(trace_file, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+@contextmanager
+def span(name: str, trace_id: str | None = None, **tags):
+    """Time the block as a span. Yields its tags, which the block may add to."""
+    start = time.time()
+    started = time.perf_counter()
+    try:
+        yield tags
+    except BaseException as e:
+        tags["error"] = type(e).__name__
+        raise
+    finally:
+        record_span(name, start, time.perf_counter() - started, tags, trace_id)
+
+
+def query_spans(
+    trace_id: str | None = None,
+    name: str | None = None,
+    device_number: int | None = None,
+    limit: int = 100,
+) -> list[dict[str, Any]]:
+    """Return the most recent matching spans, newest first."""
+    found = []
+    for entry in reversed(list(spans)):
+        if trace_id is not None and entry["trace_id"] != trace_id:
+            continue
+        if name is not None and not entry["name"].startswith(name):
+            continue
+        if device_number is not None and entry["tags"].get("camera") != device_number:
+            continue
+        found.append(entry)
+        if len(found) >= limit:
+            break
+    return found
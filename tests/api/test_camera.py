@@ -0,0 +1,289 @@
+import asyncio
+import concurrent.futures
+import copy
+import struct
+import time
+
+import numpy as np
+import pytest
+from cabaret import Sources
+from fastapi.testclient import TestClient
+
+from alpaca_simulators import calibration, catalogue, state
+from alpaca_simulators.api import camera
+from alpaca_simulators.main import app
+from alpaca_simulators.state import (
+    CalibratorStatus,
+    get_device_state,
+    reload_config,
+    update_device_state,
+)
+
+client = TestClient(app)
+
+base_api_path = "/api/v1/camera"
+
+
+@pytest.fixture()
+def camera_frame():
+    """Place a synthetic frame in camera 0 as if an exposure had just finished"""
+    frame = np.arange(512 * 256, dtype=np.uint16).reshape(256, 512)
+    update_device_state("camera", 0, {"image_data": frame, "image_ready": True})
+    yield frame
+    reload_config()
+
+
+class TestPreview:
+    """Tests for the non-standard camera preview endpoint"""
+
+    def test_preview_png_is_downsampled(self, camera_frame):
+        response = client.get(f"{base_api_path}/0/preview", params={"Size": 64})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.content.startswith(b"\x89PNG\r\n\x1a\n")
+        width, height = struct.unpack(">II", response.content[16:24])
+        assert (width, height) == (64, 32)
+
+    def test_preview_is_rendered_once_per_frame(self, camera_frame, monkeypatch):
+        calls = []
+        original = camera.render_preview
+
+        def counting_render(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(camera, "render_preview", counting_render)
+        for _ in range(3):
+            assert client.get(f"{base_api_path}/0/preview").status_code == 200
+        assert len(calls) == 1
+
+        update_device_state("camera", 0, {"image_data": camera_frame.copy()})
+        assert client.get(f"{base_api_path}/0/preview").status_code == 200
+        assert len(calls) == 2
+
+    def test_preview_invalid_format(self, camera_frame):
+        response = client.get(f"{base_api_path}/0/preview", params={"Format": "gif"})
+        assert response.status_code == 200
+        assert response.json()["ErrorNumber"] == 0x401
+
+    def test_preview_without_image(self):
+        update_device_state("camera", 0, {"image_data": None})
+        try:
+            response = client.get(f"{base_api_path}/0/preview")
+        finally:
+            reload_config()
+        assert response.json()["ErrorNumber"] == 0x40D
+
+
+class TestCalibrationFrames:
+    """Tests for the cabaret-free bias, dark and flat path"""
+
+    @pytest.fixture(autouse=True)
+    def reset_state(self):
+        yield
+        reload_config()
+
+    def _expose(self, duration, light):
+        response = client.put(
+            f"{base_api_path}/0/startexposure",
+            data={"Duration": duration, "Light": light, "ClientTransactionID": 1},
+        )
+        assert response.json()["ErrorNumber"] == 0
+        return get_device_state("camera", 0)
+
+    def test_dark_frame_skips_cabaret(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("dark frames must not be rendered by cabaret")
+
+        monkeypatch.setattr(camera, "_generate_light_frame", fail)
+        state = self._expose(0.01, False)
+        assert state["image_ready"]
+        image = state["image_data"]
+        assert image.dtype == np.uint16
+        assert image.shape == (state["numy"], state["numx"])
+
+    def test_flat_frame_uses_calibrator_brightness(self, monkeypatch):
+        monkeypatch.setattr(camera, "_generate_light_frame", None)
+        update_device_state(
+            "covercalibrator",
+            0,
+            {"calibratorstate": CalibratorStatus.READY, "brightness": 255},
+        )
+        flat = self._expose(0.5, True)["image_data"]
+        update_device_state("camera", 0, {"image_data": None})
+        dark = self._expose(0.5, False)["image_data"]
+        assert flat.mean() > dark.mean() + 1000
+
+    def test_detector_maps_are_cached(self):
+        cam_state = get_device_state("camera", 0)
+        assert calibration.bias_map(0, cam_state) is calibration.bias_map(0, cam_state)
+        assert calibration.dark_map(0, cam_state) is calibration.dark_map(0, cam_state)
+        warmer = dict(cam_state, ccdtemperature=cam_state["ccdtemperature"] + 6)
+        assert calibration.dark_map(0, warmer).mean() == pytest.approx(
+            2 * calibration.dark_map(0, cam_state).mean(), rel=1e-3
+        )
+
+
+class TestSubExposures:
+    """Tests for SubExposureDuration and co-added sub-exposures"""
+
+    @pytest.fixture(autouse=True)
+    def reset_state(self):
+        yield
+        reload_config()
+
+    def test_get_set_subexposureduration(self):
+        response = client.put(
+            f"{base_api_path}/0/subexposureduration",
+            data={"SubExposureDuration": 0.5, "ClientTransactionID": 1},
+        )
+        assert response.json()["ErrorNumber"] == 0
+        response = client.get(f"{base_api_path}/0/subexposureduration")
+        assert response.json()["Value"] == 0.5
+
+    def test_invalid_subexposureduration(self):
+        response = client.put(
+            f"{base_api_path}/0/subexposureduration",
+            data={"SubExposureDuration": -1, "ClientTransactionID": 1},
+        )
+        assert response.json()["ErrorNumber"] == 0x401
+
+    def test_stacked_frame_sums_sub_exposures(self):
+        cam_state = dict(get_device_state("camera", 0), numx=256, numy=256)
+        bias = calibration.bias_map(0, cam_state)
+        single = calibration.generate_calibration_frame(0, cam_state, 1.0, 0.1)
+        stacked = calibration.generate_calibration_frame(0, cam_state, 1.0, 0.1, 0.25)
+        assert stacked.dtype == np.uint16
+        assert stacked.shape == single.shape
+        # The light of the whole exposure, on top of one bias.
+        assert np.mean(stacked - bias) == pytest.approx(np.mean(single - bias), rel=0.01)
+
+    def test_stacked_frame_has_the_read_noise_of_every_sub(self):
+        cam_state = dict(get_device_state("camera", 0), numx=256, numy=256)
+        assert calibration.subexposure_count(1.0, 0.01) == 100
+        singles = [calibration.generate_calibration_frame(0, cam_state, 1.0) for _ in range(2)]
+        stacks = [
+            calibration.generate_calibration_frame(0, cam_state, 1.0, sub_duration=0.01)
+            for _ in range(2)
+        ]
+        single_noise = np.std(singles[0].astype(float) - singles[1])
+        stacked_noise = np.std(stacks[0].astype(float) - stacks[1])
+        assert stacked_noise / single_noise == pytest.approx(10, rel=0.1)
+
+    def test_long_stack_keeps_its_signal_level(self):
+        cam_state = dict(get_device_state("camera", 0), numx=64, numy=64)
+        gain = cam_state.get("gain", 1.0)
+        bias = calibration.bias_map(0, cam_state)
+        flat = calibration.flat_map(0, cam_state) * calibration.FLAT_RATE * 0.1 / gain
+        assert calibration.subexposure_count(1.0, 0.001) == 1000
+        dark = calibration.generate_calibration_frame(0, cam_state, 1.0, sub_duration=0.001)
+        lit = calibration.generate_calibration_frame(0, cam_state, 1.0, 0.1, 0.001)
+        # A thousand reads leave a dark at the bias level (give or take the read noise of
+        # the thousand averaged over the frame), far from saturated.
+        assert np.mean(dark - bias) == pytest.approx(0, abs=10)
+        assert np.mean(lit - bias) == pytest.approx(np.mean(flat), rel=0.01)
+
+    def test_stacked_light_frames_draw_fresh_noise(self, monkeypatch):
+        config = copy.deepcopy(state.DEVICE_CONFIG)
+        small = {"cameraxsize": 64, "cameraysize": 64, "numx": 64, "numy": 64}
+        config["devices"]["camera"][0].update(small, subexposureduration=0.05)
+        config["topology"] = {0: {"telescope": 0}}
+        monkeypatch.setattr(state, "DEVICE_CONFIG", config)
+        monkeypatch.setattr(
+            catalogue.GaiaQuery,
+            "get_sources",
+            lambda center, radius, limit, **kwargs: Sources.from_arrays(
+                ra=[center[0]], dec=[center[1]], fluxes=[1e5]
+            ),
+        )
+        state.reset_state()
+        try:
+            frames = []
+            for _ in range(2):
+                asyncio.run(camera.exposure_task(0, 0.2, True))
+                frames.append(get_device_state("camera", 0)["image_data"].astype(float))
+            (sky,) = [image for key, image in camera.image_cache[0].items() if "_sky" in key]
+        finally:
+            catalogue.clear()
+            camera.image_cache.clear()
+            state.reset_state()
+
+        # The cached sky is the expected background, without a sub-exposure's shot noise.
+        background = sky[:8, :8].astype(float)
+        assert background.mean() > 0.1
+        assert background.std() < np.sqrt(background.mean()) / 10
+        # Each stack still draws its own noise.
+        assert not np.array_equal(frames[0], frames[1])
+
+
+class TestSharedCatalogue:
+    """Tests for coalesced catalogue fetches across cameras on one telescope"""
+
+    @pytest.fixture()
+    def two_cameras(self, monkeypatch):
+        config = copy.deepcopy(state.DEVICE_CONFIG)
+        small = {"cameraxsize": 128, "cameraysize": 128, "numx": 128, "numy": 128}
+        config["devices"]["camera"][0].update(small)
+        config["devices"]["camera"][1] = dict(config["devices"]["camera"][0], numx=64)
+        config["topology"] = {0: {"telescope": 0}, 1: {"telescope": 0}}
+        monkeypatch.setattr(state, "DEVICE_CONFIG", config)
+        state.reset_state()
+        yield
+        catalogue.clear()
+        camera.image_cache.clear()
+        state.reset_state()
+
+    def test_concurrent_exposures_share_one_query(self, two_cameras, monkeypatch):
+        queries = []
+
+        def fake_get_sources(center, radius, limit, **kwargs):
+            queries.append(radius)
+            time.sleep(0.2)  # keep the fetch in flight while the other camera joins
+            return Sources.from_arrays(ra=[center[0]], dec=[center[1]], fluxes=[1e5])
+
+        monkeypatch.setattr(catalogue.GaiaQuery, "get_sources", fake_get_sources)
+
+        async def expose_both():
+            await asyncio.gather(
+                camera.exposure_task(0, 0.01, True), camera.exposure_task(1, 0.01, True)
+            )
+
+        asyncio.run(expose_both())
+
+        assert len(queries) == 1
+        assert queries[0] > catalogue.field_radius(
+            get_device_state("camera", 0), get_device_state("telescope", 0)
+        )
+        assert get_device_state("camera", 0)["image_data"].shape == (128, 128)
+        assert get_device_state("camera", 1)["image_data"].shape == (128, 64)
+
+    def test_larger_field_does_not_join_smaller_fetch(self, monkeypatch):
+        queries = []
+
+        def fake_get_sources(center, radius, limit, tap_source=None, **kwargs):
+            queries.append((radius, tap_source))
+            time.sleep(0.2)  # keep the fetch in flight while the other request arrives
+            return Sources.from_arrays(ra=[center[0]], dec=[center[1]], fluxes=[radius])
+
+        monkeypatch.setattr(catalogue.GaiaQuery, "get_sources", fake_get_sources)
+
+        def fetch(radius, tap_source=None):
+            return catalogue.get_shared_sources(
+                0, 10.0, 20.0, radius, radius, tap_source=tap_source
+            )
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(2) as pool:
+                small = pool.submit(fetch, 0.1)
+                time.sleep(0.05)
+                large = pool.submit(fetch, 0.5)
+                small_radius = small.result().fluxes[0]
+                large_radius = large.result().fluxes[0]
+            # Another catalogue is a separate field.
+            fetch(0.1, "gaiadr2.gaia_source")
+        finally:
+            catalogue.clear()
+
+        assert small_radius < 0.5 < large_radius
+        assert [radius for radius, _ in queries] == [small_radius, large_radius, small_radius]
+        assert queries[-1][1] == "gaiadr2.gaia_source"
@@ -1,13 +1,23 @@
 import time
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
+from alpaca_simulators.api import telescope
+from alpaca_simulators.api.telescope import (
+    _advance_telescopes,
+    _altaz_to_radec,
+    _altaz_to_radec_batch,
+    _radec_to_altaz,
+    _radec_to_altaz_batch,
+)
 from alpaca_simulators.main import app
 from alpaca_simulators.state import (
     Rate,
     TelescopeAxes,
     get_device_state,
+    get_device_states,
     reload_config,
     update_device_state,
 )
@@ -73,6 +83,13 @@ class TestTelescope:
         data = response.json()
         assert data["Value"] == [setup_telescope_state.get("axis2rates").model_dump()]
 
+    def test_get_axisrates_follows_state_updates(self, setup_telescope_state):
+        params = {"Axis": TelescopeAxes.PRIMARY}
+        assert client.get(f"{base_api_path}/0/axisrates", params=params).json()["Value"]
+        update_device_state("telescope", 0, {"axis0rates": Rate(Maximum=3.0, Minimum=1.0)})
+        response = client.get(f"{base_api_path}/0/axisrates", params=params)
+        assert response.json()["Value"] == [{"Maximum": 3.0, "Minimum": 1.0}]
+
     def test_get_axisrates_invalid_axis(self):
         """Test getting axis rates with invalid axis value"""
         transaction_id = 789
@@ -175,3 +192,89 @@ class TestTelescope:
         assert response.status_code == 200
 
         assert response.json()["Value"] == pytest.approx(12.0, abs=5e-2)
+
+
+class TestBatchTransforms:
+    """The vectorised transforms against the scalar ones."""
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(1)
+        n = 1000
+        ra = rng.uniform(0, 24, n)
+        dec = rng.uniform(-90, 90, n)
+        lat = rng.uniform(-90, 90, n)
+        lon = rng.uniform(-180, 180, n)
+        now = time.time()
+
+        alt, az = _radec_to_altaz_batch(ra, dec, lat, lon, now)
+        back_ra, back_dec = _altaz_to_radec_batch(alt, az, lat, lon, now)
+        for i in range(n):
+            scalar_alt, scalar_az = _radec_to_altaz(ra[i], dec[i], lat[i], lon[i], now)
+            assert abs(alt[i] - scalar_alt) < 1e-9
+            assert abs((az[i] - scalar_az + 180) % 360 - 180) < 1e-9
+            scalar_ra, scalar_dec = _altaz_to_radec(alt[i], az[i], lat[i], lon[i], now)
+            assert abs((back_ra[i] - scalar_ra + 12) % 24 - 12) * 15 < 1e-9
+            assert abs(back_dec[i] - scalar_dec) < 1e-9
+
+    def test_advance_telescopes_tracks_in_one_batch(self, setup_telescope_state):
+        start = time.time() - 2.0
+        update_device_state(
+            "telescope",
+            0,
+            {
+                "rightascension": 1.0,
+                "declination": 10.0,
+                "rightascensionrate": 0.0,
+                "declinationrate": 3600.0,
+                "tracking": True,
+                "last_motion_update": start,
+            },
+        )
+
+        _advance_telescopes([0])
+
+        state = get_device_state("telescope", 0)
+        elapsed = state["last_motion_update"] - start
+        assert state["declination"] == pytest.approx(10.0 + elapsed)
+        alt, az = _radec_to_altaz(
+            state["rightascension"],
+            state["declination"],
+            state["sitelatitude"],
+            state["sitelongitude"],
+            state["last_motion_update"],
+        )
+        assert state["altitude"] == pytest.approx(alt, abs=1e-9)
+        assert state["azimuth"] == pytest.approx(az, abs=1e-9)
+
+    def test_advance_telescopes_keeps_sync_accepted_during_batch(
+        self, setup_telescope_state, monkeypatch
+    ):
+        update_device_state(
+            "telescope",
+            0,
+            {
+                "rightascension": 1.0,
+                "declination": 10.0,
+                "rightascensionrate": 0.0,
+                "declinationrate": 0.0,
+                "tracking": True,
+                "last_motion_update": time.time() - 2.0,
+            },
+        )
+
+        def read_then_sync(devices):
+            states = get_device_states(devices)
+            # A sync accepted after the batch read its states.
+            update_device_state(
+                "telescope",
+                0,
+                {"rightascension": 5.0, "declination": 45.0, "last_motion_update": time.time()},
+            )
+            return states
+
+        monkeypatch.setattr(telescope, "get_device_states", read_then_sync)
+        _advance_telescopes([0])
+
+        state = get_device_state("telescope", 0)
+        assert state["rightascension"] == pytest.approx(5.0)
+        assert state["declination"] == pytest.approx(45.0)
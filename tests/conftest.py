@@ -0,0 +1,4 @@
+import os
+
+# Run the tests on the shipped template, not on whatever local config.yaml is around.
+os.environ.setdefault("ASTRA_SIMULATORS_CONFIG", "template.yaml")
@@ -0,0 +1,60 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from alpaca_simulators.config import Config
+from alpaca_simulators.main import app
+
+client = TestClient(app)
+
+
+def test_admin_endpoints_disabled_by_default():
+    unknown = client.post("/admin/unknown").status_code
+    assert client.post("/admin/profile/start").status_code == unknown
+    assert client.post("/admin/tracemalloc/snapshot").status_code == unknown
+
+
+def test_sampling_profiler(monkeypatch):
+    monkeypatch.setitem(Config().load(), "admin_endpoints", True)
+    response = client.post("/admin/profile/start", params={"seconds": 5, "interval": 0.001})
+    assert response.status_code == 200
+    assert client.post("/admin/profile/start").status_code == 409
+    time.sleep(0.1)
+
+    collapsed = client.post("/admin/profile/stop").text
+    line = collapsed.splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert int(count) >= 1
+    assert "sampling-profiler" not in stack
+
+    profile = client.post("/admin/profile/stop", params={"format": "speedscope"}).json()
+    sampled = profile["profiles"][0]
+    assert len(sampled["samples"]) == len(sampled["weights"]) == len(collapsed.splitlines())
+    assert all(i < len(profile["shared"]["frames"]) for s in sampled["samples"] for i in s)
+
+
+def test_tracemalloc_snapshots(monkeypatch):
+    monkeypatch.setitem(Config().load(), "admin_endpoints", True)
+    assert client.post("/admin/tracemalloc/snapshot").status_code == 409
+    client.post("/admin/tracemalloc/start", params={"frames": 1})
+    try:
+        first = client.post("/admin/tracemalloc/snapshot").json()
+        assert first["compared_to"] is None
+        assert "image_cache_bytes" in first["suspects"]
+        leak = [bytearray(1000) for _ in range(1000)]
+        second = client.post("/admin/tracemalloc/snapshot", params={"limit": 5}).json()
+        assert second["compared_to"] == first["snapshot"]
+        assert second["top"][0]["size_diff"] >= 1_000_000
+
+        diff = client.get(
+            "/admin/tracemalloc/diff",
+            params={"base": first["snapshot"], "other": second["snapshot"]},
+        )
+        assert diff.json()["top"][0]["size_diff"] >= 1_000_000
+        assert (
+            client.get("/admin/tracemalloc/diff", params={"base": 0, "other": 1}).status_code
+            == 400
+        )
+        del leak
+    finally:
+        client.post("/admin/tracemalloc/stop")
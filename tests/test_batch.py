@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from alpaca_simulators.api.telescope import _advance_telescope_motion
+from alpaca_simulators.main import app
+from alpaca_simulators.state import (
+    get_device_state,
+    get_live_device_state,
+    reload_config,
+    state_snapshot,
+    update_device_state,
+)
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def restore_state():
+    yield
+    reload_config()
+
+
+def test_batch_runs_requests_in_order():
+    response = client.post(
+        "/api/batch",
+        json=[
+            {
+                "device_type": "focuser",
+                "device_number": 0,
+                "member": "tempcomp",
+                "method": "PUT",
+                "params": {"TempComp": True, "ClientTransactionID": 3},
+            },
+            {"device_type": "focuser", "device_number": 0, "member": "tempcomp"},
+            {"device_type": "telescope", "device_number": 0, "member": "axisrates"},
+            {"device_type": "focuser", "device_number": 9, "member": "position"},
+        ],
+    )
+    assert response.status_code == 200
+    put, get, missing_param, missing_device = response.json()
+    assert put["status"] == 200 and put["response"]["ClientTransactionID"] == 3
+    assert get["response"]["Value"] is True
+    assert missing_param["status"] == 422
+    assert missing_device["response"]["ErrorNumber"] == 0x400
+
+    assert client.post("/api/batch", json=[{"device_type": "dome"}]).status_code == 422
+
+
+def test_snapshot_isolates_reads_from_other_writers():
+    update_device_state("dome", 0, {"azimuth": 10.0, "slewing": False})
+    with state_snapshot([("dome", 0)]):
+        other = threading.Thread(target=update_device_state, args=("dome", 0, {"azimuth": 20.0}))
+        other.start()
+        other.join()
+        update_device_state("dome", 0, {"slewing": True})
+        state = get_device_state("dome", 0)
+        assert (state["azimuth"], state["slewing"]) == (10.0, True)
+    assert get_device_state("dome", 0)["azimuth"] == 20.0
+
+
+def test_batch_does_not_wait_for_background_work():
+    start = time.perf_counter()
+    try:
+        response = client.post(
+            "/api/batch",
+            json=[
+                {
+                    "device_type": "dome",
+                    "device_number": 0,
+                    "member": "slewtoazimuth",
+                    "method": "PUT",
+                    "params": {"Azimuth": 90.0},
+                },
+                {"device_type": "dome", "device_number": 0, "member": "slewing"},
+            ],
+        )
+        elapsed = time.perf_counter() - start
+        slew, slewing = response.json()
+        assert slew["status"] == 200 and slew["response"]["ErrorNumber"] == 0
+        assert slewing["response"]["Value"] is True
+        assert elapsed < 1.0
+    finally:
+        client.put("/api/v1/dome/0/abortslew")
+
+
+def test_telescope_motion_stays_out_of_the_snapshot():
+    update_device_state(
+        "telescope",
+        0,
+        {"tracking": False, "atpark": False, "last_motion_update": time.time() - 60},
+    )
+    with state_snapshot([("telescope", 0)]):
+        ra = get_device_state("telescope", 0)["rightascension"]
+        _advance_telescope_motion(0)
+        assert get_device_state("telescope", 0)["rightascension"] == ra
+        assert get_live_device_state("telescope", 0)["rightascension"] != ra
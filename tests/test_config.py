@@ -22,7 +22,8 @@ def temp_config_dir(monkeypatch):
         monkeypatch.setattr(Config, "CONFIG_DIR", config_dir)
         monkeypatch.setattr(Config, "_DEFAULT_PATH", default_config_path)
 
-        # Reset singleton for each test
+        # Reset singleton for each test, and put back the one the other tests use after
+        previous = Config._instance
         Config._instance = None
         yield {
             "config_dir": config_dir,
@@ -30,7 +31,7 @@ def temp_config_dir(monkeypatch):
             "config_path": config_path,
             "default_config": default_config,
         }
-        Config._instance = None
+        Config._instance = previous
 
 
 def test_singleton():
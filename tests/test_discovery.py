@@ -0,0 +1,37 @@
+from fastapi.testclient import TestClient
+
+from alpaca_simulators.endpoint_discovery import discover_device_endpoints
+from alpaca_simulators.main import app
+
+client = TestClient(app)
+
+
+def test_discovery_is_memoised_until_routes_change():
+    endpoints = discover_device_endpoints(app)
+    assert discover_device_endpoints(app) is endpoints
+
+    @app.get("/api/v1/dome/{device_number}/testonlyproperty")
+    def get_testonlyproperty(device_number: int):
+        return {}
+
+    try:
+        updated = discover_device_endpoints(app)
+        assert updated is not endpoints
+        assert "testonlyproperty" in updated["dome"]["GET"]
+    finally:
+        app.router.routes.pop()
+    assert "testonlyproperty" not in discover_device_endpoints(app)["dome"]["GET"]
+
+
+def test_discovery_pages_are_etagged():
+    for path in ("/api/endpoints", "/test_interface"):
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert client.get(path).content == response.content
+
+        cached = client.get(path, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+    assert "camera" in client.get("/api/endpoints").json()["discovered_endpoints"]
@@ -0,0 +1,46 @@
+from alpaca_simulators.fleet import expand_fleet
+
+
+def make_config(**fleet):
+    return {
+        "devices": {
+            "camera": {0: {"name": "Camera", "gain": 1}},
+            "telescope": {0: {"name": "Telescope", "sitelatitude": 48.0}},
+            "focuser": {0: {"position": 100}},
+        },
+        "topology": {0: {"telescope": 0, "focuser": 0}},
+        "fleet": fleet,
+    }
+
+
+def test_config_without_fleet_is_unchanged():
+    config = {"devices": {"camera": {0: {}}}}
+    assert expand_fleet(config) is config
+
+
+def test_sites_are_numbered_consecutively():
+    config = expand_fleet(make_config(sites=3))
+    assert sorted(config["devices"]["telescope"]) == [0, 1, 2]
+    assert config["devices"]["telescope"][2]["name"] == "Telescope (site 2)"
+    assert config["topology"][1] == {"telescope": 1, "focuser": 1}
+
+
+def test_site_overrides():
+    overrides = {
+        1: {
+            "latitude": -24.6,
+            "counts": {"camera": 2, "focuser": 0},
+            "camera": {"gain": 3},
+        }
+    }
+    config = expand_fleet(make_config(sites=3, overrides=overrides))
+    devices = config["devices"]
+
+    assert devices["telescope"][1]["sitelatitude"] == -24.6
+    assert devices["telescope"][0]["sitelatitude"] == 48.0
+    assert "sitelatitude" not in devices["camera"][1]
+    # Site 1 has cameras 1 and 2, so site 2's camera is number 3.
+    assert sorted(devices["camera"]) == [0, 1, 2, 3]
+    assert devices["camera"][2]["gain"] == 3
+    assert config["topology"][2] == {"telescope": 1, "focuser": None}
+    assert config["topology"][3] == {"telescope": 2, "focuser": 1}
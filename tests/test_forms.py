@@ -0,0 +1,45 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from alpaca_simulators.api.forms import parse_form
+from alpaca_simulators.main import app
+from alpaca_simulators.state import reload_config
+
+client = TestClient(app)
+
+
+@pytest.fixture()
+def restore_state():
+    yield
+    reload_config()
+
+
+def test_parse_form_decodes_like_starlette():
+    form = parse_form(b"Name=Red+Filter&Text=%C3%A9%26x&Empty=&Flag&&ClientID=1")
+    assert form.multi_items() == [
+        ("Name", "Red Filter"),
+        ("Text", "é&x"),
+        ("Empty", ""),
+        ("Flag", ""),
+        ("ClientID", "1"),
+    ]
+    assert parse_form(b"").multi_items() == []
+
+
+def test_put_parameter_names_are_case_insensitive(restore_state):
+    response = client.put("/api/v1/camera/0/binx", data={"BINX": "2", "clienttransactionid": "43"})
+    assert response.json()["ErrorNumber"] == 0
+    assert response.json()["ClientTransactionID"] == 43
+    assert client.get("/api/v1/camera/0/binx").json()["Value"] == 2
+
+    # Multipart bodies still go through Starlette's parser.
+    response = client.put("/api/v1/camera/0/binx", files={"binx": (None, "1")})
+    assert response.json()["ErrorNumber"] == 0
+    assert client.get("/api/v1/camera/0/binx").json()["Value"] == 1
+
+
+def test_error_responses_echo_client_transaction_id_from_body(restore_state):
+    response = client.put("/api/v1/camera/0/binx", data={"BinX": "0", "ClientTransactionID": "42"})
+    body = response.json()
+    assert body["ErrorNumber"] == 0x402
+    assert body["ClientTransactionID"] == 42
@@ -0,0 +1,20 @@
+from alpaca_simulators.loadtest import Recorder, compare, summarise
+
+
+def test_summarise_and_compare():
+    recorder = Recorder()
+    recorder.latencies["GET /api/v1/dome/0/azimuth"] = [i / 1000 for i in range(1, 101)]
+    recorder.errors["PUT /api/v1/dome/0/slewtoazimuth"] = 2
+
+    result = summarise(recorder, duration=10)
+    assert result["requests"] == 100
+    assert result["errors"] == 2
+    azimuth = result["endpoints"]["GET /api/v1/dome/0/azimuth"]
+    assert azimuth["rps"] == 10
+    assert round(azimuth["p50_ms"]) == 51
+    assert round(azimuth["p99_ms"]) == 99
+    assert "p50_ms" not in result["endpoints"]["PUT /api/v1/dome/0/slewtoazimuth"]
+
+    recorder.latencies["GET /api/v1/dome/0/azimuth"] *= 2
+    table = compare(summarise(recorder, duration=10), result)
+    assert "+100.0%" in table.splitlines()[1]
@@ -0,0 +1,37 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from alpaca_simulators.discovery import discover, serve_discovery
+from alpaca_simulators.main import app
+from alpaca_simulators.state import get_all_configured_devices
+
+client = TestClient(app)
+
+
+def test_management_api():
+    assert client.get("/management/apiversions").json()["Value"] == [1]
+    description = client.get("/management/v1/description").json()["Value"]
+    assert description["ServerName"] == "Alpaca Observatory Simulator"
+
+    response = client.get("/management/v1/configureddevices", params={"ClientTransactionID": 4})
+    assert response.json()["ClientTransactionID"] == 4
+    devices = response.json()["Value"]
+    configured = get_all_configured_devices()
+    assert len(devices) == sum(map(len, configured.values()))
+    camera = next(device for device in devices if device["DeviceType"] == "Camera")
+    assert camera["DeviceNumber"] == 0
+    assert len({device["UniqueID"] for device in devices}) == len(devices)
+
+
+def test_discovery_responder():
+    async def run():
+        responders = [asyncio.create_task(serve_discovery(port, 42227)) for port in (8001, 8002)]
+        await asyncio.sleep(0.05)
+        try:
+            return await discover(1.0, 42227, "127.255.255.255", expected=2)
+        finally:
+            for responder in responders:
+                responder.cancel()
+
+    assert sorted(port for _, port in asyncio.run(run())) == [8001, 8002]
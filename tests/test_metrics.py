@@ -0,0 +1,22 @@
+from fastapi.testclient import TestClient
+
+from alpaca_simulators.main import app
+
+client = TestClient(app)
+
+
+def test_metrics_count_requests_per_route():
+    client.get("/api/v1/dome/0/azimuth")
+    client.get("/api/v1/dome/0/azimuth")
+    client.get("/api/v1/nosuchdevice/0/name")
+    text = client.get("/metrics").text
+
+    samples = dict(line.rsplit(" ", 1) for line in text.splitlines() if line[0] != "#")
+    labels = 'endpoint="/dome/{device_number}/azimuth",device_type="dome",method="GET"'
+    assert int(samples[f'alpaca_requests_total{{{labels},status="200"}}']) >= 2
+    count = samples[f"alpaca_request_duration_seconds_count{{{labels}}}"]
+    assert samples[f'alpaca_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == count
+    assert any('device_type="other"' in name for name in samples)
+    assert "nosuchdevice" not in text
+    for gauge in ("alpaca_active_exposures", "alpaca_threads", "alpaca_state_lock_waits_total"):
+        assert gauge in samples
@@ -0,0 +1,79 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from alpaca_simulators.api import dome, properties
+from alpaca_simulators.api.properties import build_property_table
+from alpaca_simulators.endpoint_discovery import discover_device_endpoints
+from alpaca_simulators.main import app
+from alpaca_simulators.state import (
+    BoolResponse,
+    DoubleResponse,
+    reload_config,
+    static_state_keys,
+    update_device_state,
+)
+
+client = TestClient(app)
+
+
+def test_table_takes_response_models_from_spec():
+    table = build_property_table("dome", {"azimuth": 0.0, "slewing": False})
+    assert table["azimuth"] == ("azimuth", 0.0, DoubleResponse)
+    assert table["slewing"] == ("slewing", False, BoolResponse)
+
+    with pytest.raises(ValueError):
+        build_property_table("dome", {"slewtoazimuth": 0.0})
+
+
+@pytest.fixture()
+def restore_state():
+    yield
+    reload_config()
+
+
+def test_generated_getter_reads_state(restore_state):
+    update_device_state("dome", 0, {"azimuth": 123.5})
+    response = client.get("/api/v1/dome/0/azimuth", params={"ClientTransactionID": 7})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["Value"] == 123.5
+    assert body["ClientTransactionID"] == 7
+    assert body["ErrorNumber"] == 0
+
+    assert client.get("/api/v1/dome/0/nosuchproperty").status_code == 404
+    assert client.get("/api/v1/dome/99/azimuth").json()["ErrorNumber"] == 0x400
+
+
+def test_generated_properties_are_discoverable():
+    endpoints = discover_device_endpoints(app)["dome"]
+    assert set(dome.PROPERTIES) <= set(endpoints["GET"])
+    assert "{member}" not in endpoints["GET"]
+    assert "slewtoazimuth" in endpoints["PUT"]
+
+
+def test_static_properties_are_cached_until_config_reload(monkeypatch):
+    assert {"canpark", "maxbinx", "gains"} & static_state_keys("camera") == {"maxbinx", "gains"}
+    assert "ccdtemperature" not in static_state_keys("camera")
+
+    reads = []
+    read_config = properties.get_device_config
+    monkeypatch.setattr(
+        properties,
+        "get_device_config",
+        lambda *device: reads.append(device) or read_config(*device),
+    )
+    reload_config()
+    first = client.get("/api/v1/camera/0/maxbinx", params={"ClientTransactionID": 1}).json()
+    second = client.get("/api/v1/camera/0/maxbinx", params={"ClientTransactionID": 2}).json()
+    assert second["Value"] == first["Value"]
+    assert second["ClientTransactionID"] == 2
+    assert second["ServerTransactionID"] > first["ServerTransactionID"]
+    assert len(reads) == 1
+
+    reload_config()
+    client.get("/api/v1/camera/0/maxbinx")
+    assert len(reads) == 2
+
+    # Errors are not cached.
+    assert client.get("/api/v1/camera/99/maxbinx").json()["ErrorNumber"] == 0x400
+    assert client.get("/api/v1/camera/99/maxbinx").json()["ErrorNumber"] == 0x400
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from alpaca_simulators.api.responses import encode_value_response
+from alpaca_simulators.state import (
+    BoolResponse,
+    CameraStates,
+    DoubleResponse,
+    IntArrayResponse,
+    IntResponse,
+    StringArrayResponse,
+    StringResponse,
+)
+
+CASES = [
+    (BoolResponse, [True, False, np.bool_(True), 1]),
+    (IntResponse, [0, -5, 2**40, CameraStates.EXPOSING, True, 3.0, np.int64(7)]),
+    (
+        DoubleResponse,
+        [0.0, -0.0, 1e-05, 1e16, 0.1 + 0.2, float("nan"), float("inf"), 3, np.float64(2.5)],
+    ),
+    (StringResponse, ["", "Simulated CCD", 'quote " and \\ slash', "é \n\t\x01"]),
+    (StringArrayResponse, [[], ["Low", "High"], ("a", "b")]),
+    (IntArrayResponse, [[], [0, -10, 25], [CameraStates.IDLE], np.array([1, 2]).tolist()]),
+]
+
+
+@pytest.mark.parametrize(
+    "model, value", [(model, value) for model, values in CASES for value in values]
+)
+def test_encoding_matches_response_model(model, value):
+    expected = model(Value=value, ClientTransactionID=12, ServerTransactionID=345)
+    assert encode_value_response(model, value, 12, 345) == expected.model_dump_json().encode()
+
+
+def test_encoding_matches_fastapi_serialisation():
+    app = FastAPI()
+
+    @app.get("/double", response_model=DoubleResponse)
+    def double():
+        return DoubleResponse(Value=1e-05, ClientTransactionID=1, ServerTransactionID=2)
+
+    @app.get("/strings", response_model=StringArrayResponse)
+    def strings():
+        return StringArrayResponse(Value=["é", "x"], ClientTransactionID=1, ServerTransactionID=2)
+
+    client = TestClient(app)
+    assert client.get("/double").content == encode_value_response(DoubleResponse, 1e-05, 1, 2)
+    assert client.get("/strings").content == encode_value_response(
+        StringArrayResponse, ["é", "x"], 1, 2
+    )
@@ -0,0 +1,67 @@
+from fastapi import APIRouter
+from fastapi.testclient import TestClient
+
+from alpaca_simulators.main import app
+from alpaca_simulators.routing import AlpacaDispatcher, compile_routes
+
+client = TestClient(app)
+
+
+def test_first_registered_route_wins():
+    first = APIRouter()
+    second = APIRouter()
+
+    @first.get("/{device_type}/{device_number}/name")
+    def generic_name():
+        pass
+
+    @second.get("/camera/{device_number}/name")
+    def camera_name():
+        pass
+
+    @second.get("/camera/{device_number}/gain")
+    def camera_gain():
+        pass
+
+    dispatcher = AlpacaDispatcher(app.router, first.routes + second.routes)
+    _, route, params = dispatcher.lookup("camera", "name", "GET")
+    assert route.endpoint is generic_name
+    assert params == ("device_type", "device_number", None)
+    assert dispatcher.lookup("camera", "gain", "GET")[1].endpoint is camera_gain
+    assert dispatcher.lookup("camera", "gain", "PUT") is None
+
+
+def test_typed_paths_are_not_compiled():
+    router = APIRouter()
+
+    @router.get("/camera/{device_number:int}/gain")
+    def camera_gain():
+        pass
+
+    assert compile_routes(router.routes) == {}
+
+
+def test_dispatched_requests_match_router(monkeypatch):
+    dispatcher = app.router.middleware_stack
+    assert isinstance(dispatcher, AlpacaDispatcher)
+    requests = [
+        ("GET", "/api/v1/focuser/0/position"),
+        ("GET", "/api/v1/focuser/0/nonsense"),
+        ("GET", "/api/v1/focuser/x/position"),
+        ("PUT", "/api/v1/focuser/0/position"),
+        ("GET", "/api/v1/camera/7/name"),
+    ]
+
+    def responses():
+        results = []
+        for method, path in requests:
+            response = client.request(method, path, params={"ClientTransactionID": 5})
+            body = response.json()
+            if isinstance(body, dict):
+                body.pop("ServerTransactionID", None)
+            results.append((response.status_code, body))
+        return results
+
+    dispatched = responses()
+    monkeypatch.setattr(app.router, "middleware_stack", dispatcher.app)
+    assert dispatched == responses()
@@ -0,0 +1,49 @@
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from alpaca_simulators import sharding
+
+
+def test_parse_shards():
+    assert sharding.parse_shards("camera; Telescope,dome ,focuser;") == [
+        ["camera"],
+        ["telescope", "dome", "focuser"],
+    ]
+    with pytest.raises(ValueError):
+        sharding.parse_shards("camera;camera,dome")
+
+
+def test_router_forwards_owned_device_types(monkeypatch):
+    front = FastAPI()
+    shard = FastAPI()
+
+    @front.get("/api/v1/{device_type}/{device_number}/{member}")
+    def front_member(device_type: str):
+        return {"served_by": "front"}
+
+    @shard.api_route("/api/v1/{device_type}/{device_number}/{member}", methods=["GET", "PUT"])
+    async def shard_member(request: Request, member: str):
+        form = await request.form()
+        return {
+            "served_by": "shard",
+            "member": member,
+            "query": dict(request.query_params),
+            "form": dict(form),
+        }
+
+    monkeypatch.setattr(sharding, "_make_transport", lambda path: httpx.ASGITransport(shard))
+    client = TestClient(sharding.ShardRouter(front, {"camera": "camera.sock"}))
+
+    response = client.get("/api/v1/camera/0/camerastate", params={"ClientTransactionID": 3})
+    assert response.json() == {
+        "served_by": "shard",
+        "member": "camerastate",
+        "query": {"ClientTransactionID": "3"},
+        "form": {},
+    }
+    response = client.put("/api/v1/camera/0/gain", data={"Gain": "2"})
+    assert response.json()["form"] == {"Gain": "2"}
+
+    assert client.get("/api/v1/telescope/0/tracking").json() == {"served_by": "front"}
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from alpaca_simulators import state
+
+
+@pytest.fixture()
+def device_config(monkeypatch):
+    config = {
+        "devices": {
+            "camera": {0: {}, 1: {}},
+            "telescope": {0: {}, 1: {}},
+            "focuser": {0: {}},
+        },
+        "topology": {1: {"telescope": 1, "focuser": 3}},
+    }
+    monkeypatch.setattr(state, "DEVICE_CONFIG", config)
+    yield config
+    state.reset_state()
+
+
+def test_optical_train_defaults_to_device_zero(device_config):
+    assert state.get_optical_train(0) == {
+        "telescope": 0,
+        "focuser": 0,
+        "filterwheel": None,
+        "rotator": None,
+        "covercalibrator": None,
+    }
+
+
+def test_optical_train_from_topology(device_config):
+    device_config["topology"][1]["focuser"] = 0
+    train = state.get_optical_train(1)
+    assert train["telescope"] == 1
+    assert train["focuser"] == 0
+
+
+def test_topology_naming_unconfigured_device_fails_at_load(device_config):
+    with pytest.raises(ValueError, match="focuser 3"):
+        state.validate_config(device_config)
+    device_config["topology"][1]["focuser"] = 0
+    assert state.validate_config(device_config) is device_config
+    device_config["topology"][2] = {}
+    with pytest.raises(ValueError, match="camera 2"):
+        state.validate_config(device_config)
+
+
+def test_state_server_shares_state_between_workers(monkeypatch):
+    monkeypatch.setattr(state.os, "environ", dict(state.os.environ))
+    for name in ("_store", "_server_transaction_id", "_transaction_ids_end"):
+        monkeypatch.setattr(state, name, getattr(state, name))
+    server = state.start_state_server(background_updates=False)
+    try:
+        address = state.os.environ[state.STATE_SERVER_ENV]
+        authkey = bytes.fromhex(state.os.environ[state.STATE_AUTHKEY_ENV])
+        generations = state.os.environ[state.STATE_GENERATIONS_ENV]
+        first = state.RemoteStateStore(address, authkey, generations)
+        second = state.RemoteStateStore(address, authkey, generations)
+        assert state.uses_state_server()
+        # Each worker, including a restarted one, draws ids from blocks no other gets.
+        blocks = [first.reserve_transaction_ids(), second.reserve_transaction_ids()]
+        restarted = state.RemoteStateStore(address, authkey, generations)
+        blocks.append(restarted.reserve_transaction_ids())
+        starts = sorted(start for start, _ in blocks)
+        assert all(b - a >= state.TRANSACTION_ID_BLOCK for a, b in zip(starts, starts[1:]))
+
+        first.set_setting("sunlight", True)
+        assert second.get_setting("sunlight", False) is True
+
+        first.update("focuser", 0, {"position": 1234})
+        assert second.get("focuser", 0)["position"] == 1234
+        # Compare-and-set: an update expecting an outdated value is refused.
+        assert not second.update("focuser", 0, {"position": 1}, {"position": 1000})
+        assert first.get("focuser", 0)["position"] == 1234
+        # Reads of unchanged state are served from the worker's copy, without a round trip.
+        with monkeypatch.context() as patched:
+            patched.setattr(second, "_store", None)
+            assert second.get("focuser", 0)["position"] == 1234
+            assert second.get_setting("sunlight", False) is True
+        first.update("focuser", 0, {"position": 4321})
+        assert second.get("focuser", 0)["position"] == 4321
+
+        frame = np.ones((4, 4), dtype=np.uint16)
+        first.update("camera", 0, {"image_data": frame})
+        image = second.get("camera", 0)["image_data"]
+        assert np.array_equal(image, frame)
+        # The frame is only sent once; later reads reuse the worker's copy.
+        assert second.get("camera", 0)["image_data"] is image
+
+        second.reset()
+        assert first.get("focuser", 0)["position"] != 1234
+
+        # A reload by one worker reaches static values cached by another.
+        version = state._config_version
+        second.reset(reload_config=True)
+        first.check_config()
+        assert state._config_version == version + 1
+        assert first.get_setting("sunlight", False) is False
+    finally:
+        server.shutdown()
+
+
+def test_state_keys_cover_model_config_and_runtime_keys():
+    keys = state.state_keys("telescope")
+    assert {"tracking", "sitelatitude", "slew_target_ra"} <= keys
+    assert state.state_keys("custom") is None
+
+
+def test_unknown_config_key_fails_at_load():
+    config = {"devices": {"focuser": {0: {"positon": 10}}, "custom": {0: {"anything": 1}}}}
+    with pytest.raises(ValueError, match="positon"):
+        state.validate_config(config)
+    del config["devices"]["focuser"]
+    assert state.validate_config(config) is config
@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from alpaca_simulators import streaming
+from alpaca_simulators.state import remove_state_listener, update_device_state
+
+
+@pytest.fixture()
+def stream():
+    stream = streaming.StateStream()
+    yield stream
+    remove_state_listener(stream.record)
+
+
+def parse_event(chunk: bytes) -> tuple[str, dict]:
+    name, data = chunk.decode().strip().split("\n")
+    return name.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+def test_parse_topics():
+    assert streaming.parse_topics(["telescope/0", "dome/0/azimuth", "dome/0/slewing"]) == {
+        ("telescope", 0): None,
+        ("dome", 0): {"azimuth", "slewing"},
+    }
+    for topic in ("telescope", "telescope/x", "telescope/99"):
+        with pytest.raises(HTTPException):
+            streaming.parse_topics([topic])
+
+
+def test_changes_are_coalesced_per_tick(stream, monkeypatch):
+    monkeypatch.setattr(streaming, "TICK", 0.05)
+
+    async def follow():
+        events = stream.events(streaming.parse_topics(["dome/0/azimuth"]))
+        snapshot = parse_event(await anext(events))
+        for azimuth in (10.0, 20.0, 30.0):
+            update_device_state("dome", 0, {"azimuth": azimuth, "slewing": True})
+        update_device_state("focuser", 0, {"position": 5})
+        change = parse_event(await asyncio.wait_for(anext(events), 1))
+        await events.aclose()
+        return snapshot, change
+
+    snapshot, change = asyncio.run(follow())
+    assert snapshot[0] == "snapshot"
+    assert set(snapshot[1]["values"]) == {"azimuth"}
+    assert change == (
+        "state",
+        {"device_type": "dome", "device_number": 0, "values": {"azimuth": 30.0}},
+    )
+    assert not stream._subscriptions
+
+
+def test_heartbeat(stream, monkeypatch):
+    monkeypatch.setattr(streaming, "HEARTBEAT", 0.05)
+
+    async def follow():
+        events = stream.events(streaming.parse_topics(["rotator/0"]))
+        await anext(events)
+        event = parse_event(await asyncio.wait_for(anext(events), 1))
+        await events.aclose()
+        return event
+
+    assert asyncio.run(follow())[0] == "heartbeat"
@@ -0,0 +1,36 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from alpaca_simulators import tracing
+from alpaca_simulators.config import Config
+from alpaca_simulators.main import app
+from alpaca_simulators.state import get_device_state, reload_config
+
+client = TestClient(app)
+
+
+def test_exposure_phases_are_traced(tmp_path, monkeypatch):
+    trace_file = tmp_path / "spans.jsonl"
+    monkeypatch.setitem(Config().load(), "trace_file", str(trace_file))
+    try:
+        response = client.put(
+            "/api/v1/camera/0/startexposure", data={"Duration": 0.01, "Light": "false"}
+        )
+        assert response.json()["ErrorNumber"] == 0
+        assert get_device_state("camera", 0)["image_ready"]
+        assert client.get("/api/v1/camera/0/imagearray").status_code == 200
+    finally:
+        reload_config()
+
+    (exposure,) = client.get("/traces", params={"name": "exposure", "limit": 1}).json()
+    trace = client.get("/traces", params={"trace_id": exposure["trace_id"]}).json()
+    names = {entry["name"] for entry in trace}
+    assert {"exposure.wait", "render.queue", "render", "download"} <= names
+    render = next(entry for entry in trace if entry["name"] == "render")
+    assert render["tags"]["camera"] == 0 and render["tags"]["frame"] == "dark"
+    assert render["tags"]["bytes"] > 0
+
+    written = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert {entry["name"] for entry in written} == names
+    assert len(tracing.query_spans(device_number=99)) == 0